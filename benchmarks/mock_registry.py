@@ -0,0 +1,340 @@
+"""
+Local stand-in for the public registry site, for offline benchmarks.
+
+Serves a small single-page app with the same markup the processor relies
+on: the disclaimer button, the Name Search tab, the firstName / lastName /
+gender form, and either the "No results" panel or result cards. The form
+posts to a JSON endpoint that answers in the schema the HTTP backend accepts,
+so both backends can run against it (pass ``api_url`` for the http backend). Latency, errors and hangs are injected
+at configurable rates. With ``keep_results`` the previous search's panel or
+cards stay on the page until the next response has been rendered, as a
+warm Angular page can leave them.
+
+Usage:
+    python benchmarks/mock_registry.py --port 8765 --latency 0.2 --failure-rate 0.01
+    python benchmarks/mock_registry.py --keep-results --render-delay 0.05
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SEARCH_PATH = '/public/api/offenders/search'
+COUNTIES = ('Pulaski', 'Benton', 'Washington', 'Sebastian', 'Faulkner', 'Saline', 'Craighead', 'Garland')
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Registry (local stand-in)</title>
+<style>
+  body { font-family: sans-serif; margin: 20px; }
+  .disclaimer-text { height: 1600px; }
+  .hidden { display: none; }
+  .col-12 { border: 1px solid #ccc; padding: 8px; margin: 4px 0; }
+</style>
+</head>
+<body>
+<div id="disclaimer">
+  <h2>Disclaimer</h2>
+  <div class="disclaimer-text">Information on this site is provided for public safety. Read to the bottom.</div>
+  <button type="button" id="agree">I Agree to the Disclaimer Above</button>
+</div>
+<div id="app" class="hidden">
+  <ul class="tabs"><li><a href="#/" id="tab-name">Name Search</a></li><li><a href="#/">Map</a></li></ul>
+  <form id="name-form" class="hidden">
+    <input id="firstName" name="firstName">
+    <input id="lastName" name="lastName">
+    <select id="gender" name="gender">
+      <option value="">Any</option>
+      <option value="male">Male</option>
+      <option value="female">Female</option>
+      <option value="unknown">Unknown</option>
+    </select>
+    <button type="submit">Search</button>
+  </form>
+  <div id="results"></div>
+</div>
+<script>
+var KEEP_RESULTS = __KEEP_RESULTS__;
+var RENDER_DELAY_MS = __RENDER_DELAY_MS__;
+document.getElementById('agree').addEventListener('click', function () {
+  document.getElementById('disclaimer').remove();
+  document.getElementById('app').classList.remove('hidden');
+});
+document.getElementById('tab-name').addEventListener('click', function (event) {
+  event.preventDefault();
+  document.getElementById('name-form').classList.remove('hidden');
+});
+document.getElementById('name-form').addEventListener('submit', function (event) {
+  event.preventDefault();
+  var results = document.getElementById('results');
+  if (!KEEP_RESULTS) {
+    results.innerHTML = '';
+  }
+  fetch('__SEARCH_PATH__', {
+    method: 'POST',
+    headers: {'Content-Type': 'application/json'},
+    body: JSON.stringify({
+      firstName: document.getElementById('firstName').value,
+      lastName: document.getElementById('lastName').value,
+      gender: document.getElementById('gender').value
+    })
+  }).then(function (response) {
+    if (!response.ok) { throw new Error('HTTP ' + response.status); }
+    return response.json();
+  }).then(function (data) {
+    return new Promise(function (resolve) { setTimeout(resolve, RENDER_DELAY_MS, data); });
+  }).then(function (data) {
+    results.innerHTML = '';
+    if (!data.results.length) {
+      var empty = document.createElement('div');
+      empty.className = 'no-result';
+      empty.textContent = 'No results found';
+      results.appendChild(empty);
+      return;
+    }
+    data.results.forEach(function (registrant) {
+      var card = document.createElement('div');
+      card.className = 'col-12 col-md-auto text-center text-start-md';
+      var link = document.createElement('a');
+      link.href = registrant.url;
+      var name = document.createElement('h5');
+      name.textContent = registrant.firstName + ' ' + registrant.lastName;
+      link.appendChild(name);
+      card.appendChild(link);
+      var details = document.createElement('div');
+      details.textContent = 'Age: ' + registrant.age;
+      card.appendChild(details);
+      var county = document.createElement('div');
+      county.textContent = registrant.county + ' County';
+      card.appendChild(county);
+      results.appendChild(card);
+    });
+  }).catch(function () {
+    // Leave the results area empty, as the real site does on a failed request
+    // (with KEEP_RESULTS, the previous search's results stay in place)
+  });
+});
+</script>
+</body>
+</html>
+"""
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Allow many browsers or async lookups to connect at once
+    request_queue_size = 128
+
+
+class MockRegistry:
+    """
+    Threaded HTTP server imitating the registry SPA and its search endpoint.
+
+    A name is a registrant if it is in ``registrants`` or if its hash falls
+    under ``hit_rate``, so the same synthetic input always produces the same
+    results. Searches match registrants by name prefix, and a search with no
+    first name (a last-name search) can only find the listed ``registrants``.
+    Responses hold at most ``page_size`` registrants. Failures and hangs are
+    random, drawn per request.
+    """
+
+    def __init__(self, latency=0.05, jitter=0.02, failure_rate=0.0, hang_rate=0.0, hang_seconds=30.0,
+                 hit_rate=0.01, registrants=None, page_size=25, seed=None, port=0,
+                 keep_results=False, render_delay=0.0):
+        """
+        Configure the stand-in
+
+        Args:
+            latency: Mean seconds before each search response
+            jitter: Maximum seconds added to or removed from the latency
+            failure_rate: Share of searches answered with HTTP 500
+            hang_rate: Share of searches answered only after ``hang_seconds``
+            hang_seconds: Delay for hanging searches (beyond the processor's timeouts)
+            hit_rate: Share of names that match a registrant
+            registrants: Optional (first, last) pairs that always match
+            page_size: Most registrants in one response
+            seed: Seed for the failure and latency random draws
+            port: Port to listen on (0 = any free port)
+            keep_results: Leave the previous search's results on the page until
+                the next response is rendered, instead of clearing them on submit
+            render_delay: Seconds between a search response arriving and the
+                page rendering it
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.hit_rate = hit_rate
+        self.registrants = {(first.lower(), last.lower()) for first, last in (registrants or ())}
+        self.page_size = page_size
+        self.port = port
+        self.keep_results = keep_results
+        self.render_delay = render_delay
+        self.searches = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def registry_url(self):
+        """Value for RegistryProcessor(registry_url=...)"""
+        return f"{self.base_url}/public/#/"
+
+    @property
+    def api_url(self):
+        """Value for RegistryProcessor(api_url=...)"""
+        return f"{self.base_url}{SEARCH_PATH}"
+
+    def is_registrant(self, first_name, last_name):
+        first_name, last_name = first_name.strip().lower(), last_name.strip().lower()
+        if (first_name, last_name) in self.registrants:
+            return True
+        digest = zlib.crc32(f"{first_name}|{last_name}".encode('utf-8'))
+        return digest / 0xFFFFFFFF < self.hit_rate
+
+    def registrant_record(self, first_name, last_name):
+        """A registrant as the search endpoint returns it, with a stable age, county and link"""
+        digest = zlib.crc32(f"{last_name}|{first_name}".encode('utf-8'))
+        return {
+            'id': digest,
+            'firstName': first_name.upper(),
+            'lastName': last_name.upper(),
+            'age': 18 + digest % 60,
+            'county': COUNTIES[digest % len(COUNTIES)],
+            'url': f"{self.base_url}/public/#/offender/{digest}",
+        }
+
+    def _plan(self):
+        """Draw this request's delay and failure mode"""
+        with self._lock:
+            self.searches += 1
+            draw = self._random.random()
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+        if draw < self.hang_rate:
+            return self.hang_seconds, False
+        return delay, draw < self.hang_rate + self.failure_rate
+
+    def search(self, payload):
+        """
+        Answer one search request
+
+        Returns:
+            tuple: (HTTP status, response body dict or None)
+        """
+        delay, fail = self._plan()
+        time.sleep(delay)
+        if fail:
+            return 500, None
+        first_name = str(payload.get('firstName', '')).strip()
+        last_name = str(payload.get('lastName', '')).strip()
+        found = {
+            (first, last) for first, last in self.registrants
+            if first.startswith(first_name.lower()) and last.startswith(last_name.lower())
+        }
+        if first_name and self.is_registrant(first_name, last_name):
+            found.add((first_name.lower(), last_name.lower()))
+        results = [self.registrant_record(first, last) for first, last in sorted(found)]
+        total_pages = max(1, -(-len(results) // self.page_size))
+        return 200, {'total': len(results), 'totalPages': total_pages, 'results': results[:self.page_size]}
+
+    def _handler(self):
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out as separate writes; don't let Nagle hold the body back
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body=b'', content_type='application/json'):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.split('#')[0].rstrip('/') in ('', '/public'):
+                    page = (PAGE.replace('__SEARCH_PATH__', SEARCH_PATH)
+                            .replace('__KEEP_RESULTS__', 'true' if registry.keep_results else 'false')
+                            .replace('__RENDER_DELAY_MS__', str(int(registry.render_delay * 1000))))
+                    page = page.encode('utf-8')
+                    self._send(200, page, 'text/html; charset=utf-8')
+                else:
+                    self._send(404)
+
+            def do_POST(self):
+                if self.path != SEARCH_PATH:
+                    self._send(404)
+                    return
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    self._send(400)
+                    return
+                status, body = registry.search(payload)
+                self._send(status, json.dumps(body).encode('utf-8') if body is not None else b'')
+
+        return Handler
+
+    def start(self):
+        """Start serving in a background thread and return the base URL"""
+        self._server = _Server(('127.0.0.1', self.port), self._handler())
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a local stand-in of the registry site.")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help="Mean search latency in seconds")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="Share of searches failing with HTTP 500")
+    parser.add_argument('--hang-rate', type=float, default=0.0, help="Share of searches that hang")
+    parser.add_argument('--hit-rate', type=float, default=0.01, help="Share of names that are registrants")
+    parser.add_argument('--keep-results', action='store_true',
+                        help="Keep the previous search's results on the page until the next one is rendered")
+    parser.add_argument('--render-delay', type=float, default=0.0,
+                        help="Seconds between a search response arriving and the page rendering it")
+    args = parser.parse_args(argv)
+
+    registry = MockRegistry(latency=args.latency, failure_rate=args.failure_rate, hang_rate=args.hang_rate,
+                            hit_rate=args.hit_rate, port=args.port, keep_results=args.keep_results,
+                            render_delay=args.render_delay)
+    registry.start()
+    print(f"Registry page: {registry.registry_url}")
+    print(f"Search API:    {registry.api_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        registry.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Offline benchmarks for RegistryProcessor.
+
+Starts the local registry stand-in, writes synthetic input workbooks and
+runs process_file against them, reporting throughput, search latency
+percentiles and peak memory per input size. Nothing touches the live site.
+
+Usage:
+    python benchmarks/run_benchmarks.py                       # 100 and 1,000 rows, Chrome
+    python benchmarks/run_benchmarks.py --sizes 100 1000 10000 --backend http --workers 4 --fixed-rate
+    python benchmarks/run_benchmarks.py --latency 0.2 --failure-rate 0.02 --json results.json
+    python benchmarks/run_benchmarks.py --backend http --snapshot      # only snapshot candidates are searched
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import openpyxl
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.mock_registry import MockRegistry
+from gui.input_reader import read_names
+from gui.registry_processor import RegistryProcessor
+from gui.registry_snapshot import RegistrySnapshot
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+DEFAULT_SIZES = (100, 1000)
+FIRST_NAMES = ('James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'William',
+               'Elizabeth', 'David', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah')
+LAST_NAMES = ('Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez',
+              'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore')
+GENDERS = ('male', 'female', 'unknown')
+
+
+def write_workbook(path, rows, seed=0):
+    """
+    Write a synthetic input workbook in the original intake layout
+
+    Names are drawn from common first and last names plus a numeric suffix.
+    About one row in ten repeats an earlier row, exercising dedup, and about
+    three in ten reuse an earlier row's last name, as families do.
+    """
+    rng = random.Random(seed)
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Names')
+    sheet.append(['Intake export'])
+    sheet.append([])
+    sheet.append(['Id', 'First Name', 'Middle', 'Last Name', 'DOB', 'County', 'Gender'])
+    written = []
+    for row in range(rows):
+        draw = rng.random()
+        if written and draw < 0.1:
+            name = rng.choice(written)
+        elif written and draw < 0.4:
+            name = (rng.choice(FIRST_NAMES), rng.choice(written)[1], rng.choice(GENDERS))
+            written.append(name)
+        else:
+            name = (rng.choice(FIRST_NAMES), f"{rng.choice(LAST_NAMES)}{rng.randrange(rows)}", rng.choice(GENDERS))
+            written.append(name)
+        first_name, last_name, gender = name
+        sheet.append([row + 1, first_name, '', last_name, '', '', gender])
+    workbook.save(path)
+
+
+def input_registrants(registry, input_path):
+    """The (first, last) names in an input file that the stand-in treats as registrants"""
+    df = read_names(input_path)
+    return {
+        (first_name.lower(), last_name.lower())
+        for first_name, last_name in zip(df['First Name'], df['Last Name'])
+        if registry.is_registrant(first_name, last_name)
+    }
+
+
+def write_snapshot(registry, snapshot_path, decoys=50000):
+    """
+    Save a registrant snapshot matching the stand-in's registrants
+
+    Holds every listed registrant plus random decoy names, so the index is
+    of a realistic size.
+    """
+    pairs = list(registry.registrants)
+    rng = random.Random(decoys)
+    pairs.extend((rng.choice(FIRST_NAMES), f"Decoy{number}") for number in range(decoys))
+    RegistrySnapshot(pairs, source='benchmark fixture').save(snapshot_path)
+
+
+class PeakMemory:
+    """
+    Samples the resident memory of this process and its children (browsers).
+
+    Uses psutil when installed. Without it, falls back to the OS high-water
+    mark for this process alone, which does not include Chrome.
+    """
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        root = psutil.Process()
+        total = 0
+        for process in [root] + root.children(recursive=True):
+            try:
+                total += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        self.peak_bytes = max(self.peak_bytes, total)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        if HAS_PSUTIL:
+            self._sample()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+        else:
+            self.peak_bytes = _max_rss_bytes()
+
+    @property
+    def peak_mb(self):
+        return self.peak_bytes / (1024 * 1024)
+
+
+def _max_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_case(registry, rows, args, work_dir):
+    """
+    Benchmark process_file on one synthetic input
+
+    Returns:
+        dict: Measurements for the report
+    """
+    input_path = os.path.join(work_dir, f"input_{rows}.xlsx")
+    output_path = os.path.join(work_dir, f"output_{rows}.xlsx")
+    write_workbook(input_path, rows, seed=rows)
+    # List this input's registrants, so last-name searches and snapshots can find them
+    registry.registrants.update(input_registrants(registry, input_path))
+    snapshot_options = {}
+    if args.snapshot:
+        snapshot_path = os.path.join(work_dir, f"snapshot_{rows}.json")
+        write_snapshot(registry, snapshot_path)
+        snapshot_options = dict(use_snapshot=True, snapshot_path=snapshot_path)
+
+    processor = RegistryProcessor(
+        status_callback=None,
+        workers=args.workers,
+        rate_limit=args.rate_limit,
+        adaptive_rate=not args.fixed_rate,
+        backend=args.backend,
+        api_url=registry.api_url,
+        registry_url=registry.registry_url,
+        use_cache=False,
+        journal_dir=os.path.join(work_dir, 'journals'),
+        coalesce=args.coalesce,
+        **snapshot_options
+    )
+    with PeakMemory() as memory, contextlib.redirect_stdout(sys.stdout if args.verbose else io.StringIO()):
+        success = processor.process_file(input_path, output_path)
+
+    summary = processor.metrics.summary()
+    search = summary['stages'].get('search', {})
+    return {
+        'rows': rows,
+        'success': success,
+        'names_processed': summary['names_processed'],
+        'searches': summary['searches'],
+        'elapsed_seconds': round(summary['elapsed_seconds'], 2),
+        'names_per_second': round(summary['names_per_second'], 2),
+        'search_p50': round(search.get('p50', 0.0), 4),
+        'search_p95': round(search.get('p95', 0.0), 4),
+        'search_p99': round(search.get('p99', 0.0), 4),
+        'error_rate': round(summary['error_rate'], 4),
+        'peak_rss_mb': round(memory.peak_mb, 1),
+    }
+
+
+def format_report(results):
+    columns = ('rows', 'names_processed', 'searches', 'elapsed_seconds', 'names_per_second',
+               'search_p50', 'search_p95', 'search_p99', 'error_rate', 'peak_rss_mb')
+    widths = {column: max(len(column), *(len(str(result[column])) for result in results)) for column in columns}
+    lines = ["  ".join(column.rjust(widths[column]) for column in columns)]
+    for result in results:
+        lines.append("  ".join(str(result[column]).rjust(widths[column]) for column in columns))
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark RegistryProcessor against a local registry stand-in.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Input rows per case")
+    parser.add_argument('--backend', choices=RegistryProcessor.BACKENDS, default='selenium')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    parser.add_argument('--fixed-rate', action='store_true',
+                        help="Turn off adaptive pacing (with no --rate-limit, searches are unpaced)")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mean site latency in seconds")
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--hang-rate', type=float, default=0.0)
+    parser.add_argument('--hit-rate', type=float, default=0.01)
+    parser.add_argument('--keep-results', action='store_true',
+                        help="Leave each search's results on the page until the next response is rendered")
+    parser.add_argument('--render-delay', type=float, default=0.0,
+                        help="Seconds the page takes to render a search response")
+    parser.add_argument('--snapshot', action='store_true',
+                        help="Pre-screen against a registrant snapshot built from the stand-in's registrants")
+    parser.add_argument('--coalesce', action='store_true',
+                        help="Answer rows sharing a last name from one last-name search (http backend)")
+    parser.add_argument('--json', default=None, help="Also write the results to this JSON file")
+    parser.add_argument('--keep', action='store_true', help="Keep the generated inputs and outputs")
+    parser.add_argument('--verbose', action='store_true', help="Show the processor's status messages")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    work_dir = tempfile.mkdtemp(prefix='registry_bench_')
+    results = []
+    try:
+        with MockRegistry(latency=args.latency, failure_rate=args.failure_rate, hang_rate=args.hang_rate,
+                          hit_rate=args.hit_rate, seed=0, keep_results=args.keep_results,
+                          render_delay=args.render_delay) as registry:
+            for rows in args.sizes:
+                started = time.perf_counter()
+                results.append(run_case(registry, rows, args, work_dir))
+                print(f"{rows} rows done in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    finally:
+        if args.keep:
+            print(f"Benchmark files kept in {work_dir}", file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(format_report(results))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'backend': args.backend, 'workers': args.workers, 'latency': args.latency,
+                       'failure_rate': args.failure_rate, 'results': results}, f, indent=2)
+    return 0 if all(result['success'] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
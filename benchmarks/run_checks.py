@@ -0,0 +1,213 @@
+"""
+Offline regression checks for RegistryProcessor.
+
+Runs small end-to-end scenarios against the local registry stand-in and
+fails loudly if a result is wrong. Nothing touches the live site.
+
+Usage:
+    python benchmarks/run_checks.py
+    python benchmarks/run_checks.py --verbose     # show the processor's status messages
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.mock_registry import MockRegistry
+from gui.query_planner import match_row
+from gui.registry_processor import RegistryProcessor
+from gui.names import name_key
+from gui.registry_snapshot import RegistrySnapshot, registrant_pairs
+from gui.search_backends import NO_RESULTS, WARNING
+
+
+def snapshot_pairs(registrants, decoys=1000):
+    """Registrant (first, last) pairs padded with decoy names to a realistic list"""
+    return list(registrants) + [(f"Decoy{number}", f"Decoy{number}") for number in range(decoys)]
+
+
+def write_registrant_list(path, records, decoys=1000):
+    """Write a JSON registrant list fixture: the given records plus decoy registrants"""
+    records = list(records) + [{'firstName': f"DECOY{number}", 'lastName': f"DECOY{number}"}
+                               for number in range(decoys)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'results': records}, f)
+
+
+def expect_error(action, message):
+    """Run action and return the ValueError it raises; fail if it raises none"""
+    try:
+        action()
+    except ValueError as e:
+        return e
+    raise AssertionError(message)
+
+
+def write_names(path, names):
+    """Write (first, last, gender) rows as a headed CSV input file"""
+    pd.DataFrame(names, columns=['First Name', 'Last Name', 'Gender']).to_csv(path, index=False)
+
+
+def run_processor(registry, work_dir, names, verbose=False, **options):
+    """
+    Run process_file on the names against the stand-in
+
+    Returns:
+        tuple: (processor, output rows as a DataFrame, or None if the run failed)
+    """
+    input_path = os.path.join(work_dir, 'input.csv')
+    output_path = os.path.join(work_dir, 'output.csv')
+    write_names(input_path, names)
+    options.setdefault('backend', 'http')
+    options.setdefault('use_cache', False)
+    options.setdefault('journal_dir', os.path.join(work_dir, 'journals'))
+    processor = RegistryProcessor(api_url=registry.api_url, registry_url=registry.registry_url,
+                                  adaptive_rate=False, retry_delay=0.01, **options)
+    with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+        success = processor.process_file(input_path, output_path)
+    output = pd.read_csv(output_path, keep_default_na=False) if success else None
+    return processor, output
+
+
+def check_parallel_search_on_filtered_rows(registry, work_dir, verbose):
+    """Parallel workers search only the rows left after dedup, in input order"""
+    names = [(f"Pat{number}", f"Parallel{number}", 'male') for number in range(14)]
+    names.insert(5, names[2])
+    _, output = run_processor(registry, work_dir, names, verbose, workers=3)
+    assert output is not None, "run failed"
+    assert len(output) == len(names), f"{len(output)} of {len(names)} rows written"
+    assert list(output['Last Name']) == [last_name for _, last_name, _ in names], "rows out of input order"
+    assert output.loc[5, 'Source'] == 'duplicate', output.loc[5, 'Source']
+
+
+def check_snapshot_keeps_punctuated_names(registry, work_dir, verbose):
+    """A registrant listed with punctuation is a candidate for the cleaned input spelling"""
+    snapshot = RegistrySnapshot(snapshot_pairs([('John', 'St. John'), ('J.R.', 'Ewing'), ('Mary-Ann', "O’Brien")]))
+    for first_name, last_name in (('John', 'St John'), ('J R', 'Ewing'), ('Mary-Ann', "O'Brien"), ('John', 'St. John')):
+        assert snapshot.is_candidate(first_name, last_name), f"{first_name} {last_name} cleared"
+
+    snapshot_path = os.path.join(work_dir, 'snapshot.json')
+    snapshot.save(snapshot_path)
+    names = [('John', 'St. John', 'male'), ('J.R.', 'Ewing', 'male'), ('Nobody', 'Listed', 'female')]
+    _, output = run_processor(registry, work_dir, names, verbose, use_snapshot=True, snapshot_path=snapshot_path)
+    assert output is not None, "run failed"
+    assert list(output['Source']) == ['search', 'search', 'snapshot'], list(output['Source'])
+
+
+def check_group_match_ignores_punctuation(registry, work_dir, verbose):
+    """Last-name grouping matches a registrant whose name is punctuated differently"""
+    registrants = [{'firstName': 'J.R.', 'lastName': 'EWING', 'gender': 'M'}]
+    assert match_row(registrants, 'J R', 'male') == WARNING
+    assert match_row(registrants, 'Bobby', 'male') == NO_RESULTS
+
+
+def check_snapshot_fixture_screening(registry, work_dir, verbose):
+    """is_candidate and _prescreen on an imported fixture list clear only names no registrant matches"""
+    list_path = os.path.join(work_dir, 'registrants.json')
+    snapshot_path = os.path.join(work_dir, 'snapshot.json')
+    write_registrant_list(list_path, [
+        {'firstName': 'JOHN', 'lastName': 'SMITH'},
+        {'lastName': 'NGUYEN'},
+        {'firstName': 'MARY', 'lastName': 'ST. JOHN'},
+    ])
+    snapshot = RegistrySnapshot.import_file(list_path, snapshot_path)
+    expected = {
+        ('John', 'Smith'): True,
+        ('Jo', 'Smi'): True,           # prefixes, as the live search matches
+        ('Jane', 'Smith'): False,
+        ('Anyone', 'Nguyen'): True,    # registrant listed without a first name
+        ('Mary', 'St John'): True,
+        ('Zed', 'Unlisted'): False,
+    }
+    for (first_name, last_name), candidate in expected.items():
+        assert snapshot.is_candidate(first_name, last_name) == candidate, f"{first_name} {last_name}"
+
+    processor = RegistryProcessor(use_snapshot=True, snapshot_path=snapshot_path, use_cache=False)
+    tasks = [(idx, first_name, last_name, 'unknown') for idx, (first_name, last_name) in enumerate(expected)]
+    keys = [name_key(first_name, last_name, gender) for _, first_name, last_name, gender in tasks]
+    with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+        cleared = processor._prescreen(tasks, keys)
+    assert set(cleared) == {keys[idx] for idx, candidate in enumerate(expected.values()) if not candidate}, cleared
+
+
+def check_snapshot_refuses_bad_lists(registry, work_dir, verbose):
+    """Lists without usable last names, or too small to be complete, never clear names"""
+    snapshot_path = os.path.join(work_dir, 'snapshot.json')
+    RegistrySnapshot(snapshot_pairs([('John', 'Smith')])).save(snapshot_path)
+    saved = os.path.getmtime(snapshot_path)
+
+    list_path = os.path.join(work_dir, 'full_names.json')
+    with open(list_path, 'w', encoding='utf-8') as f:
+        json.dump([{'name': 'JOHN SMITH'}, {'name': 'MARY JONES'}], f)
+    expect_error(lambda: RegistrySnapshot.import_file(list_path, snapshot_path), "full-name-only list imported")
+    rows = list(csv.DictReader(io.StringIO("Offender,County\nJOHN SMITH,Pulaski\n")))
+    expect_error(lambda: registrant_pairs(rows), "CSV without name columns accepted")
+    write_registrant_list(list_path, [{'firstName': 'JOHN', 'lastName': 'SMITH'}], decoys=10)
+    error = expect_error(lambda: RegistrySnapshot.import_file(list_path, snapshot_path), "11-registrant list imported")
+    assert 'holds only 11 registrants' in str(error), error
+    assert os.path.getmtime(snapshot_path) == saved, "saved snapshot overwritten by a refused import"
+
+    # A tiny snapshot already on disk is not used either
+    RegistrySnapshot([('John', 'Smith')]).save(snapshot_path)
+    processor = RegistryProcessor(use_snapshot=True, snapshot_path=snapshot_path, use_cache=False)
+    tasks = [(0, 'Zed', 'Unlisted', 'unknown')]
+    with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+        cleared = processor._prescreen(tasks, [name_key('Zed', 'Unlisted', 'unknown')])
+    assert not cleared, cleared
+
+
+def check_suffixes_reach_the_output(registry, work_dir, verbose):
+    """Suffixes are split off for the search but written out, so rows match the intake"""
+    names = [('John', 'Smith Jr', 'male'), ('John', 'Smith Sr', 'male'), ('Calvin', 'Tackett II', 'male')]
+    _, output = run_processor(registry, work_dir, names, verbose)
+    assert output is not None, "run failed"
+    assert list(output['Last Name']) == ['Smith', 'Smith', 'Tackett'], list(output['Last Name'])
+    assert list(output['Suffix']) == ['Jr', 'Sr', 'II'], list(output['Suffix'])
+    # The registry ignores suffixes, so both Smiths are one search
+    assert list(output['Source']) == ['search', 'duplicate', 'search'], list(output['Source'])
+
+
+CHECKS = (
+    check_parallel_search_on_filtered_rows,
+    check_snapshot_keeps_punctuated_names,
+    check_group_match_ignores_punctuation,
+    check_snapshot_fixture_screening,
+    check_snapshot_refuses_bad_lists,
+    check_suffixes_reach_the_output,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run offline regression checks against a local registry stand-in.")
+    parser.add_argument('--verbose', action='store_true', help="Show the processor's status messages")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    with MockRegistry(latency=0.005, jitter=0.0, hit_rate=0.0, seed=0) as registry:
+        for check in CHECKS:
+            work_dir = tempfile.mkdtemp(prefix='registry_check_')
+            try:
+                check(registry, work_dir, args.verbose)
+                print(f"PASS  {check.__name__}")
+            except Exception:
+                failures += 1
+                print(f"FAIL  {check.__name__}")
+                traceback.print_exc()
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+    print(f"{len(CHECKS) - failures} of {len(CHECKS)} checks passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
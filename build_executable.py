@@ -79,7 +79,15 @@ a = Analysis(
         'selenium.webdriver.support.expected_conditions',
         'selenium.common.exceptions',
         'openpyxl',
+        'xlrd',
+        'odf.opendocument',
+        'odf.table',
+        'odf.text',
+        'odf.namespaces',
+        'odf.office',
+        'odf.element',
         'pandas',
+        'psutil',
         'tkinter',
         'tkinter.ttk',
         'tkinter.filedialog',
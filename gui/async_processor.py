@@ -0,0 +1,278 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+from gui.registry_processor import RegistryProcessor
+from gui.retry_queue import RetryQueue
+from gui.search_backends import TIMEOUT, UNKNOWN_ERROR, HttpSearchBackend, search_outcome
+
+
+class AsyncHttpSearchBackend:
+    """
+    Asynchronous counterpart of HttpSearchBackend.
+
+    With aiohttp installed, every lookup is a coroutine on one pooled
+    ClientSession. Without it, the blocking requests backend runs on a
+    small thread pool sized to the concurrency limit.
+    """
+
+    name = 'http'
+
+    def __init__(self, api_url, concurrency, timeout=15, status_callback=None):
+        """
+        Initialize the backend
+
+        Args:
+            api_url: URL of the name search endpoint
+            concurrency: Most lookups in flight at once
+            timeout: Seconds to wait for a response before reporting a timeout
+            status_callback: Function to call with status messages
+        """
+        self.api_url = api_url
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.status_callback = status_callback
+        self.session = None
+        self._fallback = None
+        self._executor = None
+
+    async def setup(self):
+        if HAS_AIOHTTP:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'Accept': 'application/json', 'Content-Type': 'application/json'},
+            )
+        else:
+            self._fallback = HttpSearchBackend(self.api_url, timeout=self.timeout,
+                                               status_callback=self.status_callback,
+                                               pool_size=self.concurrency)
+            self._fallback.setup()
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        return True
+
+    async def search(self, first_name, last_name, gender):
+        """
+        Search a single name in the registry
+
+        Returns:
+            str: 'no results found', 'warning', or error message
+        """
+        if self._fallback:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._fallback.search, first_name, last_name, gender)
+
+        payload = {'firstName': first_name, 'lastName': last_name, 'gender': gender}
+        try:
+            async with self.session.post(self.api_url, json=payload) as response:
+                if response.status != 200:
+                    return f'Error: HTTP {response.status}'
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    return UNKNOWN_ERROR
+        except asyncio.TimeoutError:
+            return TIMEOUT
+        except Exception as e:
+            return f'Error: {str(e)}'
+
+        return HttpSearchBackend.classify_response(data)
+
+    async def cleanup(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._fallback:
+            self._fallback.cleanup()
+            self._fallback = None
+
+
+class AsyncRegistryProcessor(RegistryProcessor):
+    """
+    RegistryProcessor that keeps many HTTP lookups in flight on one event loop.
+
+    Reading, dedup, the result cache, the journal and the output writer are
+    inherited unchanged; only the search stage differs. Lookups are started
+    as coroutines, bounded by a semaphore and paced by the shared rate
+    limiter, so hundreds of concurrent searches need no extra threads.
+    The loop runs on the thread that calls process_file(), which is driven
+    one result at a time as rows are written in input order.
+    """
+
+    def __init__(self, progress_callback=None, status_callback=None, concurrency=16, dispatch=None, **kwargs):
+        """
+        Initialize the async processor
+
+        Args:
+            progress_callback: Function to call with progress updates
+                (current, total, name, rate)
+            status_callback: Function to call with status messages
+            concurrency: Most lookups in flight at once
+            dispatch: Optional function(callback, *args) used to deliver callbacks
+                on another thread, e.g. ``lambda f, *a: root.after(0, f, *a)`` for Tk
+            **kwargs: Any other RegistryProcessor option; backend must be 'http'
+        """
+        kwargs.setdefault('backend', 'http')
+        if kwargs['backend'] != 'http':
+            raise ValueError("The async engine only supports the 'http' backend")
+        super().__init__(progress_callback=progress_callback, status_callback=status_callback, **kwargs)
+        self.concurrency = max(1, int(concurrency))
+        self.dispatch = dispatch
+        if kwargs.get('adaptive_rate', True) and not kwargs.get('rate_limit'):
+            # Start from one search per second per slot, as the pool does per worker
+            self.rate_limiter.rate = float(self.concurrency)
+        self._loop = None
+        self._async_backend = None
+        self._in_flight = set()
+
+    @property
+    def group_search_threads(self):
+        return self.concurrency
+
+    def _log_status(self, message):
+        if self.status_callback:
+            if self.dispatch:
+                self.dispatch(self.status_callback, message)
+            else:
+                self.status_callback(message)
+        print(message)
+
+    def _update_progress(self, current, total, name=""):
+        if self.progress_callback:
+            rate = self.rate_limiter.current_rate
+            if self.dispatch:
+                self.dispatch(self.progress_callback, current, total, name, rate)
+            else:
+                self.progress_callback(current, total, name, rate)
+
+    def _report_result(self, idx, result, source):
+        if self.result_callback:
+            if self.dispatch:
+                self.dispatch(self.result_callback, idx, str(result), source)
+            else:
+                self.result_callback(idx, str(result), source)
+
+    def _search(self, tasks, total_names):
+        if not tasks:
+            return super()._search(tasks, total_names)
+
+        self._loop = asyncio.new_event_loop()
+        self._async_backend = AsyncHttpSearchBackend(self.api_url, self.concurrency,
+                                                     status_callback=self.status_callback)
+        if not self._loop.run_until_complete(self._async_backend.setup()):
+            return None
+        if not HAS_AIOHTTP:
+            self._log_status("aiohttp is not installed; running lookups on a thread pool instead")
+
+        self.retry_queue = RetryQueue(max_attempts=self.max_attempts, base_delay=self.retry_delay)
+        self._log_status(f"Starting to search {len(tasks)} names with up to {self.concurrency} lookups in flight...")
+        return self._search_concurrent(tasks, total_names)
+
+    def _search_concurrent(self, tasks, total_names):
+        """
+        Run every lookup on the event loop and hand results back in task order
+
+        Yields:
+            (index, result) tuples in task order, stopping at the first task
+            that did not finish (stop requested)
+        """
+        loop = self._loop
+        futures = {task[0]: loop.create_future() for task in tasks}
+        dispatcher = loop.create_task(self._dispatch(tasks, futures))
+
+        try:
+            for idx, first_name, last_name, _ in tasks:
+                future = futures[idx]
+                if not future.done():
+                    # Let lookups run until this row's result (or the end of the run) arrives
+                    loop.run_until_complete(asyncio.wait({future, dispatcher}, return_when=asyncio.FIRST_COMPLETED))
+                if not future.done():
+                    break
+                self._update_progress(idx + 1, total_names, f"{first_name} {last_name}")
+                yield idx, future.result()
+        finally:
+            if not dispatcher.done():
+                dispatcher.cancel()
+                for task in list(self._in_flight):
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(dispatcher, *self._in_flight, return_exceptions=True))
+
+    async def _dispatch(self, tasks, futures):
+        """Start a lookup per task, never more than ``concurrency`` at once"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        for task in tasks:
+            await semaphore.acquire()
+            if self.should_stop:
+                semaphore.release()
+                break
+            lookup = asyncio.ensure_future(self._lookup(task, futures[task[0]], semaphore))
+            self._in_flight.add(lookup)
+            lookup.add_done_callback(self._in_flight.discard)
+        if self._in_flight:
+            await asyncio.gather(*list(self._in_flight), return_exceptions=True)
+
+    async def _lookup(self, task, future, semaphore):
+        """Search one name, retrying transient failures; holds a semaphore slot while active"""
+        idx, first_name, last_name, gender = task
+        attempt = 1
+        holding_slot = True
+        try:
+            while True:
+                if not await self.rate_limiter.acquire_async(lambda: self.should_stop):
+                    return
+                started = time.perf_counter()
+                result = await self._async_backend.search(first_name, last_name, gender)
+                elapsed, outcome = time.perf_counter() - started, search_outcome(result)
+                self.rate_limiter.record(elapsed, outcome)
+                self.metrics.record_search(elapsed, outcome)
+                if not self.retry_queue.should_retry(result, attempt):
+                    break
+                # Give the slot to other names while waiting to retry
+                semaphore.release()
+                holding_slot = False
+                await asyncio.sleep(self.retry_queue.delay(attempt))
+                await semaphore.acquire()
+                holding_slot = True
+                attempt += 1
+            future.set_result(result)
+        except Exception as e:
+            # Record unexpected failures as the row's result; raising them from
+            # the future would abort the whole run
+            future.set_result(f'Error: {str(e)}')
+        finally:
+            if holding_slot:
+                semaphore.release()
+
+    def stop_processing(self):
+        """Stop the processing and cancel lookups in flight (safe from any thread)"""
+        super().stop_processing()
+        loop = self._loop
+        if loop and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._cancel_in_flight)
+            except RuntimeError:
+                # Loop closed in the meantime
+                pass
+
+    def _cancel_in_flight(self):
+        for task in list(self._in_flight):
+            task.cancel()
+
+    def cleanup(self):
+        """Clean up resources, including the event loop"""
+        loop, self._loop = self._loop, None
+        backend, self._async_backend = self._async_backend, None
+        if loop and not loop.is_closed():
+            if backend:
+                loop.run_until_complete(backend.cleanup())
+            loop.close()
+        super().cleanup()
@@ -0,0 +1,292 @@
+"""
+Sharded batch mode for very large inputs.
+
+The input is split into fixed-size shards that a pool of processes works
+through, each with its own RegistryProcessor (and so its own browser or
+HTTP session) writing a partial CSV. Once every shard is done the partial
+files are merged back into one output in input order.
+
+Usage:
+    python -m gui.batch names.xlsx results.xlsx --processes 8 --shard-size 2000 --rate-limit 4
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gui.input_reader import NAME_COLUMNS
+from gui.registry_processor import RegistryProcessor
+from gui.result_writer import create_result_writer
+from gui.run_journal import file_hash
+
+DEFAULT_SHARD_SIZE = 1000
+
+
+def shard_paths(work_dir, shard_no):
+    """Input, partial output and completion marker paths for one shard"""
+    base = os.path.join(work_dir, f"shard-{shard_no:05d}")
+    return f"{base}-input.csv", f"{base}-results.csv", f"{base}.done"
+
+
+def _process_shard(shard_no, input_path, part_path, done_path, options):
+    """
+    Search one shard in a pool process
+
+    Returns:
+        tuple: (shard number, names processed, names in shard)
+    """
+    processor = RegistryProcessor(**options)
+    processor.process_file(input_path, part_path)
+    processed = processor.run_summary.get('Names processed', 0)
+    total = processor.run_summary.get('Names in file', 0)
+    if total and processed == total:
+        with open(done_path, 'w', encoding='utf-8') as f:
+            f.write(file_hash(input_path))
+    return shard_no, processed, total
+
+
+def shard_done(work_dir, shard_no):
+    """Return True if a shard's results are complete for its current input"""
+    input_path, _, done_path = shard_paths(work_dir, shard_no)
+    try:
+        with open(done_path, 'r', encoding='utf-8') as f:
+            return f.read().strip() == file_hash(input_path)
+    except OSError:
+        return False
+
+
+def _read_summary(part_path):
+    base, ext = os.path.splitext(part_path)
+    summary = {}
+    path = f"{base}_summary{ext}"
+    if not os.path.exists(path):
+        return summary
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            try:
+                summary[row['Metric']] = int(row['Value'])
+            except (TypeError, ValueError):
+                continue
+    return summary
+
+
+class BatchRunner:
+    """
+    Splits an input file into shards and searches them across processes.
+
+    Shards are written to a work directory next to the output. A shard that
+    finished in an earlier run is not searched again, so an interrupted
+    batch can be restarted with the same arguments.
+    """
+
+    def __init__(self, processes=None, shard_size=DEFAULT_SHARD_SIZE, rate_limit=None, work_dir=None,
+                 keep_shards=False, column_mapping=None, status_callback=None, **processor_options):
+        """
+        Initialize the batch runner
+
+        Args:
+            processes: Number of shard processes (defaults to the core count)
+            shard_size: Names per shard
+            rate_limit: Maximum searches per second across all processes (None = unlimited);
+                each process gets an equal share
+            work_dir: Directory for shard inputs and partial results
+                (defaults to '<output>_shards')
+            keep_shards: Keep the work directory after a successful merge
+            column_mapping: ColumnMapping, dict or JSON path for the input file
+            status_callback: Function to call with status messages
+            **processor_options: Further RegistryProcessor options for every shard
+                (backend, workers, use_cache, resume, ...)
+        """
+        if processor_options.get('backend') == 'http' and not processor_options.get('api_url'):
+            raise ValueError("The http backend needs the registry's search API URL (api_url)")
+        self.processes = max(1, int(processes or os.cpu_count() or 1))
+        self.shard_size = max(1, int(shard_size))
+        self.rate_limit = rate_limit
+        self.work_dir = work_dir
+        self.keep_shards = keep_shards
+        self.column_mapping = column_mapping
+        self.status_callback = status_callback
+        self.processor_options = processor_options
+
+    def _log_status(self, message):
+        if self.status_callback:
+            self.status_callback(message)
+        print(message)
+
+    def _shard_options(self):
+        """RegistryProcessor options for each shard process"""
+        options = dict(self.processor_options)
+        if self.rate_limit:
+            options['rate_limit'] = self.rate_limit / self.processes
+        return options
+
+    def split(self, df, work_dir):
+        """
+        Write the input names out as shard files
+
+        Returns:
+            list: shard numbers, in input order
+        """
+        os.makedirs(work_dir, exist_ok=True)
+        shards = []
+        for shard_no, start in enumerate(range(0, len(df), self.shard_size), start=1):
+            input_path, _, _ = shard_paths(work_dir, shard_no)
+            shard = df.iloc[start:start + self.shard_size][NAME_COLUMNS]
+            if 'Suffix' in df:
+                # Shards are cleaned again when read, which splits the suffix back off
+                suffixes = df['Suffix'].iloc[start:start + self.shard_size]
+                shard = shard.assign(**{'Last Name': (shard['Last Name'] + ' ' + suffixes).str.rstrip()})
+            # Unchanged shard files keep their content hash, so their journals stay resumable
+            shard.to_csv(input_path, index=False)
+            shards.append(shard_no)
+        return shards
+
+    def merge(self, shards, work_dir, output_path, widths, rejected=None):
+        """
+        Concatenate the partial results into the final output, in input order
+
+        Returns:
+            int: Number of result rows written
+        """
+        writer = create_result_writer(output_path, widths=widths)
+        summary = {}
+        try:
+            for shard_no in shards:
+                _, part_path, _ = shard_paths(work_dir, shard_no)
+                with open(part_path, 'r', newline='', encoding='utf-8') as f:
+                    for record in csv.DictReader(f):
+                        writer.write_row(record)
+                for metric, value in _read_summary(part_path).items():
+                    summary[metric] = summary.get(metric, 0) + value
+            summary['Shards'] = len(shards)
+            if rejected is not None:
+                # Rows were validated before sharding, so no shard saw them
+                summary['Rows rejected'] = len(rejected)
+            writer.write_summary(summary)
+            if rejected is not None and len(rejected):
+                writer.write_rejected(rejected)
+        finally:
+            writer.close()
+        return writer.rows_written
+
+    def _run_shards(self, pending, work_dir):
+        """Search the given shards across the process pool"""
+        self._log_status(f"Searching {len(pending)} shards of up to {self.shard_size} names "
+                         f"with {self.processes} processes")
+        options = self._shard_options()
+        with ProcessPoolExecutor(max_workers=min(self.processes, len(pending))) as pool:
+            futures = [
+                pool.submit(_process_shard, shard_no, *shard_paths(work_dir, shard_no), options)
+                for shard_no in pending
+            ]
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                try:
+                    shard_no, processed, total = future.result()
+                except Exception as e:
+                    self._log_status(f"A shard process failed: {str(e)}")
+                    continue
+                self._log_status(f"Shard {shard_no} finished: {processed}/{total} names "
+                                 f"({done_count}/{len(pending)} shards this run)")
+
+    def run(self, input_path, output_path):
+        """
+        Search every name in the input file and write the merged output
+
+        Returns:
+            bool: True if every shard completed and the output was written
+        """
+        started = time.perf_counter()
+        reader = RegistryProcessor(status_callback=self.status_callback, column_mapping=self.column_mapping)
+        df = reader.read_excel_file(input_path)
+        if df is None or len(df) == 0:
+            self._log_status("No valid data found in input file")
+            return False
+
+        work_dir = self.work_dir or f"{os.path.splitext(output_path)[0]}_shards"
+        shards = self.split(df, work_dir)
+        pending = [shard_no for shard_no in shards if not shard_done(work_dir, shard_no)]
+        if len(pending) < len(shards):
+            self._log_status(f"{len(shards) - len(pending)} of {len(shards)} shards already completed")
+        if pending and self.processor_options.get('use_snapshot'):
+            # Refresh a stale registrant snapshot once here rather than in every shard process
+            RegistryProcessor(status_callback=self.status_callback, **self.processor_options)._load_snapshot()
+        if pending:
+            self._run_shards(pending, work_dir)
+
+        incomplete = [shard_no for shard_no in shards if not shard_done(work_dir, shard_no)]
+        if incomplete:
+            self._log_status(f"{len(incomplete)} shards did not complete; run the same command again to finish them")
+            return False
+
+        rows = self.merge(shards, work_dir, output_path, reader._output_widths(df), reader.rejected_rows)
+        if not self.keep_shards:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        elapsed = time.perf_counter() - started
+        self._log_status(f"Results saved to: {output_path}")
+        self._log_status(f"Batch complete! Processed {rows} names in {elapsed:.0f}s")
+        return rows == len(df)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m gui.batch',
+                                     description="Search a large input file across several processes.")
+    parser.add_argument('input', help="Input file (.xlsx, .xls, .ods or .csv)")
+    parser.add_argument('output', help="Output file (.xlsx or .csv)")
+    parser.add_argument('--processes', type=int, default=None, help="Shard processes (default: core count)")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, help="Names per shard")
+    parser.add_argument('--rate-limit', type=float, default=None,
+                        help="Maximum searches per second across all processes")
+    parser.add_argument('--backend', choices=RegistryProcessor.BACKENDS, default='selenium')
+    parser.add_argument('--api-url', default=None, help="Search endpoint for the http backend (required with it)")
+    parser.add_argument('--workers', type=int, default=1, help="Browsers or sessions per process")
+    parser.add_argument('--mapping', default=None, help="JSON file saying where the names are in the input")
+    parser.add_argument('--no-cache', action='store_true', help="Do not reuse recent results")
+    parser.add_argument('--refresh-cache', action='store_true', help="Search every name again")
+    parser.add_argument('--resume', action='store_true', help="Resume shards interrupted part-way")
+    parser.add_argument('--coalesce', action='store_true',
+                        help="Answer rows sharing a last name from one last-name search (http backend)")
+    parser.add_argument('--snapshot', action='store_true', help="Pre-screen names against the registrant snapshot")
+    parser.add_argument('--snapshot-url', default=None, help="Download the registrant list from here when stale")
+    parser.add_argument('--work-dir', default=None, help="Directory for shard files")
+    parser.add_argument('--keep-shards', action='store_true', help="Keep shard files after merging")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.backend == 'http' and not args.api_url:
+        parser.error("--api-url is required with --backend http")
+    options = dict(
+        backend=args.backend,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh_cache,
+        resume=args.resume,
+        use_snapshot=args.snapshot,
+        coalesce=args.coalesce,
+    )
+    if args.api_url:
+        options['api_url'] = args.api_url
+    if args.snapshot_url:
+        options['snapshot_url'] = args.snapshot_url
+    runner = BatchRunner(
+        processes=args.processes,
+        shard_size=args.shard_size,
+        rate_limit=args.rate_limit,
+        work_dir=args.work_dir,
+        keep_shards=args.keep_shards,
+        column_mapping=args.mapping,
+        **options
+    )
+    return 0 if runner.run(args.input, args.output) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Headless command-line entry point.
+
+Runs the same engine as the GUI without importing Tk, for scheduled runs on
+servers with no display.
+
+Usage:
+    python -m gui.cli names.xlsx results.xlsx --backend http --api-url "$REGISTRY_API_URL" --concurrency 32
+    python -m gui.registry_processor names.xlsx results.csv --progress json
+    python -m gui.cli names.xlsx results.xlsx --snapshot --snapshot-import registrants.csv
+
+Exit status is 0 when every name was processed, 1 otherwise and 130 when
+stopped by a signal.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gui.registry_processor import RegistryProcessor
+from gui.registry_snapshot import RegistrySnapshot
+
+OUTPUT_FORMATS = ('xlsx', 'csv')
+
+
+class ProgressReporter:
+    """
+    Writes progress and status events to a stream.
+
+    In 'json' mode every event is one JSON object per line, for schedulers
+    and log collectors; in 'text' mode events are human-readable lines.
+    """
+
+    def __init__(self, mode='text', stream=None):
+        self.mode = mode
+        self.stream = stream or sys.stdout
+
+    def _emit(self, event, text, **fields):
+        if self.mode == 'json':
+            line = json.dumps(dict(event=event, time=datetime.now().isoformat(timespec='seconds'), **fields))
+        elif self.mode == 'text':
+            line = text
+        else:
+            return
+        self.stream.write(line + '\n')
+        self.stream.flush()
+
+    def progress(self, current, total, name, rate=None):
+        rate_text = f" - {rate:.1f} searches/s" if rate else ""
+        self._emit('progress', f"[{current}/{total}] {name}{rate_text}",
+                   current=current, total=total, name=name, rate=rate)
+
+    def status(self, message):
+        self._emit('status', message, message=message)
+
+    def finished(self, success, output_path, summary):
+        self._emit('finished', f"{'Done' if success else 'Failed'}: {output_path}",
+                   success=success, output=output_path, summary=summary)
+
+
+def output_path_for(path, output_format=None):
+    """Apply an explicit output format to the output path's extension"""
+    if not output_format:
+        return path
+    base, ext = os.path.splitext(path)
+    if ext.lower() == f".{output_format}":
+        return path
+    return f"{base}.{output_format}"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m gui.cli',
+                                     description="Search every name in an input file against the registry.")
+    parser.add_argument('input', help="Input file (.xlsx, .xls, .ods or .csv)")
+    parser.add_argument('output', help="Output file")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default=None,
+                        help="Output format (default: from the output file's extension)")
+    parser.add_argument('--backend', choices=RegistryProcessor.BACKENDS, default='selenium')
+    parser.add_argument('--api-url', default=None, help="Search endpoint for the http backend (required with it)")
+    parser.add_argument('--workers', type=int, default=1, help="Parallel browsers (selenium backend)")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="Lookups in flight on the async engine (http backend)")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="Split the input into shards searched by this many processes")
+    parser.add_argument('--shard-size', type=int, default=None, help="Names per shard with --processes")
+    parser.add_argument('--rate-limit', type=float, default=None, help="Maximum searches per second overall")
+    parser.add_argument('--mapping', default=None, help="JSON file saying where the names are in the input")
+    parser.add_argument('--no-cache', action='store_true', help="Do not reuse recent results")
+    parser.add_argument('--refresh-cache', action='store_true', help="Search every name again")
+    parser.add_argument('--resume', action='store_true', help="Skip rows finished by an interrupted run")
+    parser.add_argument('--coalesce', action='store_true',
+                        help="Answer rows sharing a last name from one last-name search (http backend)")
+    parser.add_argument('--snapshot', action='store_true',
+                        help="Pre-screen names against the local registrant snapshot; only candidates are searched")
+    parser.add_argument('--snapshot-import', default=None, metavar='FILE',
+                        help="Rebuild the registrant snapshot from a list file (.json, .csv, .xlsx) first")
+    parser.add_argument('--snapshot-url', default=None, help="Download the registrant list from here when stale")
+    parser.add_argument('--snapshot-max-age', type=float, default=7, help="Days before the snapshot is stale")
+    parser.add_argument('--progress', choices=('text', 'json', 'none'), default='text',
+                        help="Progress output on stdout (engine logging goes to stderr)")
+    return parser
+
+
+def _planning_options(args):
+    options = dict(coalesce=args.coalesce, use_snapshot=args.snapshot, snapshot_max_age_days=args.snapshot_max_age)
+    if args.snapshot_url:
+        options['snapshot_url'] = args.snapshot_url
+    return options
+
+
+def _create_processor(args, reporter):
+    options = dict(
+        progress_callback=reporter.progress,
+        status_callback=reporter.status,
+        backend=args.backend,
+        rate_limit=args.rate_limit,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh_cache,
+        resume=args.resume,
+        column_mapping=args.mapping,
+        **_planning_options(args)
+    )
+    if args.api_url:
+        options['api_url'] = args.api_url
+    if args.backend == 'http' and args.concurrency:
+        # Imported here so only async runs pay for loading aiohttp
+        from gui.async_processor import AsyncRegistryProcessor
+        return AsyncRegistryProcessor(concurrency=args.concurrency, **options)
+    return RegistryProcessor(workers=args.workers, **options)
+
+
+def _run_batch(args, reporter, output_path):
+    from gui.batch import DEFAULT_SHARD_SIZE, BatchRunner
+    options = dict(
+        backend=args.backend,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh_cache,
+        resume=args.resume,
+        **_planning_options(args)
+    )
+    if args.api_url:
+        options['api_url'] = args.api_url
+    runner = BatchRunner(
+        processes=args.processes,
+        shard_size=args.shard_size or DEFAULT_SHARD_SIZE,
+        rate_limit=args.rate_limit,
+        column_mapping=args.mapping,
+        status_callback=reporter.status,
+        **options
+    )
+    success = runner.run(args.input, output_path)
+    reporter.finished(success, output_path, {})
+    return 0 if success else 1
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.backend == 'http' and not args.api_url:
+        parser.error("--api-url is required with --backend http")
+    output_path = output_path_for(args.output, args.format)
+    reporter = ProgressReporter(args.progress, sys.stdout)
+
+    # Keep stdout for progress events; the engine's own prints go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.snapshot_import:
+            try:
+                snapshot = RegistrySnapshot.import_file(args.snapshot_import)
+            except (OSError, ValueError) as e:
+                reporter.status(f"Could not import the registrant snapshot: {str(e)}")
+                return 2
+            reporter.status(f"Registrant snapshot rebuilt: {snapshot.describe()}")
+        if args.processes > 1:
+            return _run_batch(args, reporter, output_path)
+
+        processor = _create_processor(args, reporter)
+        stopped = []
+
+        def handle_signal(signum, frame):
+            # First signal: finish the current rows and keep the journal for --resume.
+            # A second one falls through to the default handler.
+            stopped.append(signum)
+            signal.signal(signum, signal.SIG_DFL)
+            processor.stop_processing()
+
+        signal.signal(signal.SIGINT, handle_signal)
+        if hasattr(signal, 'SIGTERM'):
+            signal.signal(signal.SIGTERM, handle_signal)
+
+        success = processor.process_file(args.input, output_path)
+        summary = processor.run_summary
+        complete = success and summary.get('Names processed') == summary.get('Names in file')
+        reporter.finished(complete, output_path, summary)
+
+    if stopped:
+        return 130
+    return 0 if complete else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import threading
+from collections import Counter, deque
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+
+def browser_rss_mb(driver):
+    """
+    Resident memory of a driver's ChromeDriver process and all its children
+
+    Returns:
+        float or None: Megabytes, or None if psutil is missing or the
+        process cannot be inspected
+    """
+    if not HAS_PSUTIL:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
+
+
+class RestartStats:
+    """Browser restart counts by reason, shared by every worker of a run"""
+
+    def __init__(self):
+        self.by_reason = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, kind):
+        with self._lock:
+            self.by_reason[kind] += 1
+
+    @property
+    def total(self):
+        with self._lock:
+            return sum(self.by_reason.values())
+
+    def format_summary(self):
+        """One-line summary such as 'age 3, memory 1'"""
+        with self._lock:
+            return ", ".join(f"{kind} {count}" for kind, count in self.by_reason.most_common())
+
+
+class DriverHealth:
+    """
+    Tracks how one Chrome session is holding up.
+
+    Searches are recorded as they finish; check() then says whether the
+    session should be replaced: after a fixed number of searches, after
+    several failures in a row, when recent searches are consistently slow,
+    or when the browser's memory has grown past a limit.
+    """
+
+    def __init__(self, max_searches=250, max_consecutive_failures=3, max_latency=20.0,
+                 latency_window=10, max_rss_mb=1500, rss_check_every=10):
+        """
+        Initialize the health monitor
+
+        Args:
+            max_searches: Searches after which the browser is recycled (None = never)
+            max_consecutive_failures: Failed searches in a row that trigger a restart
+            max_latency: Average seconds per search over the latency window that
+                trigger a restart
+            latency_window: Number of recent searches averaged for the latency check
+            max_rss_mb: Browser memory in megabytes that triggers a restart
+                (checked only when psutil is installed)
+            rss_check_every: Searches between memory checks
+        """
+        self.max_searches = max_searches
+        self.max_consecutive_failures = max_consecutive_failures
+        self.max_latency = max_latency
+        self.max_rss_mb = max_rss_mb
+        self.rss_check_every = max(1, int(rss_check_every))
+        self._latencies = deque(maxlen=max(1, int(latency_window)))
+        self.reset()
+
+    def reset(self):
+        """Start tracking a fresh browser session"""
+        self.searches = 0
+        self.consecutive_failures = 0
+        self.session_lost = False
+        self._latencies.clear()
+
+    def record(self, latency, outcome, session_lost=False):
+        """
+        Record a finished search
+
+        Args:
+            latency: Seconds the search took
+            outcome: 'ok', 'error' or 'timeout'
+            session_lost: The browser session is gone and cannot serve another search
+        """
+        self.searches += 1
+        self._latencies.append(latency)
+        if outcome == 'ok':
+            self.consecutive_failures = 0
+        else:
+            self.consecutive_failures += 1
+        if session_lost:
+            self.session_lost = True
+
+    def check(self, driver):
+        """
+        Decide whether the browser should be restarted before the next search
+
+        Returns:
+            tuple or None: (kind, description) of the first limit crossed, or None
+        """
+        if self.session_lost:
+            return 'session', "browser session was lost"
+        if self.max_consecutive_failures and self.consecutive_failures >= self.max_consecutive_failures:
+            return 'failures', f"{self.consecutive_failures} failed searches in a row"
+        if self.max_searches and self.searches >= self.max_searches:
+            return 'age', f"recycling after {self.searches} searches"
+        if self.max_latency and len(self._latencies) == self._latencies.maxlen:
+            average = sum(self._latencies) / len(self._latencies)
+            if average > self.max_latency:
+                return 'latency', f"searches averaging {average:.1f}s"
+        if self.max_rss_mb and self.searches and self.searches % self.rss_check_every == 0:
+            rss = browser_rss_mb(driver)
+            if rss is not None and rss > self.max_rss_mb:
+                return 'memory', f"browser using {rss:.0f} MB"
+        return None
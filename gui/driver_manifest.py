@@ -0,0 +1,119 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+from gui.paths import APP_DATA_DIR
+
+DEFAULT_MANIFEST_PATH = os.path.join(APP_DATA_DIR, "chromedriver.json")
+
+_resolve_lock = threading.Lock()
+
+
+def installed_chrome_version():
+    """
+    Read the installed Chrome version from the local system, without network access
+
+    Returns:
+        str or None: Version such as '126.0.6478.126', or None if it cannot be found
+    """
+    try:
+        try:
+            from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+            return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except ImportError:
+            # webdriver-manager 3.x
+            from webdriver_manager.core.utils import ChromeType, get_browser_version_from_os
+            return get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def _major(version):
+    return str(version).split('.')[0] if version else None
+
+
+class DriverManifest:
+    """
+    Pinned ChromeDriver binary for the installed Chrome.
+
+    The first run resolves the driver with webdriver-manager and records its
+    path and the Chrome version in a small JSON manifest. Later runs start
+    straight from the recorded binary and only consult webdriver-manager again
+    once Chrome's major version changes (ChromeDriver is compatible within a
+    major version). If webdriver-manager cannot be reached, the last pinned
+    driver is used.
+    """
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        """
+        Locate the manifest
+
+        Args:
+            path: JSON file holding the pinned driver
+        """
+        self.path = path
+
+    def load(self):
+        """
+        Read the manifest
+
+        Returns:
+            dict or None: {'driver_path', 'chrome_version', 'resolved_at'}, or None
+            if there is no usable manifest
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not os.path.isfile(entry.get('driver_path') or ''):
+            return None
+        return entry
+
+    def save(self, driver_path, chrome_version):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        entry = {
+            'driver_path': driver_path,
+            'chrome_version': chrome_version,
+            'resolved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        # Write to a temporary file first so a crash never leaves half a manifest
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def resolve(self, log=None):
+        """
+        Return the ChromeDriver binary to use for the installed Chrome
+
+        Args:
+            log: Optional function to call with status messages
+
+        Returns:
+            str: Path to the ChromeDriver executable
+        """
+        log = log or (lambda message: None)
+        with _resolve_lock:
+            chrome_version = installed_chrome_version()
+            entry = self.load()
+            if entry and (chrome_version is None or _major(entry['chrome_version']) == _major(chrome_version)):
+                return entry['driver_path']
+
+            if entry:
+                log(f"Chrome changed from {entry['chrome_version']} to {chrome_version}; updating ChromeDriver...")
+            try:
+                driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                if entry:
+                    log(f"Could not update ChromeDriver ({e}); using the pinned driver")
+                    return entry['driver_path']
+                raise
+
+            self.save(driver_path, chrome_version)
+            return driver_path
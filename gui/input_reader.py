@@ -0,0 +1,310 @@
+import csv
+import json
+import os
+import re
+
+import openpyxl
+import pandas as pd
+
+from gui.names import clean_names
+
+try:
+    import python_calamine  # noqa: F401  (enables pandas' fast 'calamine' engine)
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+SUPPORTED_EXTENSIONS = ('.xlsx', '.xlsm', '.xls', '.ods', '.csv')
+NAME_COLUMNS = ['First Name', 'Last Name', 'Gender']
+
+# Normalized header text that identifies each column role, most specific first
+HEADER_ALIASES = {
+    'first_name': ('firstname', 'first', 'fname', 'givenname', 'forename'),
+    'last_name': ('lastname', 'last', 'lname', 'surname', 'familyname'),
+    'gender': ('gender', 'sex', 'mf'),
+}
+
+# Rows searched for a header row when the mapping does not give one
+HEADER_SCAN_ROWS = 20
+
+_COLUMN_LETTERS = re.compile(r'^[A-Za-z]{1,3}$')
+
+
+def _normalize_header(value):
+    return re.sub(r'[^a-z0-9]', '', str(value).lower()) if value is not None else ''
+
+
+def column_index(letters):
+    """Convert a spreadsheet column letter ('A', 'G', 'AA') to a 0-based index"""
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+
+class ColumnMapping:
+    """
+    Where the names are in an input sheet.
+
+    Each column may be given as a letter ('B'), a header text ('Surname') or
+    a 0-based index. Rows are 1-based, as in Excel. Anything left as None is
+    auto-detected from the header row.
+    """
+
+    def __init__(self, first_name=None, last_name=None, gender=None, header_row=None, start_row=None, sheet=None):
+        """
+        Initialize the mapping
+
+        Args:
+            first_name: First name column
+            last_name: Last name column
+            gender: Gender column (optional; missing genders become 'unknown')
+            header_row: Row holding the column headers
+            start_row: First data row (defaults to the row after the header)
+            sheet: Sheet name or 0-based index for workbooks (defaults to the first)
+        """
+        self.first_name = first_name
+        self.last_name = last_name
+        self.gender = gender
+        self.header_row = header_row
+        self.start_row = start_row
+        self.sheet = sheet
+
+    @classmethod
+    def from_dict(cls, data):
+        keys = ('first_name', 'last_name', 'gender', 'header_row', 'start_row', 'sheet')
+        return cls(**{key: data.get(key) for key in keys})
+
+    @classmethod
+    def load(cls, path):
+        """Load a mapping from a JSON config file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def coerce(cls, mapping):
+        """Accept a ColumnMapping, a dict, a path to a JSON config, or None"""
+        if mapping is None or isinstance(mapping, cls):
+            return mapping
+        if isinstance(mapping, dict):
+            return cls.from_dict(mapping)
+        return cls.load(mapping)
+
+    def __repr__(self):
+        return (f"ColumnMapping(first_name={self.first_name!r}, last_name={self.last_name!r}, "
+                f"gender={self.gender!r}, header_row={self.header_row!r}, start_row={self.start_row!r})")
+
+
+# The original intake layout: B/D/G with headers in row 3
+LEGACY_MAPPING = ColumnMapping(first_name='B', last_name='D', gender='G', header_row=3, start_row=4)
+
+
+def _read_ragged_csv(file_path, encoding):
+    """Read a CSV whose lines have different numbers of cells, padding each to the widest"""
+    with open(file_path, 'r', newline='', encoding=encoding) as f:
+        # Blank lines are skipped, as pandas does
+        rows = [row for row in csv.reader(f) if row]
+    width = max((len(row) for row in rows), default=0)
+    return pd.DataFrame(
+        [[value if value != '' else None for value in row] + [None] * (width - len(row)) for row in rows],
+        columns=range(width), dtype=object
+    )
+
+
+def _read_csv(file_path, encoding):
+    try:
+        return pd.read_csv(file_path, encoding=encoding, header=None, dtype=object,
+                           keep_default_na=False, na_values=[''])
+    except pd.errors.ParserError:
+        return _read_ragged_csv(file_path, encoding)
+
+
+def read_csv_table(file_path):
+    """
+    Read every cell of a CSV file as text
+
+    Only empty cells are missing; names such as 'NA' or 'None' are kept as
+    text. A title or note line above the header usually holds fewer cells
+    than the rows below it, which pandas' parser rejects; such files are
+    read again line by line and padded to the widest line.
+
+    Returns:
+        pandas.DataFrame of raw values with 0-based integer row and column labels
+    """
+    try:
+        return _read_csv(file_path, 'utf-8-sig')
+    except UnicodeDecodeError:
+        return _read_csv(file_path, 'latin-1')
+
+
+def read_table(file_path, sheet=None):
+    """
+    Read every cell value of a sheet or CSV file, without headers or styles
+
+    Uses the calamine engine for workbooks when python-calamine is installed,
+    otherwise openpyxl read-only streaming for .xlsx and pandas' default
+    engines (xlrd, odfpy) for .xls and .ods.
+
+    Returns:
+        pandas.DataFrame of raw values with 0-based integer row and column labels
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"Unsupported input format: {ext or 'no extension'}")
+
+    if ext == '.csv':
+        return read_csv_table(file_path)
+
+    sheet_name = 0 if sheet is None else sheet
+    if HAS_CALAMINE:
+        return pd.read_excel(file_path, engine='calamine', sheet_name=sheet_name, header=None, dtype=object)
+
+    if ext in ('.xlsx', '.xlsm'):
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+            return pd.DataFrame(list(ws.iter_rows(values_only=True)), dtype=object)
+        finally:
+            wb.close()
+
+    return pd.read_excel(file_path, sheet_name=sheet_name, header=None, dtype=object)
+
+
+def _blank(series):
+    return series.isna() | (series.astype(str).str.strip() == '')
+
+
+def _column(data, col):
+    if col is not None and col in data.columns:
+        return data[col]
+    return pd.Series(index=data.index, dtype=object)
+
+
+def detect_header_row(table):
+    """
+    Find the header row by looking for first and last name headers
+
+    Returns:
+        int or None: 0-based row index of the header, or None if not found
+    """
+    for row_idx in range(min(HEADER_SCAN_ROWS, len(table))):
+        headers = {_normalize_header(value) for value in table.iloc[row_idx]}
+        if any(alias in headers for alias in HEADER_ALIASES['first_name']) and \
+                any(alias in headers for alias in HEADER_ALIASES['last_name']):
+            return row_idx
+    return None
+
+
+def resolve_mapping(table, mapping=None):
+    """
+    Work out 0-based column positions and the first data row for a table
+
+    Columns and rows left unset in ``mapping`` are detected from the header
+    row; if no header row can be found, the legacy B/D/G layout is used.
+    When no header names the gender column, the legacy column G is read for
+    it, unless G holds one of the names.
+
+    Returns:
+        tuple: ({'first_name': col, 'last_name': col, 'gender': col or None}, start_row)
+    """
+    mapping = mapping or ColumnMapping()
+
+    header_idx = mapping.header_row - 1 if mapping.header_row else detect_header_row(table)
+    if header_idx is None and mapping.first_name is None and mapping.last_name is None:
+        mapping, header_idx = LEGACY_MAPPING, LEGACY_MAPPING.header_row - 1
+
+    headers = {}
+    if header_idx is not None and header_idx < len(table):
+        for col, value in table.iloc[header_idx].items():
+            # Keep the leftmost column when a header repeats
+            headers.setdefault(_normalize_header(value), col)
+
+    positions = {}
+    for role in ('first_name', 'last_name', 'gender'):
+        spec = getattr(mapping, role)
+        if spec is None:
+            positions[role] = next((headers[alias] for alias in HEADER_ALIASES[role] if alias in headers), None)
+        elif isinstance(spec, int):
+            positions[role] = spec
+        elif _normalize_header(spec) in headers:
+            positions[role] = headers[_normalize_header(spec)]
+        elif _COLUMN_LETTERS.match(str(spec)):
+            positions[role] = column_index(str(spec))
+        else:
+            raise ValueError(f"Column '{spec}' for {role.replace('_', ' ')} not found")
+
+    if positions['first_name'] is None or positions['last_name'] is None:
+        raise ValueError("Could not find first and last name columns; provide a column mapping")
+    if positions['gender'] is None and mapping.gender is None:
+        legacy_gender = column_index(LEGACY_MAPPING.gender)
+        if legacy_gender in table.columns and legacy_gender not in (positions['first_name'], positions['last_name']):
+            positions['gender'] = legacy_gender
+
+    if mapping.start_row:
+        start_row = mapping.start_row - 1
+    else:
+        start_row = header_idx + 1 if header_idx is not None else 0
+    return positions, start_row
+
+
+def read_names_with_rejects(file_path, mapping=None):
+    """
+    Read, clean and validate the names in an input file
+
+    Reads from the first data row down to the first row with neither a
+    first nor a last name, then normalizes every row in bulk (see
+    names.clean_names): names are folded to ASCII and tidied, suffixes are
+    split off and genders are mapped to 'male', 'female' or 'unknown'.
+
+    Args:
+        file_path: .xlsx, .xls, .ods or .csv file
+        mapping: ColumnMapping, dict, path to a JSON mapping, or None to auto-detect
+
+    Returns:
+        tuple: (names, rejected). ``names`` has First Name, Last Name, Gender and
+        Suffix columns. ``rejected`` has the sheet Row number, the raw names and
+        the Reason each invalid row was left out.
+    """
+    mapping = ColumnMapping.coerce(mapping)
+    table = read_table(file_path, sheet=mapping.sheet if mapping else None)
+    positions, start_row = resolve_mapping(table, mapping)
+
+    data = table.iloc[start_row:]
+    df = pd.DataFrame({
+        'First Name': _column(data, positions['first_name']),
+        'Last Name': _column(data, positions['last_name']),
+        'Gender': _column(data, positions['gender']),
+    }, columns=NAME_COLUMNS)
+
+    # Stop at the first row with neither name
+    end_rows = _blank(df['First Name']) & _blank(df['Last Name'])
+    if end_rows.any():
+        df = df.iloc[:int(end_rows.values.argmax())]
+
+    names, rejected = clean_names(df)
+    # The table index is the 0-based sheet row
+    rejected.insert(0, 'Row', rejected.index + 1)
+    return names.reset_index(drop=True), rejected.reset_index(drop=True)
+
+
+def read_names(file_path, mapping=None):
+    """
+    Read the valid, cleaned names in an input file
+
+    See read_names_with_rejects() for the cleaning rules.
+
+    Returns:
+        pandas.DataFrame with columns: First Name, Last Name, Gender, Suffix
+    """
+    return read_names_with_rejects(file_path, mapping)[0]
+
+
+def iter_names(file_path, mapping=None):
+    """
+    Yield (first_name, last_name, gender) for every valid row of an input file
+
+    This is the shared name stream used by the GUI, the processor and the
+    helper scripts; see read_names() for the cleaning rules.
+    """
+    df = read_names(file_path, mapping)
+    yield from df[NAME_COLUMNS].itertuples(index=False, name=None)
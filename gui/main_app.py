@@ -120,7 +120,7 @@ class RegistryApp:
             self.processor.cleanup()
             self.processor = None
 
-    def update_progress(self, current, total, name):
+    def update_progress(self, current, total, name, rate=None):
         if total > 0:
             self.root.after(0, lambda: self.progress_label.config(text=f"Processing: {name} ({current}/{total})"))
 
@@ -189,7 +189,7 @@ class RegistryAppV2:
         # Reset name highlights
         self.root.after(0, self.reset_name_highlights)
 
-    def update_progress(self, current, total, name):
+    def update_progress(self, current, total, name, rate=None):
         if total > 0:
             self.root.after(0, lambda: self.progress_label.config(text=f"Processing: {name} ({current}/{total})"))
             self.root.after(0, lambda: self.highlight_current_name(current, total))
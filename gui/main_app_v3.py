@@ -2,11 +2,20 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
 import os
+from collections import deque
 from datetime import datetime
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gui.async_processor import AsyncRegistryProcessor
+from gui.input_reader import NAME_COLUMNS
 from gui.registry_processor import RegistryProcessor
+from gui.run_journal import RunJournal
+from gui.search_backends import NO_RESULTS, WARNING
+from gui.virtual_table import VirtualTable
+
+# Milliseconds between applying queued progress and results to the window
+UPDATE_INTERVAL_MS = 100
 
 class RegistryAppV3:
     def __init__(self, root):
@@ -18,6 +27,20 @@ class RegistryAppV3:
         self.processing = False
         self.processor = None
         self.names = []
+        # Written by the processing thread (and its browser workers), drained on
+        # the Tk thread by poll_updates
+        self.pending_results = deque()
+        self.pending_status = deque()
+        self.latest_progress = None
+        self.poll_job = None
+        self.workers = tk.IntVar(value=1)
+        self.backend = tk.StringVar(value='selenium')
+        # Blank until the user enters it: the default endpoint has not been confirmed against the live site
+        self.api_url = tk.StringVar(value='')
+        self.use_cache = tk.BooleanVar(value=True)
+        self.refresh_cache = tk.BooleanVar(value=False)
+        self.resume = tk.BooleanVar(value=False)
+        self.use_snapshot = tk.BooleanVar(value=False)
         self.create_widgets()
         self.set_default_output_path()
 
@@ -60,19 +83,16 @@ class RegistryAppV3:
         names_frame.grid(row=5, column=0, columnspan=3, sticky="nsew", pady=(0, 5))
         names_frame.grid_rowconfigure(0, weight=1)
         names_frame.grid_columnconfigure(0, weight=1)
-        self.names_tree = ttk.Treeview(names_frame, columns=("First Name", "Last Name", "Gender"), show='headings', height=10)
-        self.names_tree.heading("First Name", text="First Name")
-        self.names_tree.heading("Last Name", text="Last Name")
-        self.names_tree.heading("Gender", text="Gender")
-        self.names_tree.column("First Name", width=120)
-        self.names_tree.column("Last Name", width=120)
-        self.names_tree.column("Gender", width=80)
-        self.names_tree.grid(row=0, column=0, sticky="nsew")
-        names_scroll = ttk.Scrollbar(names_frame, orient=tk.VERTICAL, command=self.names_tree.yview)
-        names_scroll.grid(row=0, column=1, sticky="ns")
-        self.names_tree.config(yscrollcommand=names_scroll.set)
+        # Only the visible rows are drawn, so large sheets stay responsive during a run
+        self.names_table = VirtualTable(names_frame, columns=("First Name", "Last Name", "Gender", "Result"),
+                                        widths=(120, 120, 80, 160))
+        self.names_table.grid(row=0, column=0, sticky="nsew")
+        self.names_table.tag_configure('current', background='#d1ffd1')
+        self.names_table.tag_configure('done', background='#e0e0e0', foreground='gray')
+        self.names_table.tag_configure('warning', background='#ffd6d6')
+        self.names_table.tag_configure('failed', background='#ffe9c7')
         # Placeholder row
-        self.names_tree.insert('', 'end', values=("No names loaded.", "", ""))
+        self.names_table.set_rows([("No names loaded.", "", "", "")])
 
         # Controls
         ctrl_frame = ttk.Frame(main_frame, style='TFrame')
@@ -84,13 +104,52 @@ class RegistryAppV3:
         self.open_results_btn = ttk.Button(ctrl_frame, text="Open Results", command=self.open_results, state=tk.DISABLED)
         self.open_results_btn.pack(side=tk.LEFT, padx=5)
 
+        # Processing options
+        options_frame = ttk.Frame(main_frame, style='TFrame')
+        options_frame.grid(row=7, column=0, columnspan=3, pady=(0, 10))
+        ttk.Label(options_frame, text="Browsers:").pack(side=tk.LEFT, padx=(0, 2))
+        self.workers_spin = ttk.Spinbox(options_frame, from_=1, to=os.cpu_count() or 1, width=3, textvariable=self.workers, state='readonly')
+        self.workers_spin.pack(side=tk.LEFT)
+        ttk.Label(options_frame, text="Search via:").pack(side=tk.LEFT, padx=(15, 2))
+        self.backend_combo = ttk.Combobox(options_frame, textvariable=self.backend, values=RegistryProcessor.BACKENDS, width=9, state='readonly')
+        self.backend_combo.pack(side=tk.LEFT)
+        self.backend_combo.bind('<<ComboboxSelected>>', lambda event: self.show_api_url())
+        self.use_cache_check = ttk.Checkbutton(options_frame, text="Reuse recent results", variable=self.use_cache)
+        self.use_cache_check.pack(side=tk.LEFT, padx=(15, 0))
+        self.refresh_cache_check = ttk.Checkbutton(options_frame, text="Force refresh", variable=self.refresh_cache)
+        self.refresh_cache_check.pack(side=tk.LEFT, padx=(10, 0))
+        self.resume_check = ttk.Checkbutton(options_frame, text="Resume previous run", variable=self.resume)
+        self.resume_check.pack(side=tk.LEFT, padx=(10, 0))
+        self.snapshot_check = ttk.Checkbutton(options_frame, text="Pre-screen with snapshot", variable=self.use_snapshot)
+        self.snapshot_check.pack(side=tk.LEFT, padx=(10, 0))
+
+        # Search API address, shown only for the http backend
+        self.api_frame = ttk.Frame(main_frame, style='TFrame')
+        self.api_frame.grid(row=8, column=0, columnspan=3, pady=(0, 10), sticky="we")
+        self.api_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(self.api_frame, text="Search API URL:").grid(row=0, column=0, sticky="e")
+        self.api_url_entry = ttk.Entry(self.api_frame, textvariable=self.api_url, width=60)
+        self.api_url_entry.grid(row=0, column=1, sticky="we", padx=5)
+        self.show_api_url()
+
+        # Disabled while a run is in progress
+        self.option_widgets = [
+            (self.workers_spin, 'readonly'),
+            (self.backend_combo, 'readonly'),
+            (self.use_cache_check, tk.NORMAL),
+            (self.refresh_cache_check, tk.NORMAL),
+            (self.resume_check, tk.NORMAL),
+            (self.snapshot_check, tk.NORMAL),
+            (self.api_url_entry, tk.NORMAL),
+        ]
+
         # Progress
         self.progress_label = ttk.Label(main_frame, text="Ready to process", font=("Arial", 10))
-        self.progress_label.grid(row=7, column=0, columnspan=3, pady=(0, 5), sticky="w")
+        self.progress_label.grid(row=9, column=0, columnspan=3, pady=(0, 5), sticky="w")
 
         # Status log
         status_frame = ttk.Labelframe(main_frame, text="Status Log", padding=5)
-        status_frame.grid(row=8, column=0, columnspan=3, sticky="nsew", pady=(5, 0))
+        status_frame.grid(row=10, column=0, columnspan=3, sticky="nsew", pady=(5, 0))
         status_frame.grid_rowconfigure(0, weight=1)
         status_frame.grid_columnconfigure(0, weight=1)
         self.status_text = tk.Text(status_frame, height=6, width=80, state='normal', relief=tk.SUNKEN, borderwidth=2, font=("Arial", 10))
@@ -103,11 +162,21 @@ class RegistryAppV3:
 
         # Configure grid weights for resizing
         main_frame.grid_rowconfigure(5, weight=2)
-        main_frame.grid_rowconfigure(8, weight=1)
+        main_frame.grid_rowconfigure(10, weight=1)
         main_frame.grid_columnconfigure(1, weight=1)
 
         self.log_status("Application started. Select an Excel file to begin.")
 
+    def show_api_url(self):
+        if self.backend.get() == 'http':
+            self.api_frame.grid()
+        else:
+            self.api_frame.grid_remove()
+
+    def set_options_enabled(self, enabled):
+        for widget, state in self.option_widgets:
+            widget.config(state=state if enabled else tk.DISABLED)
+
     def set_default_output_path(self):
         desktop = os.path.join(os.path.expanduser("~"), "Desktop")
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -116,7 +185,7 @@ class RegistryAppV3:
         self.output_file.set(default_path)
 
     def browse_file(self):
-        file_path = filedialog.askopenfilename(title="Select Excel File", filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")])
+        file_path = filedialog.askopenfilename(title="Select Input File", filetypes=[("Spreadsheets", "*.xlsx *.xls *.ods *.csv"), ("All files", "*.*")])
         if file_path:
             self.selected_file.set(file_path)
             self.log_status(f"Selected file: {os.path.basename(file_path)}")
@@ -126,19 +195,26 @@ class RegistryAppV3:
         processor = RegistryProcessor()
         df = processor.read_excel_file(file_path)
         self.names = []
-        for i in self.names_tree.get_children():
-            self.names_tree.delete(i)
         if df is not None and not df.empty:
-            for idx, row in df.iterrows():
-                self.names.append((row['First Name'], row['Last Name'], row['Gender']))
-                self.names_tree.insert('', 'end', values=(row['First Name'], row['Last Name'], row['Gender']))
+            self.names = list(df[NAME_COLUMNS].itertuples(index=False, name=None))
+            suffixes = df['Suffix'] if 'Suffix' in df else [''] * len(df)
+            self.names_table.set_rows([(first_name, f"{last_name} {suffix}".rstrip(), gender, "")
+                                       for (first_name, last_name, gender), suffix in zip(self.names, suffixes)])
             self.log_status(f"Loaded {len(self.names)} names from file.")
+            if len(processor.rejected_rows):
+                self.log_status(f"{len(processor.rejected_rows)} rows cannot be searched; "
+                                "they will be listed on the Rejected Rows sheet.")
+            if RunJournal(file_path).exists():
+                self.resume.set(True)
+                self.log_status("An unfinished run of this file was found; it will be resumed unless you untick 'Resume previous run'.")
+            else:
+                self.resume.set(False)
         else:
-            self.names_tree.insert('', 'end', values=("No names loaded.", "", ""))
+            self.names_table.set_rows([("No names loaded.", "", "", "")])
             self.log_status("No valid names found in file.")
 
     def change_output_location(self):
-        file_path = filedialog.asksaveasfilename(title="Save Results As", defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")])
+        file_path = filedialog.asksaveasfilename(title="Save Results As", defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("All files", "*.*")])
         if file_path:
             self.output_file.set(file_path)
             self.log_status(f"Output location set to: {os.path.basename(file_path)}")
@@ -153,14 +229,25 @@ class RegistryAppV3:
         if not self.names:
             messagebox.showerror("Error", "No names to process. Please select a valid Excel file.")
             return
+        if self.backend.get() == 'http' and not self.api_url.get().strip().startswith(('http://', 'https://')):
+            messagebox.showerror("Error", "Enter the registry's search API URL (http:// or https://) to search via http.")
+            return
         self.processing = True
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
         self.open_results_btn.config(state=tk.DISABLED)
+        self.set_options_enabled(False)
         self.progress_label.config(text="Initializing...")
         self.status_text.config(state='normal')
         self.status_text.delete(1.0, tk.END)
         self.status_text.config(state='disabled')
+        self.names_table.clear_column("Result")
+        self.pending_results.clear()
+        self.pending_status.clear()
+        self.latest_progress = None
+        if self.poll_job:
+            self.root.after_cancel(self.poll_job)
+        self.poll_job = self.root.after(UPDATE_INTERVAL_MS, self.poll_updates)
         self.processing_thread = threading.Thread(target=self._process_file)
         self.processing_thread.daemon = True
         self.processing_thread.start()
@@ -171,17 +258,36 @@ class RegistryAppV3:
 
     def _process_file(self):
         try:
-            self.processor = RegistryProcessor(progress_callback=self.update_progress, status_callback=self.log_status)
+            options = dict(
+                progress_callback=self.update_progress,
+                status_callback=self.queue_status,
+                result_callback=self.record_result,
+                use_cache=self.use_cache.get(),
+                refresh_cache=self.refresh_cache.get(),
+                resume=self.resume.get(),
+                use_snapshot=self.use_snapshot.get()
+            )
+            if self.backend.get() == 'http':
+                # Many lookups in flight on one event loop; callbacks are handed to the Tk thread
+                self.processor = AsyncRegistryProcessor(
+                    api_url=self.api_url.get().strip(),
+                    dispatch=lambda callback, *args: self.root.after(0, callback, *args),
+                    **options
+                )
+            else:
+                self.processor = RegistryProcessor(workers=self.workers.get(), backend='selenium', **options)
             success = self.processor.process_file(self.selected_file.get(), self.output_file.get())
             self.root.after(0, self._processing_complete, success)
         except Exception as e:
-            self.root.after(0, self.log_status, f"Unexpected error: {str(e)}")
+            self.queue_status(f"Unexpected error: {str(e)}")
             self.root.after(0, self._processing_complete, False)
 
     def _processing_complete(self, success):
         self.processing = False
+        self.apply_updates()
         self.start_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
+        self.set_options_enabled(True)
         if success:
             self.open_results_btn.config(state=tk.NORMAL)
             self.progress_label.config(text="Processing completed successfully!")
@@ -194,29 +300,49 @@ class RegistryAppV3:
             self.processor = None
         self.root.after(0, self.reset_name_highlights)
 
-    def update_progress(self, current, total, name):
+    def update_progress(self, current, total, name, rate=None):
+        # Only the latest progress matters; poll_updates shows it
         if total > 0:
-            self.root.after(0, lambda: self.progress_label.config(text=f"Processing: {name} ({current}/{total})"))
-            self.root.after(0, lambda: self.highlight_current_name(current, total))
-
-    def highlight_current_name(self, current, total):
-        # Remove all highlights
-        for i, item in enumerate(self.names_tree.get_children()):
-            self.names_tree.item(item, tags=())
-        # Highlight current name
-        idx = current - 1
-        items = list(self.names_tree.get_children())
-        if 0 <= idx < len(items):
-            self.names_tree.item(items[idx], tags=('current',))
-            self.names_tree.tag_configure('current', background='#d1ffd1')
-        # Mark completed names
-        for i in range(idx):
-            self.names_tree.item(items[i], tags=('done',))
-            self.names_tree.tag_configure('done', background='#e0e0e0', foreground='gray')
+            self.latest_progress = (current, total, name, rate)
+
+    def record_result(self, idx, result, source):
+        self.pending_results.append((idx, result))
+
+    def queue_status(self, message):
+        # Called from worker threads, which must not touch the Text widget
+        self.pending_status.append(message)
+
+    def poll_updates(self):
+        self.apply_updates()
+        self.poll_job = self.root.after(UPDATE_INTERVAL_MS, self.poll_updates) if self.processing else None
+
+    def apply_updates(self):
+        """Show the latest progress and the results and messages queued since the last update"""
+        while self.pending_status:
+            self.log_status(self.pending_status.popleft())
+        while self.pending_results:
+            idx, result = self.pending_results.popleft()
+            if idx < len(self.names_table.rows):
+                self.names_table.set_value(idx, "Result", result)
+                self.names_table.set_tags(idx, (self.result_tag(result),))
+        progress, self.latest_progress = self.latest_progress, None
+        if progress and self.processing:
+            current, total, name, rate = progress
+            rate_text = f" - {rate:.1f} searches/s" if rate else ""
+            self.progress_label.config(text=f"Processing: {name} ({current}/{total}){rate_text}")
+            if 0 < current <= len(self.names_table.rows):
+                self.names_table.set_current(current - 1)
+
+    @staticmethod
+    def result_tag(result):
+        if result == WARNING:
+            return 'warning'
+        if result == NO_RESULTS:
+            return 'done'
+        return 'failed'
 
     def reset_name_highlights(self):
-        for item in self.names_tree.get_children():
-            self.names_tree.item(item, tags=())
+        self.names_table.set_current(None)
 
     def log_status(self, message):
         timestamp = datetime.now().strftime("%H:%M:%S")
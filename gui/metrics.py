@@ -0,0 +1,163 @@
+import json
+import math
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Stages in the order they happen, for stable report ordering
+STAGES = (
+    'read', 'cache_lookup', 'prescreen', 'navigate', 'disclaimer', 'tab_click', 'form_fill', 'submit',
+    'result_wait', 'classify', 'search', 'write',
+)
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """
+    Linear-interpolated percentile of an already sorted list
+
+    Args:
+        sorted_values: Non-empty list of numbers in ascending order
+        pct: Percentile between 0 and 100
+    """
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class RunMetrics:
+    """
+    Thread-safe per-stage timings and search outcomes for one run.
+
+    Stages are timed with ``with metrics.stage('navigate'):`` around the hot
+    path, every search outcome is counted, and summary() turns it all into
+    latency percentiles, throughput and error rate for the metrics report.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations = {}
+        self.outcomes = Counter()
+        self.started_at = None
+        self.finished_at = None
+        self.names_processed = 0
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def stop(self, names_processed):
+        self.finished_at = time.perf_counter()
+        self.names_processed = names_processed
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def record(self, stage, seconds):
+        with self._lock:
+            self._durations.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block under ``name``"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record_search(self, seconds, outcome):
+        """Record one complete search attempt and its outcome ('ok', 'error' or 'timeout')"""
+        with self._lock:
+            self._durations.setdefault('search', []).append(seconds)
+            self.outcomes[outcome] += 1
+
+    def stage_summary(self):
+        """
+        Summarize the recorded stages
+
+        Returns:
+            dict: stage -> {'count', 'total', 'mean', 'p50', 'p95', 'p99', 'max'} in seconds
+        """
+        with self._lock:
+            durations = {name: sorted(values) for name, values in self._durations.items()}
+        order = {name: position for position, name in enumerate(STAGES)}
+        summary = {}
+        for name in sorted(durations, key=lambda name: (order.get(name, len(STAGES)), name)):
+            values = durations[name]
+            stats = {'count': len(values), 'total': sum(values), 'mean': sum(values) / len(values)}
+            for pct in PERCENTILES:
+                stats[f'p{pct}'] = percentile(values, pct)
+            stats['max'] = values[-1]
+            summary[name] = stats
+        return summary
+
+    def summary(self):
+        """
+        Summarize the whole run
+
+        Returns:
+            dict: 'stages' (see stage_summary), plus elapsed seconds, names processed,
+            searches, outcome counts, throughput and error rate
+        """
+        with self._lock:
+            outcomes = dict(self.outcomes)
+        searches = sum(outcomes.values())
+        failed = searches - outcomes.get('ok', 0)
+        elapsed = self.elapsed
+        return {
+            'elapsed_seconds': elapsed,
+            'names_processed': self.names_processed,
+            'searches': searches,
+            'outcomes': outcomes,
+            'names_per_second': self.names_processed / elapsed if elapsed else 0.0,
+            'searches_per_second': searches / elapsed if elapsed else 0.0,
+            'error_rate': failed / searches if searches else 0.0,
+            'stages': self.stage_summary(),
+        }
+
+    def table(self):
+        """
+        Metrics as rows for a spreadsheet, header first
+
+        Returns:
+            list: Lists of cell values
+        """
+        summary = self.summary()
+        header = ['Stage', 'Count', 'Total (s)', 'Mean (s)'] + [f'p{pct} (s)' for pct in PERCENTILES] + ['Max (s)']
+        rows = [header]
+        for name, stats in summary['stages'].items():
+            rows.append([name, stats['count'], round(stats['total'], 3), round(stats['mean'], 4)]
+                        + [round(stats[f'p{pct}'], 4) for pct in PERCENTILES] + [round(stats['max'], 4)])
+        rows.append([])
+        rows.append(['Elapsed (s)', round(summary['elapsed_seconds'], 1)])
+        rows.append(['Names processed', summary['names_processed']])
+        rows.append(['Searches', summary['searches']])
+        rows.append(['Names per second', round(summary['names_per_second'], 3)])
+        rows.append(['Searches per second', round(summary['searches_per_second'], 3)])
+        rows.append(['Error rate', round(summary['error_rate'], 4)])
+        for outcome, count in sorted(summary['outcomes'].items()):
+            rows.append([f'Outcome: {outcome}', count])
+        return rows
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def format_summary(self):
+        """One-line summary for the status log"""
+        summary = self.summary()
+        search = summary['stages'].get('search')
+        parts = [f"{summary['names_per_second']:.2f} names/s"]
+        if search:
+            parts.append(f"search p50 {search['p50']:.2f}s, p95 {search['p95']:.2f}s, p99 {search['p99']:.2f}s")
+        if summary['searches']:
+            parts.append(f"error rate {summary['error_rate']:.1%}")
+        return ", ".join(parts)
@@ -0,0 +1,165 @@
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Values of the registry form's gender select, by the spellings seen in intake sheets
+GENDER_VALUES = {
+    'm': 'male', 'male': 'male', 'man': 'male', 'boy': 'male',
+    'f': 'female', 'female': 'female', 'woman': 'female', 'girl': 'female',
+}
+UNKNOWN_GENDER = 'unknown'
+
+# Generational suffixes the registry does not store as part of a name
+SUFFIX_SPELLINGS = {'jr': 'Jr', 'sr': 'Sr', 'ii': 'II', 'iii': 'III', 'iv': 'IV', 'v': 'V'}
+LAST_NAME_SUFFIXES = frozenset(SUFFIX_SPELLINGS)
+# 'V' after a first name is usually a middle initial, not a suffix
+FIRST_NAME_SUFFIXES = LAST_NAME_SUFFIXES - {'v'}
+# Characters a cleaned name can hold besides letters
+_NON_LETTERS = "0123456789 '-"
+MAX_NAME_LENGTH = 50
+# Curly quotes and accents used as apostrophes
+_QUOTE_TABLE = str.maketrans({'\u2018': "'", '\u2019': "'", '\u00b4': "'", '\u02bc': "'"})
+# After folding every name is ASCII: separators become spaces and all other
+# punctuation except hyphens and apostrophes is dropped (bytes.translate is
+# several times faster than str.translate with a dict)
+_PUNCTUATION_TABLE = bytes.maketrans(b'.,;:/_\t\n\r\x0b\x0c`', b"           '")
+_DROPPED_PUNCTUATION = b'!"#$%&()*+<=>?@[\\]^{|}~'
+
+
+def fold_diacritics(value):
+    """Replace accented letters with their plain ASCII forms ('José' -> 'Jose')"""
+    if value.isascii():
+        return value
+    return unicodedata.normalize('NFKD', value.translate(_QUOTE_TABLE)).encode('ascii', 'ignore').decode('ascii')
+
+
+def clean_name(value):
+    """
+    Clean a name part the same way for input rows and registrant lists
+
+    Folds diacritics, turns curly quotes into apostrophes, drops punctuation
+    other than hyphens and apostrophes ('J.R.' -> 'J R'), closes up spaced
+    hyphens ('Smith - Jones' -> 'Smith-Jones') and collapses whitespace.
+
+    Args:
+        value: Raw first or last name (any type; None is treated as empty)
+
+    Returns:
+        str: The cleaned name, case unchanged
+    """
+    if value is None:
+        return ''
+    value = fold_diacritics(str(value)).encode('ascii', 'ignore')
+    value = ' '.join(value.translate(_PUNCTUATION_TABLE, _DROPPED_PUNCTUATION).decode('ascii').split())
+    if '-' in value:
+        value = value.replace(' -', '-').replace('- ', '-')
+    return value.strip(" '-")
+
+
+def normalize_name(value):
+    """
+    Normalize a name part for comparison
+
+    Every comparison - dedup, cache, snapshot and last-name grouping - goes
+    through this, so input rows and registrant names always agree.
+
+    Returns:
+        str: The name as cleaned by clean_name, lowercased
+    """
+    return clean_name(value).lower()
+
+
+def name_key(first_name, last_name, gender):
+    """
+    Build the identity key used to recognise the same search
+
+    Returns:
+        tuple: (first, last, gender), each normalized
+    """
+    return (normalize_name(first_name), normalize_name(last_name), normalize_name(gender) or 'unknown')
+
+
+def _clean_name_value(value, suffixes, label):
+    """
+    Clean one name, split off a trailing suffix and check it
+
+    Returns:
+        tuple: (name, suffix spelling or '', rejection reason or '')
+    """
+    if not value.strip():
+        return '', '', f'missing {label}'
+    name = clean_name(value)
+    suffix = ''
+    head, _, tail = name.rpartition(' ')
+    if head and tail.lower() in suffixes:
+        name, suffix = head, SUFFIX_SPELLINGS[tail.lower()]
+    if not name.strip(_NON_LETTERS):
+        return name, suffix, f'{label} has no letters'
+    if len(name) > MAX_NAME_LENGTH:
+        return name, suffix, f'{label} too long'
+    return name, suffix, ''
+
+
+def _clean_name_column(series, suffixes, label):
+    """
+    Clean and check one name column
+
+    The column is factorized so each distinct value is cleaned once, since
+    intake columns repeat heavily, and the results are spread back over the
+    rows with one array take per output.
+
+    Returns:
+        tuple: Series aligned with ``series``: (cleaned names, suffixes,
+        rejection reasons with '' for valid values)
+    """
+    codes, values = pd.factorize(series.fillna('').astype(str))
+    cleaned = np.empty((len(values), 3), dtype=object)
+    if len(values):
+        cleaned[:] = [_clean_name_value(value, suffixes, label) for value in values.tolist()]
+
+    def spread(unique_values):
+        return pd.Series(unique_values[codes], index=series.index, dtype=object)
+
+    return spread(cleaned[:, 0]), spread(cleaned[:, 1]), spread(cleaned[:, 2])
+
+
+def normalize_genders(series):
+    """
+    Map free-text genders onto the form's select values
+
+    Returns:
+        pandas.Series of 'male', 'female' or 'unknown' (blank and unrecognised values)
+    """
+    codes, values = pd.factorize(series.fillna('').astype(str))
+    keys = pd.Series(values, dtype=object).str.lower().str.replace(r'[^a-z]', '', regex=True)
+    genders = keys.map(GENDER_VALUES).fillna(UNKNOWN_GENDER).to_numpy()
+    return pd.Series(genders[codes] if len(genders) else UNKNOWN_GENDER, index=series.index, dtype=object)
+
+
+def clean_names(df):
+    """
+    Normalize and validate input names in bulk
+
+    Args:
+        df: DataFrame with raw First Name, Last Name and Gender columns
+
+    Returns:
+        tuple: (names, rejected). ``names`` holds the valid rows with cleaned
+        First Name, Last Name, Gender and Suffix columns. ``rejected`` holds the
+        raw values of every other row with a Reason column. Both keep ``df``'s index.
+    """
+    first_names, first_suffixes, first_reasons = _clean_name_column(
+        df['First Name'], FIRST_NAME_SUFFIXES, 'first name')
+    last_names, last_suffixes, last_reasons = _clean_name_column(df['Last Name'], LAST_NAME_SUFFIXES, 'last name')
+    reasons = first_reasons.where(first_reasons != '', last_reasons)
+    valid = reasons == ''
+
+    names = pd.DataFrame({
+        'First Name': first_names[valid],
+        'Last Name': last_names[valid],
+        'Gender': normalize_genders(df['Gender'][valid]),
+        'Suffix': last_suffixes[valid].where(last_suffixes[valid] != '', first_suffixes[valid]),
+    })
+    rejected = df[~valid].assign(Reason=reasons[~valid])
+    return names, rejected
@@ -0,0 +1,4 @@
+import os
+
+# Per-user directory for caches, journals and other state kept between runs
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".ar_registry_processor")
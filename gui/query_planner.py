@@ -0,0 +1,111 @@
+from gui.names import normalize_name
+from gui.search_backends import (
+    FIRST_NAME_FIELDS, GENDER_FIELDS, NO_RESULTS, WARNING, DetailedResult, record_field, registrant_match
+)
+
+# Source written for rows answered from their group's last-name search
+GROUP_SOURCE = 'group search'
+
+
+def gender_matches(row_gender, registrant_gender):
+    """
+    Return True if a search with the row's gender would include the registrant
+
+    An unknown gender on either side matches anyone; otherwise the first
+    letters are compared, so 'male', 'Male' and 'M' are the same.
+    """
+    row_gender = normalize_name(row_gender)
+    registrant_gender = normalize_name(registrant_gender)
+    if row_gender in ('', 'unknown') or registrant_gender in ('', 'unknown', 'u'):
+        return True
+    return row_gender[0] == registrant_gender[0]
+
+
+def match_row(registrants, first_name, gender):
+    """
+    Answer one row from the registrants found by its group's last-name search
+
+    A registrant matches when their first name starts with the row's, as in
+    a live search, and their gender does not rule them out. A registrant
+    listed without a first name matches anyone.
+
+    Returns:
+        str: 'warning' (listing the matched registrants) if a search for this
+        row would find someone, else 'no results found'
+    """
+    first_name = normalize_name(first_name)
+    matches = []
+    for registrant in registrants:
+        registrant_first = normalize_name(record_field(registrant, FIRST_NAME_FIELDS))
+        if registrant_first.startswith(first_name) or not registrant_first:
+            if gender_matches(gender, record_field(registrant, GENDER_FIELDS)):
+                matches.append(registrant_match(registrant))
+    return DetailedResult(WARNING, matches) if matches else NO_RESULTS
+
+
+class SurnamePlanner:
+    """
+    Plans one last-name search for rows that share a last name.
+
+    Rows are grouped by normalized last name. Each group large enough to
+    save searches is answered by a single last-name-only search whose
+    registrants are matched against every row locally. A group whose search
+    fails, is paged, or returns more than max_results registrants is left for
+    the usual per-row searches.
+    """
+
+    def __init__(self, min_rows=2, max_results=50):
+        """
+        Initialize the planner
+
+        Args:
+            min_rows: Smallest group worth a last-name search
+            max_results: Most registrants a group's search may return before
+                the group falls back to per-row searches
+        """
+        self.min_rows = max(2, int(min_rows))
+        self.max_results = max_results
+        self.groups_searched = 0
+        self.rows_answered = 0
+        self.fallbacks = 0
+
+    def plan(self, tasks):
+        """
+        Group rows by last name
+
+        Args:
+            tasks: (index, first, last, gender) rows still to be searched
+
+        Returns:
+            list: (last name to search, rows) for every group of at least min_rows
+            rows, in order of each group's first row
+        """
+        groups = {}
+        for task in tasks:
+            last_name = normalize_name(task[2])
+            if last_name:
+                groups.setdefault(last_name, []).append(task)
+        return [(rows[0][2].strip(), rows) for rows in groups.values() if len(rows) >= self.min_rows]
+
+    def resolve(self, rows, response):
+        """
+        Answer a group's rows from its last-name search
+
+        Args:
+            rows: The group's (index, first, last, gender) rows
+            response: What SearchBackend.search_last_name returned
+
+        Returns:
+            dict: row index -> result, or None if the rows must be searched one by one
+        """
+        self.groups_searched += 1
+        if response is None:
+            self.fallbacks += 1
+            return None
+        registrants, complete = response
+        if not complete or len(registrants) > self.max_results:
+            self.fallbacks += 1
+            return None
+
+        self.rows_answered += len(rows)
+        return {idx: match_row(registrants, first_name, gender) for idx, first_name, _, gender in rows}
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every search worker.
+
+    A single limiter caps the combined request rate across all browser
+    sessions, so adding workers never exceeds the global budget.
+    """
+
+    def __init__(self, rate=None, burst=1):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate: Maximum searches per second across all workers (None = unlimited)
+            burst: Number of searches that may start back to back
+        """
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def current_rate(self):
+        """Current searches per second across all workers (None = unlimited)"""
+        return self.rate
+
+    def record(self, latency, outcome):
+        """Report a finished search; a fixed-rate limiter ignores it"""
+        pass
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    def try_acquire(self):
+        """
+        Take a token if one is available, without waiting
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one may be
+        """
+        if not self.rate:
+            return 0
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, should_stop=None):
+        """
+        Block until a search may start
+
+        Args:
+            should_stop: Optional callable; waiting is abandoned once it returns True
+
+        Returns:
+            bool: True if a token was taken, False if waiting was abandoned
+        """
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return True
+            if should_stop and should_stop():
+                return False
+            # Sleep in short slices so a stop request is noticed promptly
+            time.sleep(min(wait, 0.25))
+
+    async def acquire_async(self, should_stop=None):
+        """Like acquire(), but waits with asyncio.sleep so other lookups keep running"""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return True
+            if should_stop and should_stop():
+                return False
+            await asyncio.sleep(min(wait, 0.25))
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Token bucket whose rate follows how the site is coping (AIMD).
+
+    Every finished search is reported through record(). Fast successful
+    searches raise the rate additively; slow searches and errors cut it
+    multiplicatively. Timeouts additionally pause every worker for an
+    exponentially growing backoff until a search succeeds again.
+    """
+
+    def __init__(self, rate=1.0, max_rate=None, min_rate=0.1, increase=0.1, decrease=0.5,
+                 slow_factor=2.0, backoff_base=2.0, backoff_max=60.0, burst=1):
+        """
+        Initialize the adaptive rate limiter
+
+        Args:
+            rate: Starting searches per second across all workers
+            max_rate: Ceiling for the rate (None = no ceiling)
+            min_rate: Floor for the rate
+            increase: Searches per second added after each healthy search
+            decrease: Factor the rate is multiplied by after a slow or failed search
+            slow_factor: A search slower than this multiple of the typical
+                latency counts as a slowdown
+            backoff_base: Pause in seconds after the first consecutive timeout
+            backoff_max: Longest pause in seconds
+            burst: Number of searches that may start back to back
+        """
+        super().__init__(rate=rate, burst=burst)
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_factor = slow_factor
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.typical_latency = None
+        self.consecutive_timeouts = 0
+        self._paused_until = 0.0
+
+    def record(self, latency, outcome):
+        """
+        Adjust the rate after a search
+
+        Args:
+            latency: Seconds the search took
+            outcome: 'ok', 'error' or 'timeout'
+        """
+        with self._lock:
+            self._refill()
+            if outcome == 'timeout':
+                self.consecutive_timeouts += 1
+                pause = min(self.backoff_base * 2 ** (self.consecutive_timeouts - 1), self.backoff_max)
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                self._slow_down()
+                return
+
+            self.consecutive_timeouts = 0
+            slow = self.typical_latency is not None and latency > self.typical_latency * self.slow_factor
+            if outcome == 'ok':
+                # Exponentially weighted average of healthy latencies
+                if self.typical_latency is None:
+                    self.typical_latency = latency
+                else:
+                    self.typical_latency = 0.9 * self.typical_latency + 0.1 * latency
+
+            if outcome == 'error' or slow:
+                self._slow_down()
+            else:
+                self.rate = self.rate + self.increase
+                if self.max_rate:
+                    self.rate = min(self.rate, self.max_rate)
+
+    def _slow_down(self):
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def try_acquire(self):
+        # Honour any timeout backoff before taking a token
+        with self._lock:
+            remaining = self._paused_until - time.monotonic()
+        if remaining > 0:
+            return remaining
+        return super().try_acquire()
@@ -4,32 +4,231 @@ import os
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import Select
-import openpyxl
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, TimeoutException
 from datetime import datetime
 import sys
-import platform
-from webdriver_manager.chrome import ChromeDriverManager
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from gui.driver_health import HAS_PSUTIL, DriverHealth, RestartStats
+from gui.driver_manifest import DriverManifest
+from gui.input_reader import NAME_COLUMNS, ColumnMapping, read_names_with_rejects
+from gui.metrics import RunMetrics
+from gui.names import name_key
+from gui.query_planner import GROUP_SOURCE, SurnamePlanner
+from gui.rate_limiter import AdaptiveRateLimiter, RateLimiter
+from gui.registry_snapshot import DEFAULT_SNAPSHOT_PATH, MIN_REGISTRANTS, RegistrySnapshot
+from gui.result_cache import CACHEABLE_RESULTS, DEFAULT_CACHE_PATH, ResultCache
+from gui.run_journal import DEFAULT_JOURNAL_DIR, RunJournal
+from gui.result_writer import MAX_COLUMN_WIDTH, create_result_writer
+from gui.retry_queue import RetryQueue
+from gui.search_backends import (
+    NO_RESULTS, TIMEOUT, UNKNOWN_ERROR, WARNING, DetailedResult, HttpSearchBackend,
+    SeleniumSearchBackend, match_columns, result_matches, search_outcome
+)
+from gui.waits import WaitStrategy, WaitTimings
+from gui.worker_pool import SearchWorkerPool
+
+REGISTRY_URL = 'https://sexoffenderregistry.ar.gov/public/#/'
+
+# Locators for the public registry SPA
+DISCLAIMER_BUTTON = (By.XPATH, "//button[contains(.,'I Agree to the Disclaimer Above')]")
+NAME_SEARCH_TAB = (By.XPATH, "//*[contains(text(),'Name Search')]")
+FIRST_NAME_FIELD = (By.XPATH, "//input[@id='firstName']")
+LAST_NAME_FIELD = (By.XPATH, "//input[@id='lastName']")
+GENDER_SELECT = (By.XPATH, "//select[@id='gender']")
+SEARCH_BUTTON = (By.XPATH, "//button[@type='submit' and contains(.,'Search')]")
+# Any element that marks a finished search: the "No results" panel or a result card
+RESULT_CSS = ".no-result, .col-12.col-md-auto.text-center.text-start-md"
+# Reads the whole result region in one round trip: the "No results" panel,
+# or every result card with the registrant's name, age, county and link.
+# Elements the wait marked stale belong to the previous search and are skipped.
+RESULT_EXTRACT_SCRIPT = """
+var empty = document.querySelector('div.no-result:not([data-ar-stale])');
+if (empty && empty.textContent.indexOf('No results') !== -1) {
+    return {outcome: 'none', count: 0, matches: []};
+}
+var cards = document.querySelectorAll('div.col-12.col-md-auto.text-center.text-start-md:not([data-ar-stale])');
+if (!cards.length) {
+    return {outcome: 'unknown', count: 0, matches: []};
+}
+var matches = [];
+for (var i = 0; i < cards.length; i++) {
+    var card = cards[i];
+    var text = (card.innerText || card.textContent || '').trim();
+    var lines = text.split(/\\n+/).map(function (line) { return line.trim(); }).filter(Boolean);
+    var heading = card.querySelector('h1, h2, h3, h4, h5, h6, strong, b, .name');
+    var age = /\\bAge:?\\s*(\\d{1,3})\\b/i.exec(text);
+    var county = /\\bCounty:[ \\t]*([A-Za-z .'-]+)/i.exec(text) || /([A-Za-z.'-]+(?: [A-Za-z.'-]+)?) County\\b/.exec(text);
+    var link = card.querySelector('a[href]') || card.closest('a[href]');
+    matches.push({
+        name: heading ? heading.textContent.trim() : (lines[0] || ''),
+        age: age ? age[1] : '',
+        county: county ? county[1].trim() : '',
+        link: link ? link.href : ''
+    });
+}
+return {outcome: 'matches', count: matches.length, matches: matches};
+"""
+PAGE_HEALTH_SCRIPT = """
+return !!window.__arTracker
+    && !!document.getElementById('firstName')
+    && !!document.getElementById('lastName')
+    && !!document.getElementById('gender');
+"""
+# Lean browser profile: content nobody reads during a name search
+LEAN_CONTENT_SETTINGS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+    "profile.default_content_setting_values.popups": 2,
+}
+LEAN_CHROME_ARGS = (
+    '--blink-settings=imagesEnabled=false',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-notifications',
+    '--mute-audio',
+    '--no-first-run',
+)
+# Requests dropped by the browser in lean mode: registrant photos, web fonts,
+# media, maps and analytics. Scripts, stylesheets and API calls still load.
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.bmp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3',
+    '*fonts.googleapis.com*', '*fonts.gstatic.com*',
+    '*maps.googleapis.com*', '*maps.gstatic.com*', '*arcgis.com*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+]
+# Errors after which the Chrome session cannot serve another search
+SESSION_LOST_ERRORS = (InvalidSessionIdException, NoSuchWindowException)
+SESSION_LOST_MESSAGES = ('chrome not reachable', 'disconnected', 'session deleted')
 
 class RegistryProcessor:
-    def __init__(self, progress_callback=None, status_callback=None):
+    BACKENDS = ('selenium', 'http')
+    
+    def __init__(self, progress_callback=None, status_callback=None, workers=1, rate_limit=None,
+                 adaptive_rate=True, backend='selenium', api_url=None, warm_page=True,
+                 use_cache=True, refresh_cache=False, cache_path=DEFAULT_CACHE_PATH, cache_ttl_days=30,
+                 resume=False, journal_dir=DEFAULT_JOURNAL_DIR, column_mapping=None,
+                 max_attempts=3, retry_delay=5.0, recycle_after=250, lean_browser=True,
+                 registry_url=REGISTRY_URL, use_snapshot=False, snapshot_path=DEFAULT_SNAPSHOT_PATH,
+                 snapshot_url=None, snapshot_max_age_days=7, snapshot_min_registrants=MIN_REGISTRANTS,
+                 coalesce=False, coalesce_min_rows=2, coalesce_max_results=50, result_callback=None):
         """
         Initialize the registry processor
         
         Args:
-            progress_callback: Function to call with progress updates (current, total, name)
+            progress_callback: Function to call with progress updates
+                (current, total, name, rate), rate being searches per second or None
             status_callback: Function to call with status messages
+            workers: Number of headless browsers or HTTP sessions searching in parallel
+                (browsers are capped at the machine's core count)
+            rate_limit: Maximum searches per second across all browsers (None = unlimited)
+            adaptive_rate: Adapt the search rate to observed latency, errors and timeouts,
+                starting from rate_limit (or one search per second per worker)
+            backend: 'selenium' to drive the public site in Chrome, or 'http' to call
+                the search endpoint directly
+            api_url: Search endpoint used by the 'http' backend; required with it, as
+                the registry's endpoint has no confirmed address to default to
+            warm_page: Keep the Name Search form loaded between searches instead of
+                re-navigating to the site for every name
+            use_cache: Reuse recent results from the on-disk result cache
+            refresh_cache: Search every name again, overwriting cached results
+            cache_path: SQLite file holding the result cache
+            cache_ttl_days: Age in days after which cached results are searched again
+            resume: Skip rows already completed by an unfinished run of the same input file
+            journal_dir: Directory for the per-input-file result journals
+            column_mapping: ColumnMapping, dict or path to a JSON mapping saying where
+                the names are in the input; None auto-detects from the header row
+            max_attempts: Tries per name before a timeout or error is written as its
+                result; failed names are retried later in the run (1 = no retries)
+            retry_delay: Seconds before the first retry of a failed name, doubling
+                (with jitter) for each further try
+            recycle_after: Searches after which a browser is replaced with a fresh one
+                (None = only when it becomes unhealthy)
+            lean_browser: Skip images, fonts, maps and analytics, and start working on
+                a page as soon as its DOM is ready instead of after every asset loads
+            registry_url: Address of the public registry site, e.g. a local stand-in
+                for offline benchmarks
+            use_snapshot: Answer names that match no registrant in a local snapshot of the
+                registrant list without searching; only candidates go to the live site
+            snapshot_path: Saved registrant snapshot
+            snapshot_url: Address to download a fresh registrant list from when the
+                snapshot is missing or stale (None = only use imported snapshots)
+            snapshot_max_age_days: Age in days after which the snapshot is not trusted
+            snapshot_min_registrants: Fewest registrants a snapshot must hold to be
+                trusted; a smaller one is taken for a bad import and not used
+            coalesce: Answer rows that share a last name from one last-name search
+                (http backend)
+            coalesce_min_rows: Smallest group of rows worth a last-name search
+            coalesce_max_results: Most registrants a last-name search may return before
+                its rows are searched one by one
+            result_callback: Function to call as each row's result is written
+                (row index, result, source), row index counting valid input rows from 0
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown search backend: {backend}")
+        if backend == 'http' and not api_url:
+            raise ValueError("The http backend needs the registry's search API URL (api_url)")
         self.progress_callback = progress_callback
         self.status_callback = status_callback
+        self.result_callback = result_callback
         self.driver = None
         self.should_stop = False
         self.disclaimer_accepted = False  # Track if disclaimer has been accepted
+        self.workers = max(1, int(workers))
+        cores = os.cpu_count() or 1
+        if backend == 'selenium' and self.workers > cores:
+            # Each browser keeps a core busy; HTTP sessions only wait on the network
+            self._log_status(f"Limiting browsers to {cores} of the {self.workers} requested, one per CPU core")
+            self.workers = cores
+        if adaptive_rate:
+            self.rate_limiter = AdaptiveRateLimiter(rate=rate_limit or float(self.workers), max_rate=rate_limit)
+        else:
+            self.rate_limiter = RateLimiter(rate_limit)
+        self.backend = backend
+        self.api_url = api_url
+        self._backend = None
+        self.waits = None
+        self.warm_page = warm_page
+        self._page_ready = False
+        self.wait_timings = WaitTimings()
+        self.metrics = RunMetrics()
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
+        self.cache_path = cache_path
+        self.cache_ttl_days = cache_ttl_days
+        self.cache = None
+        self.resume = resume
+        self.journal_dir = journal_dir
+        self.journal = None
+        self.column_mapping = ColumnMapping.coerce(column_mapping)
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.retry_queue = None
+        self.recycle_after = recycle_after
+        self.lean_browser = lean_browser
+        self.registry_url = registry_url
+        self.use_snapshot = use_snapshot
+        self.snapshot_path = snapshot_path
+        self.snapshot_url = snapshot_url
+        self.snapshot_max_age_days = snapshot_max_age_days
+        self.snapshot_min_registrants = snapshot_min_registrants
+        self.coalesce = coalesce
+        self.coalesce_min_rows = coalesce_min_rows
+        self.coalesce_max_results = coalesce_max_results
+        self.driver_health = DriverHealth(max_searches=recycle_after)
+        self.restart_stats = RestartStats()
+        self.run_summary = {}
+        self.rejected_rows = pd.DataFrame()
         
     def _log_status(self, message):
         """Log status message to callback if available"""
@@ -38,9 +237,40 @@ class RegistryProcessor:
         print(message)  # Also print for debugging
     
     def _update_progress(self, current, total, name=""):
-        """Update progress via callback if available"""
+        """Update progress via callback if available, including the current search rate"""
         if self.progress_callback:
-            self.progress_callback(current, total, name)
+            self.progress_callback(current, total, name, self.rate_limiter.current_rate)
+    
+    def _report_result(self, idx, result, source):
+        """Pass a written row's result to the result callback if available"""
+        if self.result_callback:
+            self.result_callback(idx, str(result), source)
+    
+    def create_backend(self, shared=False):
+        """
+        Build a search backend of the configured type
+        
+        Args:
+            shared: For the selenium backend, drive this processor's own browser
+                instead of a new worker processor
+        
+        Returns:
+            SearchBackend: A backend that has not been set up yet
+        """
+        if self.backend == 'http':
+            return HttpSearchBackend(self.api_url, status_callback=self.status_callback)
+        processor = self if shared else self._spawn_worker()
+        return SeleniumSearchBackend(processor)
+    
+    def _spawn_worker(self):
+        """Create a processor for a pool worker with this processor's settings"""
+        worker = RegistryProcessor(status_callback=self.status_callback, warm_page=self.warm_page,
+                                   recycle_after=self.recycle_after, lean_browser=self.lean_browser,
+                                   registry_url=self.registry_url)
+        worker.wait_timings = self.wait_timings
+        worker.metrics = self.metrics
+        worker.restart_stats = self.restart_stats
+        return worker
     
     def setup_driver(self):
         """Initialize the headless Chrome driver"""
@@ -49,6 +279,13 @@ class RegistryProcessor:
             chrome_options = Options()
             # Disable location requests
             prefs = {"profile.default_content_setting_values.geolocation": 2}
+            if self.lean_browser:
+                prefs.update(LEAN_CONTENT_SETTINGS)
+                for argument in LEAN_CHROME_ARGS:
+                    chrome_options.add_argument(argument)
+                # Return from driver.get() at DOMContentLoaded; the waits decide when
+                # the app is actually usable
+                chrome_options.page_load_strategy = 'eager'
             chrome_options.add_experimental_option("prefs", prefs)
             # Headless mode configuration
             chrome_options.add_argument('--headless=new')
@@ -58,234 +295,355 @@ class RegistryProcessor:
             chrome_options.add_argument('--window-size=1920,1080')
             chrome_options.add_argument('--disable-web-security')
             chrome_options.add_argument('--disable-features=VizDisplayCompositor')
-            # Use webdriver-manager to handle ChromeDriver
-            service = Service(ChromeDriverManager().install())
+            # Use the pinned ChromeDriver; webdriver-manager is only consulted
+            # on the first run and after Chrome has been upgraded
+            service = Service(DriverManifest().resolve(self._log_status))
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            if self.lean_browser:
+                self._block_resources()
+                ready_states = ('interactive', 'complete')
+            else:
+                ready_states = ('complete',)
+            self.waits = WaitStrategy(self.driver, timings=self.wait_timings, ready_states=ready_states)
             self._log_status("Browser initialized successfully")
             return True
         except Exception as e:
             self._log_status(f"Error initializing browser: {str(e)}")
             return False
     
+    def _block_resources(self):
+        """Tell the browser to drop requests matching BLOCKED_URL_PATTERNS"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            # Only an optimization; searches work without it
+            self._log_status(f"Could not set up resource blocking: {str(e)}")
+    
+    def restart_driver(self, kind, reason):
+        """
+        Replace the browser with a fresh session
+        
+        The new session starts on a clean profile, so the disclaimer is
+        accepted again on its first search.
+        
+        Args:
+            kind: Short restart category for the run summary ('age', 'memory', ...)
+            reason: Human-readable reason for the status log
+        
+        Returns:
+            bool: True if the new browser started
+        """
+        self.restart_stats.add(kind)
+        self._log_status(f"Restarting browser: {reason} (restart {self.restart_stats.total} this run)")
+        self._page_ready = False
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception:
+                # The old session may already be dead
+                pass
+            self.driver = None
+        self.disclaimer_accepted = False
+        self.driver_health.reset()
+        return self.setup_driver()
+    
     def read_excel_file(self, file_path):
         """
-        Read names from Excel file
+        Read names from an input file (.xlsx, .xls, .ods or .csv)
+        
+        Columns come from the processor's column mapping; unset columns are
+        detected from the header row, falling back to the original B/D/G,
+        start-at-row-4 layout.
         
         Args:
-            file_path: Path to the Excel file
+            file_path: Path to the input file
             
+        Names are normalized in bulk; invalid rows are left out and kept in
+        ``rejected_rows`` with the reason.
+        
         Returns:
-            pandas.DataFrame with columns: First Name, Last Name, Gender
+            pandas.DataFrame with columns: First Name, Last Name, Gender, Suffix
         """
         try:
-            self._log_status(f"Reading Excel file: {os.path.basename(file_path)}")
-            
-            wb = openpyxl.load_workbook(file_path)
-            ws = wb.active
+            self._log_status(f"Reading input file: {os.path.basename(file_path)}")
             
-            rows = []
-            row_num = 4  # Start from row 4 (assuming headers in row 3)
+            df, self.rejected_rows = read_names_with_rejects(file_path, self.column_mapping)
             
-            while True:
-                first_name = ws[f'B{row_num}'].value
-                last_name = ws[f'D{row_num}'].value
-                gender = ws[f'G{row_num}'].value
-                
-                # Stop if we hit empty rows
-                if not first_name and not last_name:
-                    break
-                
-                # Only add if we have both first and last name
-                if first_name and last_name:
-                    gender_value = gender.lower() if gender else 'unknown'
-                    rows.append({
-                        'First Name': str(first_name).strip(),
-                        'Last Name': str(last_name).strip(),
-                        'Gender': gender_value
-                    })
-                
-                row_num += 1
-            
-            df = pd.DataFrame(rows)
             self._log_status(f"Found {len(df)} valid names to process")
+            if len(self.rejected_rows):
+                reasons = self.rejected_rows['Reason'].value_counts()
+                self._log_status(f"Rejected {len(self.rejected_rows)} rows: "
+                                 + ", ".join(f"{count} {reason}" for reason, count in reasons.items()))
             return df
             
         except Exception as e:
-            self._log_status(f"Error reading Excel file: {str(e)}")
+            self._log_status(f"Error reading input file: {str(e)}")
             return None
     
-    def search_single_name(self, first_name, last_name, gender):
-        """
-        Search a single name in the registry
+    def _load_search_page(self):
+        """Navigate to the registry, accept the disclaimer and open the Name Search form"""
+        waits = self.waits
+        metrics = self.metrics
+        self._page_ready = False
         
-        Returns:
-            str: 'no results found', 'warning', or error message
-        """
-        url = 'https://sexoffenderregistry.ar.gov/public/#/'
+        with metrics.stage('navigate'):
+            self.driver.get(self.registry_url)
+            waits.document_ready()
+            waits.angular_stable()
         
-        try:
-            self.driver.get(url)
-            time.sleep(2)
-            
-            # Handle disclaimer if present, only on first search
-            if not self.disclaimer_accepted:
+        # Handle disclaimer if present, only on first search
+        if not self.disclaimer_accepted:
+            with metrics.stage('disclaimer'):
                 try:
-                    agree_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(.,'I Agree to the Disclaimer Above')]") )
-                    )
+                    agree_button = waits.clickable(DISCLAIMER_BUTTON, name='disclaimer', timeout=5)
                     # Scroll to the very bottom of the page
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(0.7)
+                    waits.clickable(DISCLAIMER_BUTTON, name='disclaimer', timeout=2)
                     # Force click the button with JavaScript
                     self.driver.execute_script("arguments[0].click();", agree_button)
-                    time.sleep(1)
                     self.disclaimer_accepted = True
+                    try:
+                        waits.gone(DISCLAIMER_BUTTON, name='disclaimer', timeout=5)
+                    except TimeoutException:
+                        pass
                 except Exception as e:
                     self._log_status(f"Disclaimer button not found or not clickable: {e}")
                     # Even if not found, set as accepted to avoid repeated attempts
                     self.disclaimer_accepted = True
-            
-            # Click Name Search tab
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//*[contains(text(),'Name Search')]"))
-            ).click()
-            time.sleep(2)
-            
-            # Fill in form fields
-            first_name_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@id='firstName']"))
-            )
-            last_name_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@id='lastName']"))
-            )
+        
+        # Click Name Search tab
+        with metrics.stage('tab_click'):
+            waits.clickable(NAME_SEARCH_TAB, name='name_search_tab').click()
+            waits.present(FIRST_NAME_FIELD, name='form_ready')
+            waits.present(LAST_NAME_FIELD, name='form_ready')
+            waits.angular_stable()
+            waits.install_tracker(RESULT_CSS)
+        self._page_ready = True
+    
+    def _page_is_healthy(self):
+        """
+        Check in one round trip that the loaded page can take another search
+        
+        The tracker disappears on any navigation or SPA reload, and the form
+        fields disappear if the app has left the Name Search view.
+        """
+        if not self._page_ready:
+            return False
+        try:
+            return bool(self.driver.execute_script(PAGE_HEALTH_SCRIPT))
+        except Exception:
+            return False
+    
+    def _search_loaded_page(self, first_name, last_name, gender):
+        """Fill and submit the Name Search form on the current page and classify the result"""
+        waits = self.waits
+        metrics = self.metrics
+        
+        # Fill in form fields
+        with metrics.stage('form_fill'):
+            first_name_field = self.driver.find_element(*FIRST_NAME_FIELD)
+            last_name_field = self.driver.find_element(*LAST_NAME_FIELD)
             
             first_name_field.clear()
             first_name_field.send_keys(first_name)
             first_name_field.send_keys(Keys.TAB)
-            time.sleep(0.5)
+            waits.value_settled(first_name_field, first_name)
             
             last_name_field.clear()
             last_name_field.send_keys(last_name)
             last_name_field.send_keys(Keys.TAB)
-            time.sleep(0.5)
+            waits.value_settled(last_name_field, last_name)
             
             # Set gender
-            gender_select = Select(self.driver.find_element(By.XPATH, "//select[@id='gender']"))
+            gender_select = Select(self.driver.find_element(*GENDER_SELECT))
             gender_select.select_by_value(gender)
-            
-            # Click search
-            search_button = self.driver.find_element(By.XPATH, "//button[@type='submit' and contains(.,'Search')]")
+        
+        # Click search, then wait for a result element to be rendered
+        with metrics.stage('submit'):
+            marker = waits.install_tracker(RESULT_CSS)
+            search_button = self.driver.find_element(*SEARCH_BUTTON)
             search_button.click()
-            time.sleep(2)
-            
-            # Check results
+        
+        with metrics.stage('result_wait'):
             try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(@class,'no-result') or contains(@class,'col-12 col-md-auto text-center text-start-md')]"))
-                )
-                
-                # Check for no results
-                try:
-                    self.driver.find_element(By.XPATH, "//div[contains(@class,'no-result') and contains(.,'No results')]")
-                    return 'no results found'
-                except Exception:
-                    # Check for results card
-                    try:
-                        self.driver.find_element(By.XPATH, "//div[contains(@class,'col-12 col-md-auto text-center text-start-md')]")
-                        return 'warning'
-                    except Exception:
-                        return 'unknown error'
-                        
+                waits.result_changed(marker, timeout=10)
+                waits.network_idle(timeout=5)
             except TimeoutException:
                 return 'timeout or no result element found'
+        
+        # Read the outcome and any matched registrants in one call
+        with metrics.stage('classify'):
+            payload = self.driver.execute_script(RESULT_EXTRACT_SCRIPT) or {}
+        outcome = payload.get('outcome')
+        if outcome == 'none':
+            return NO_RESULTS
+        if outcome == 'matches':
+            return DetailedResult(WARNING, payload.get('matches'))
+        return UNKNOWN_ERROR
+    
+    def search_single_name(self, first_name, last_name, gender):
+        """
+        Search a single name in the registry
+        
+        In warm page mode the SPA is loaded once and only the form is refilled
+        for each name; the page is reloaded when it is found in a broken state.
+        The browser itself is restarted when its health monitor says so.
+        
+        Returns:
+            str: 'no results found', 'warning', or error message
+        """
+        if self.driver is None:
+            restart = ('session', "browser is not running")
+        else:
+            restart = self.driver_health.check(self.driver)
+        if restart and not self.restart_driver(*restart):
+            return 'Error: browser could not be restarted'
+        
+        started = time.perf_counter()
+        session_lost = False
+        try:
+            result = None
+            if self.warm_page and self._page_is_healthy():
+                try:
+                    result = self._search_loaded_page(first_name, last_name, gender)
+                except Exception as e:
+                    self._log_status(f"Search page in a bad state ({e.__class__.__name__}), reloading")
+            
+            if result is None:
+                self._load_search_page()
+                result = self._search_loaded_page(first_name, last_name, gender)
                 
         except Exception as e:
-            return f'Error: {str(e)}'
+            self._page_ready = False
+            session_lost = isinstance(e, SESSION_LOST_ERRORS) or \
+                any(message in str(e).lower() for message in SESSION_LOST_MESSAGES)
+            result = f'Error: {str(e)}'
+        
+        self.driver_health.record(time.perf_counter() - started, search_outcome(result), session_lost)
+        return result
     
     def process_file(self, file_path, output_path):
         """
-        Process entire Excel file
+        Process an entire input file
         
         Args:
-            file_path: Path to input Excel file
-            output_path: Path for output Excel file
+            file_path: Path to input file (.xlsx, .xls, .ods or .csv)
+            output_path: Path for the output file (.xlsx, or .csv for plain text)
             
         Returns:
             bool: True if successful, False if failed
         """
+        writer = None
         try:
-            # Read Excel file
-            df = self.read_excel_file(file_path)
-            if df is None or len(df) == 0:
-                self._log_status("No valid data found in Excel file")
-                return False
+            self.metrics.start()
             
-            # Setup browser
-            if not self.setup_driver():
+            # Read input file
+            with self.metrics.stage('read'):
+                df = self.read_excel_file(file_path)
+            if df is None or len(df) == 0:
+                self._log_status("No valid data found in input file")
                 return False
             
-            results = []
             total_names = len(df)
+            # Suffixes (Jr, III) are not searched, but are written out so rows match the input
+            suffixes = df['Suffix'].tolist() if 'Suffix' in df else [''] * total_names
+            tasks = [
+                (idx, first_name, last_name, gender)
+                for idx, (first_name, last_name, gender) in enumerate(df[NAME_COLUMNS].itertuples(index=False, name=None))
+            ]
             
-            self._log_status(f"Starting to process {total_names} names...")
+            self.run_summary = {'Names in file': total_names, 'Rows rejected': len(self.rejected_rows)}
+            journaled = self._open_journal(file_path, tasks)
+            keys = [name_key(first_name, last_name, gender) for _, first_name, last_name, gender in tasks]
+            known = {
+                keys[idx]: (DetailedResult(record['Result'], record.get('Registrants')), 'duplicate')
+                for idx, record in journaled.items()
+                if record['Result'] in CACHEABLE_RESULTS
+            }
             
-            for idx, row in df.iterrows():
-                if self.should_stop:
-                    self._log_status("Processing stopped by user")
-                    break
-                
-                first_name = row['First Name']
-                last_name = row['Last Name']
-                gender = row['Gender']
+            unique_tasks = self._dedupe([task for task in tasks if task[0] not in journaled], keys)
+            unique_tasks = [task for task in unique_tasks if keys[task[0]] not in known]
+            with self.metrics.stage('cache_lookup'):
+                known.update(self._lookup_cache(unique_tasks, keys))
+            pending = [task for task in unique_tasks if keys[task[0]] not in known]
+            with self.metrics.stage('prescreen'):
+                known.update(self._prescreen(pending, keys))
+            pending = [task for task in pending if keys[task[0]] not in known]
+            known.update(self._coalesce(pending, keys))
+            pending = [task for task in pending if keys[task[0]] not in known]
+            
+            search_results = self._search(pending, total_names)
+            if search_results is None:
+                return False
+            
+            # Rows are streamed to the output as they complete, in input order
+            writer = create_result_writer(output_path, widths=self._output_widths(df))
+            
+            for idx, result, source in self._merge_results(tasks, keys, known, search_results, journaled):
+                if idx in journaled:
+                    with self.metrics.stage('write'):
+                        writer.write_row(journaled[idx])
+                    self._report_result(idx, result, source)
+                    continue
                 
-                current_name = f"{first_name} {last_name}"
-                self._update_progress(idx + 1, total_names, current_name)
+                _, first_name, last_name, gender = tasks[idx]
                 
-                # Search registry
-                result = self.search_single_name(first_name, last_name, gender)
+                if source in ('search', GROUP_SOURCE) and self.cache:
+                    self.cache.put(first_name, last_name, gender, result)
                 
-                results.append({
+                record = {
                     'First Name': first_name,
                     'Last Name': last_name,
+                    'Suffix': suffixes[idx],
                     'Gender': gender,
-                    'Result': result,
-                    'Processed Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-                
-                # Brief delay between searches
-                time.sleep(1)
+                    'Result': str(result),
+                    **match_columns(result),
+                    'Source': source,
+                    'Processed Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    # Not an output column; kept in the journal so resumed rows keep their details
+                    'Registrants': result_matches(result),
+                }
+                with self.metrics.stage('write'):
+                    self.journal.append(idx, record)
+                    writer.write_row(record)
+                self._report_result(idx, result, source)
             
-            # Save results to Excel
-            results_df = pd.DataFrame(results)
+            self._summarize_retries()
+            if self.backend == 'selenium':
+                self.run_summary['Browser restarts'] = self.restart_stats.total
+                if self.restart_stats.total:
+                    self._log_status(f"Browser restarts: {self.restart_stats.format_summary()}")
             
-            # Create output directory if needed
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            if self.should_stop:
+                self._log_status("Processing stopped by user")
+            elif writer.rows_written < total_names:
+                self._log_status(f"Only {writer.rows_written} of {total_names} names could be searched")
             
-            # Save to Excel with formatting
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                results_df.to_excel(writer, sheet_name='Registry Results', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Registry Results']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            self.run_summary['Names processed'] = writer.rows_written
+            self.metrics.stop(writer.rows_written)
+            
+            # Finish the output file with the run summary and timing metrics
+            writer.write_summary(self.run_summary)
+            if len(self.rejected_rows):
+                writer.write_rejected(self.rejected_rows)
+            writer.write_metrics(self.metrics.table())
+            writer.close()
+            metrics_path = f"{os.path.splitext(output_path)[0]}_metrics.json"
+            self.metrics.write_json(metrics_path)
+            self._log_status(f"Run metrics: {self.metrics.format_summary()} (details in {os.path.basename(metrics_path)})")
+            
+            wait_summary = self.wait_timings.format_summary()
+            if wait_summary:
+                self._log_status(f"Wait times: {wait_summary}")
+            
+            if writer.rows_written == total_names:
+                # Run finished; nothing left to resume
+                self.journal.discard()
             
             self._log_status(f"Results saved to: {output_path}")
-            self._log_status(f"Processing complete! Processed {len(results)} names.")
+            self._log_status(f"Processing complete! Processed {writer.rows_written} names "
+                             f"in {self.metrics.elapsed:.1f}s.")
             
             return True
             
@@ -294,9 +652,383 @@ class RegistryProcessor:
             return False
         
         finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
+            if writer is not None:
+                # Keep the rows written so far if the run failed part way
+                try:
+                    writer.close()
+                except Exception as e:
+                    self._log_status(f"Could not finish the output file: {str(e)}")
+            self.cleanup()
+    
+    def _output_widths(self, df):
+        """
+        Longest expected value per output column, for sizing output columns
+        
+        Input columns are measured once on the DataFrame; the other columns
+        hold values from a fixed vocabulary.
+        """
+        widths = {
+            column: int(df[column].astype(str).str.len().max())
+            for column in ('First Name', 'Last Name', 'Gender')
+        }
+        widths['Suffix'] = len('Suffix')
+        widths['Result'] = max(len(result) for result in (NO_RESULTS, WARNING, TIMEOUT, UNKNOWN_ERROR))
+        widths['Matches'] = len('Matches')
+        widths['Matched Registrants'] = MAX_COLUMN_WIDTH
+        widths['Registrant Links'] = MAX_COLUMN_WIDTH
+        widths['Source'] = max(len(source) for source in ('duplicate', 'snapshot', GROUP_SOURCE))
+        widths['Processed Date'] = len('YYYY-MM-DD HH:MM:SS')
+        return widths
+    
+    def _open_journal(self, file_path, tasks):
+        """
+        Open the run journal for this input file
+        
+        Returns:
+            dict: row index -> result record for rows completed by an earlier,
+            unfinished run (empty unless resuming)
+        """
+        self.journal = RunJournal(file_path, journal_dir=self.journal_dir)
+        journaled = self.journal.load_matching(tasks) if self.resume else {}
+        self.journal.start(resume=bool(journaled))
+        
+        if journaled:
+            self._log_status(f"Resuming previous run: {len(journaled)} of {len(tasks)} rows already completed")
+        elif self.resume:
+            self._log_status("No unfinished run found for this file; starting from the beginning")
+        self.run_summary['Rows resumed from journal'] = len(journaled)
+        return journaled
+    
+    def _dedupe(self, tasks, keys):
+        """
+        Collapse rows that would run the same search
+        
+        Rows are identical when their normalized (first, last, gender) keys
+        match; only the first row of each key is searched.
+        
+        Args:
+            tasks: (index, first, last, gender) rows still to be answered
+            keys: Name key of every row in the file, by row index
+        
+        Returns:
+            list: The first row of each key, in input order
+        """
+        unique_tasks = []
+        seen = set()
+        for task in tasks:
+            key = keys[task[0]]
+            if key not in seen:
+                seen.add(key)
+                unique_tasks.append(task)
+        
+        saved = len(tasks) - len(unique_tasks)
+        self.run_summary['Unique names'] = len(unique_tasks)
+        self.run_summary['Searches saved by dedup'] = saved
+        if saved:
+            self._log_status(f"{saved} duplicate rows found; searching {len(unique_tasks)} unique names")
+        return unique_tasks
+    
+    def _lookup_cache(self, tasks, keys):
+        """
+        Answer whatever names the result cache can
+        
+        Returns:
+            dict: name key -> (cached result, 'cache')
+        """
+        known = {}
+        if not self.use_cache:
+            return known
+        
+        self.cache = ResultCache(self.cache_path, ttl_days=self.cache_ttl_days)
+        if self.refresh_cache:
+            self._log_status("Cache refresh requested; every name will be searched again")
+            return known
+        
+        for idx, first_name, last_name, gender in tasks:
+            result = self.cache.get(first_name, last_name, gender)
+            if result is not None:
+                known[keys[idx]] = (result, 'cache')
+        
+        self.run_summary['Cache hits'] = self.cache.hits
+        self.run_summary['Cache misses'] = self.cache.misses
+        self._log_status(f"Result cache: {self.cache.hits} hits, {self.cache.misses} misses "
+                         f"(TTL {self.cache_ttl_days} days)")
+        return known
+    
+    def _load_snapshot(self):
+        """
+        Load the registrant snapshot, downloading a fresh one if it is missing or stale
+
+        Returns:
+            RegistrySnapshot or None: None if there is no snapshot recent enough to trust
+        """
+        snapshot = RegistrySnapshot.load(self.snapshot_path)
+        stale = snapshot is None or snapshot.age_days > self.snapshot_max_age_days
+        if stale and self.snapshot_url:
+            self._log_status("Downloading a fresh registrant snapshot...")
+            try:
+                snapshot = RegistrySnapshot.pull(self.snapshot_url, self.snapshot_path,
+                                                 min_registrants=self.snapshot_min_registrants)
+                stale = False
+            except Exception as e:
+                self._log_status(f"Could not download the registrant snapshot: {str(e)}")
+        
+        if snapshot is None:
+            self._log_status("No registrant snapshot found; every name will be searched")
+            return None
+        if len(snapshot) < self.snapshot_min_registrants:
+            # Too small to be the full list, e.g. an import whose columns were not recognised
+            self._log_status(f"Registrant snapshot holds only {len(snapshot)} registrants "
+                             f"(at least {self.snapshot_min_registrants} expected); every name will be searched")
+            return None
+        if stale:
+            # A stale list may miss recent registrants, so it cannot clear anyone
+            self._log_status(f"Registrant snapshot is {snapshot.age_days:.0f} days old "
+                             f"(limit {self.snapshot_max_age_days}); every name will be searched")
+            return None
+        return snapshot
+    
+    def _prescreen(self, tasks, keys):
+        """
+        Answer names that match no registrant in the local snapshot
+        
+        Returns:
+            dict: name key -> ('no results found', 'snapshot') for every cleared name
+        """
+        known = {}
+        if not self.use_snapshot or not tasks:
+            return known
+        
+        snapshot = self._load_snapshot()
+        if snapshot is None:
+            return known
+        
+        for idx, first_name, last_name, _ in tasks:
+            if not snapshot.is_candidate(first_name, last_name):
+                known[keys[idx]] = (NO_RESULTS, 'snapshot')
+        
+        self.run_summary['Cleared by snapshot'] = len(known)
+        self.run_summary['Snapshot candidates'] = len(tasks) - len(known)
+        self._log_status(f"Registrant snapshot ({snapshot.describe()}): {len(known)} names cleared, "
+                         f"{len(tasks) - len(known)} candidates to search")
+        return known
+    
+    @property
+    def group_search_threads(self):
+        """Last-name searches run at once when coalescing"""
+        return self.workers
+    
+    def _coalesce(self, tasks, keys):
+        """
+        Answer rows that share a last name from one last-name search per group
+        
+        Groups whose search fails, is paged or returns too many registrants
+        are left for the per-row searches.
+        
+        Returns:
+            dict: name key -> (result, 'group search') for every answered row
+        """
+        known = {}
+        if not self.coalesce or not tasks:
+            return known
+        if self.backend != 'http':
+            self._log_status("Last-name grouping needs the http backend; searching each name on its own")
+            return known
+        
+        planner = SurnamePlanner(min_rows=self.coalesce_min_rows, max_results=self.coalesce_max_results)
+        groups = planner.plan(tasks)
+        if not groups:
+            return known
+        
+        threads = max(1, self.group_search_threads)
+        backend = HttpSearchBackend(self.api_url, status_callback=self.status_callback, pool_size=threads)
+        backend.setup()
+        
+        def search_group(group):
+            last_name, rows = group
+            if self.should_stop or not self.rate_limiter.acquire(lambda: self.should_stop):
+                return rows, None
+            started = time.perf_counter()
+            response = backend.search_last_name(last_name)
+            elapsed = time.perf_counter() - started
+            outcome = 'error' if response is None else 'ok'
+            self.rate_limiter.record(elapsed, outcome)
+            self.metrics.record_search(elapsed, outcome)
+            return rows, response
+        
+        self._log_status(f"Searching {len(groups)} shared last names for "
+                         f"{sum(len(rows) for _, rows in groups)} rows...")
+        try:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                for rows, response in pool.map(search_group, groups):
+                    if self.should_stop:
+                        break
+                    results = planner.resolve(rows, response)
+                    for idx, result in (results or {}).items():
+                        known[keys[idx]] = (result, GROUP_SOURCE)
+        finally:
+            backend.cleanup()
+        
+        self.run_summary['Last-name searches'] = planner.groups_searched
+        self.run_summary['Rows answered by last-name searches'] = planner.rows_answered
+        self.run_summary['Last names searched row by row'] = planner.fallbacks
+        self._log_status(f"Last-name grouping: {planner.groups_searched} searches answered "
+                         f"{planner.rows_answered} rows; {planner.fallbacks} groups fall back to per-row searches")
+        return known
+    
+    def _summarize_retries(self):
+        """Add retry counts to the run summary and status log"""
+        retries = self.retry_queue
+        if retries is None:
+            return
+        self.run_summary['Searches retried'] = retries.retried
+        self.run_summary['Names still failing after retries'] = retries.exhausted
+        if retries.retried:
+            self._log_status(f"Retried {retries.retried} failed searches; "
+                             f"{retries.exhausted} names still failed after {retries.max_attempts} tries")
+        if len(retries):
+            self._log_status(f"{len(retries)} names were waiting for a retry and were left unprocessed")
+    
+    def _search(self, tasks, total_names):
+        """
+        Start the configured backend(s) and search the given tasks
+        
+        Returns:
+            Iterator of (index, result) tuples in task order, or None if the
+            backend could not be started
+        """
+        if not tasks:
+            self._log_status("Every name was answered from the cache or snapshot; no searches needed")
+            return iter(())
+        
+        self.retry_queue = RetryQueue(max_attempts=self.max_attempts, base_delay=self.retry_delay)
+        if self.backend == 'selenium' and not HAS_PSUTIL:
+            self._log_status("psutil is not installed; browsers will not be restarted for high memory use")
+        if self.workers > 1:
+            self._log_status(f"Starting to search {len(tasks)} names with {self.workers} {self.backend} workers...")
+            return self._search_parallel(tasks, total_names)
+        
+        # Setup browser or HTTP session
+        self._backend = self.create_backend(shared=True)
+        if not self._backend.setup():
+            return None
+        self._log_status(f"Starting to search {len(tasks)} names...")
+        return self._search_serial(tasks, total_names)
+    
+    def _merge_results(self, tasks, keys, known, search_results, journaled):
+        """
+        Fan known and searched results back out to every row, in input-row order
+        
+        Args:
+            tasks: Every (index, first, last, gender) row in the file
+            keys: Name key of each row
+            known: name key -> (result, source) for names that need no search
+            search_results: (index, result) tuples for the first row of every
+                other name, in input order
+            journaled: row index -> record for rows completed by an earlier run
+        
+        Yields:
+            (index, result, source) tuples, stopping at the first row whose
+            search did not complete
+        """
+        resolved = dict(known)
+        search_results = iter(search_results)
+        total_names = len(tasks)
+        for idx, first_name, last_name, _ in tasks:
+            key = keys[idx]
+            if idx in journaled:
+                record = journaled[idx]
+                self._update_progress(idx + 1, total_names, f"{first_name} {last_name}")
+                yield idx, record['Result'], record['Source']
+                continue
+            if key in resolved:
+                result, source = resolved[key]
+                self._update_progress(idx + 1, total_names, f"{first_name} {last_name}")
+                yield idx, result, source
+                continue
+            # Rows are visited in input order, so an unresolved key is always
+            # the first row of its name and the next search result belongs to it
+            try:
+                searched_idx, result = next(search_results)
+            except StopIteration:
+                return
+            resolved[key] = (result, 'duplicate')
+            yield searched_idx, result, 'search'
+    
+    def _search_serial(self, tasks, total_names):
+        """
+        Search names one at a time with this processor's backend
+        
+        Names with a transient result are parked in the retry queue and
+        searched again once due, between the remaining names. Results are
+        held back until every earlier row is final.
+        
+        Yields:
+            (index, result) tuples in task order
+        """
+        retries = self.retry_queue
+        upcoming = deque(tasks)
+        order = deque(task[0] for task in tasks)
+        finished = {}
+        
+        while not self.should_stop:
+            due = retries.pop_ready()
+            if due:
+                task, attempt = due
+            elif upcoming:
+                task, attempt = upcoming.popleft(), 1
+            elif len(retries):
+                if not retries.wait(lambda: self.should_stop):
+                    break
+                continue
+            else:
+                break
+            
+            idx, first_name, last_name, gender = task
+            current_name = f"{first_name} {last_name}"
+            if attempt > 1:
+                current_name += f" (retry {attempt - 1})"
+            self._update_progress(idx + 1, total_names, current_name)
+            
+            if not self.rate_limiter.acquire(lambda: self.should_stop):
+                break
+            
+            # Search registry; pacing between searches comes from the rate limiter
+            started = time.perf_counter()
+            result = self._backend.search(first_name, last_name, gender)
+            elapsed, outcome = time.perf_counter() - started, search_outcome(result)
+            self.rate_limiter.record(elapsed, outcome)
+            self.metrics.record_search(elapsed, outcome)
+            if retries.defer(task, attempt, result):
+                continue
+            
+            finished[idx] = result
+            while order and order[0] in finished:
+                ready_idx = order.popleft()
+                yield ready_idx, finished.pop(ready_idx)
+    
+    def _search_parallel(self, tasks, total_names):
+        """
+        Search names across a pool of backends sharing this processor's rate limit
+        
+        Yields:
+            (index, result) tuples in task order
+        """
+        pool = SearchWorkerPool(
+            backend_factory=self.create_backend,
+            workers=self.workers,
+            rate_limiter=self.rate_limiter,
+            should_stop=lambda: self.should_stop,
+            status_callback=self.status_callback,
+            retry_queue=self.retry_queue,
+            metrics=self.metrics
+        )
+        # Tasks are the rows still to search, so look them up by row index, not position
+        names = {task[0]: task for task in tasks}
+        for idx, result in pool.run(tasks):
+            _, first_name, last_name, _ = names[idx]
+            self._update_progress(idx + 1, total_names, f"{first_name} {last_name}")
+            yield idx, result
     
     def stop_processing(self):
         """Stop the processing"""
@@ -305,6 +1037,22 @@ class RegistryProcessor:
     
     def cleanup(self):
         """Clean up resources"""
+        self._page_ready = False
+        backend, self._backend = self._backend, None
+        if backend:
+            backend.cleanup()
         if self.driver:
             self.driver.quit()
-            self.driver = None 
\ No newline at end of file
+            self.driver = None
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+
+
+if __name__ == "__main__":
+    # python -m gui.registry_processor runs the headless command-line interface
+    from gui.cli import main
+    sys.exit(main())
@@ -0,0 +1,267 @@
+import csv
+import io
+import json
+import os
+import time
+from bisect import bisect_left
+from datetime import datetime
+
+import pandas as pd
+import requests
+
+from gui.input_reader import read_names_with_rejects
+from gui.names import clean_name, normalize_name
+from gui.paths import APP_DATA_DIR
+from gui.search_backends import FIRST_NAME_FIELDS, LAST_NAME_FIELDS, record_field, registrant_records
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(APP_DATA_DIR, "registry_snapshot.json")
+# Saved names are normalized; bump when normalize_name changes so old snapshots are rebuilt
+SNAPSHOT_VERSION = 2
+# The public list runs to thousands of registrants; a smaller snapshot is a bad import
+# and would clear names that should be searched
+MIN_REGISTRANTS = 1000
+
+
+def registrant_pairs(records):
+    """
+    Extract (first, last) pairs from registrant records
+
+    Args:
+        records: Registrant dicts, e.g. JSON records or CSV rows
+
+    Returns:
+        list: (first name, last name) tuples
+
+    Raises:
+        ValueError: If any record has no recognisable last name. Skipping such
+            records would leave their registrants out of the snapshot.
+    """
+    pairs = []
+    unnamed = []
+    for record in records:
+        last_name = record_field(record, LAST_NAME_FIELDS)
+        if normalize_name(last_name):
+            pairs.append((record_field(record, FIRST_NAME_FIELDS) or '', last_name))
+        else:
+            unnamed.append(record)
+    if unnamed:
+        raise ValueError(f"{len(unnamed)} of {len(pairs) + len(unnamed)} registrant records have no last name "
+                         f"(expected one of {', '.join(LAST_NAME_FIELDS)}; first such record has "
+                         f"{', '.join(map(str, unnamed[0])) or 'no fields'})")
+    return pairs
+
+
+def registrants_from_json(data):
+    """
+    Extract (first, last) pairs from a decoded registrant list
+
+    Args:
+        data: A list of registrant records, or an object holding one under a
+            key the search API uses ('results', 'offenders', ...)
+
+    Returns:
+        list: (first name, last name) tuples
+    """
+    return registrant_pairs(registrant_records(data))
+
+
+def read_registrants(path):
+    """
+    Read a registrant name list from a file
+
+    JSON files hold registrant records (see registrants_from_json); any other
+    file is read like an input sheet, with the name columns auto-detected.
+
+    Returns:
+        list: (first name, last name) tuples
+    """
+    if os.path.splitext(path)[1].lower() == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            return registrants_from_json(json.load(f))
+    df, rejected = read_names_with_rejects(path)
+    pairs = list(zip(df['First Name'], df['Last Name']))
+    # A registrant listed without a usable first name still counts, matching any first name
+    unnamed = []
+    for row, last_name in zip(rejected['Row'], rejected['Last Name']):
+        last_name = '' if pd.isna(last_name) else clean_name(last_name)
+        if any(char.isalpha() for char in last_name):
+            pairs.append(('', last_name))
+        else:
+            unnamed.append(row)
+    if unnamed:
+        raise ValueError(f"{len(unnamed)} rows of {os.path.basename(path)} have no last name "
+                         f"(first at row {unnamed[0]})")
+    return pairs
+
+
+class RegistrySnapshot:
+    """
+    Local copy of the public registrant name list, indexed for pre-screening.
+
+    A row is a candidate when some registrant's last name starts with the
+    row's last name and their first name starts with the row's first name -
+    the same prefix match a live search makes - so only rows that cannot
+    match anyone are answered locally. To answer that with one bisect, every
+    registrant is indexed under each prefix of their normalized last name as
+    a sorted 'prefix NUL first name' key; a row is a candidate when some key
+    starts with 'last name NUL first name'.
+    """
+
+    def __init__(self, pairs=(), built_at=None, source=None):
+        """
+        Build the index
+
+        Args:
+            pairs: (first name, last name) tuples
+            built_at: When the name list was taken (epoch seconds; defaults to now)
+            source: File or URL the names came from
+        """
+        names = {}
+        for first_name, last_name in pairs:
+            last_name = normalize_name(last_name)
+            if last_name:
+                names.setdefault(last_name, set()).add(normalize_name(first_name))
+        self._init_index(names)
+        self.built_at = built_at if built_at is not None else time.time()
+        self.source = source
+        self.screened = 0
+        self.candidates = 0
+
+    def _init_index(self, names):
+        self._last_names = sorted(names)
+        self._first_names = {last_name: tuple(sorted(firsts)) for last_name, firsts in names.items()}
+        self.registrants = sum(len(firsts) for firsts in self._first_names.values())
+
+        keys = set()
+        # Last-name prefixes of registrants listed without a first name, who
+        # could be anyone with that last name
+        self._unnamed_prefixes = set()
+        for last_name, firsts in self._first_names.items():
+            prefixes = [last_name[:length] for length in range(1, len(last_name) + 1)]
+            for first_name in firsts:
+                if first_name:
+                    keys.update(f"{prefix}\x00{first_name}" for prefix in prefixes)
+                else:
+                    self._unnamed_prefixes.update(prefixes)
+        self._keys = sorted(keys)
+
+    def __len__(self):
+        return self.registrants
+
+    def check_size(self, min_registrants=MIN_REGISTRANTS):
+        """
+        Raise ValueError if the snapshot is too small to be the full registrant list
+        """
+        if self.registrants < min_registrants:
+            raise ValueError(f"Registrant snapshot from {self.source or 'unknown source'} holds only "
+                             f"{self.registrants} registrants (at least {min_registrants} expected)")
+
+    @property
+    def age_days(self):
+        return (time.time() - self.built_at) / (24 * 60 * 60)
+
+    def is_candidate(self, first_name, last_name):
+        """
+        Return True if a live search for this name could find a registrant
+        """
+        first_name = normalize_name(first_name)
+        last_name = normalize_name(last_name)
+        self.screened += 1
+        if not last_name:
+            self.candidates += 1
+            return True
+
+        key = f"{last_name}\x00{first_name}"
+        position = bisect_left(self._keys, key)
+        if last_name in self._unnamed_prefixes or (position < len(self._keys) and self._keys[position].startswith(key)):
+            self.candidates += 1
+            return True
+        return False
+
+    def save(self, path=DEFAULT_SNAPSHOT_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'built_at': self.built_at,
+            'source': self.source,
+            'registrants': self.registrants,
+            'names': {last_name: list(self._first_names[last_name]) for last_name in self._last_names},
+        }
+        # Write then rename, so a reader never sees half a snapshot
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_SNAPSHOT_PATH):
+        """
+        Load a saved snapshot
+
+        Returns:
+            RegistrySnapshot or None: None if there is no usable snapshot at path
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+            return None
+        snapshot = cls(built_at=data.get('built_at'), source=data.get('source'))
+        # Saved names are already normalized and sorted
+        snapshot._init_index(data.get('names') or {})
+        return snapshot
+
+    @classmethod
+    def import_file(cls, source_path, path=DEFAULT_SNAPSHOT_PATH, min_registrants=MIN_REGISTRANTS):
+        """
+        Build a snapshot from a registrant list file and save it
+
+        Returns:
+            RegistrySnapshot: The new snapshot
+
+        Raises:
+            ValueError: If the list has records without a last name or too few
+                registrants; the saved snapshot is left as it was
+        """
+        snapshot = cls(read_registrants(source_path), source=os.path.abspath(source_path))
+        snapshot.check_size(min_registrants)
+        snapshot.save(path)
+        return snapshot
+
+    @classmethod
+    def pull(cls, url, path=DEFAULT_SNAPSHOT_PATH, timeout=120, min_registrants=MIN_REGISTRANTS):
+        """
+        Download the registrant list, build a snapshot and save it
+
+        Args:
+            url: Address returning the registrant list as JSON or CSV
+            path: Where to save the snapshot
+            timeout: Seconds to wait for the download
+            min_registrants: Fewest registrants a usable list holds
+
+        Returns:
+            RegistrySnapshot: The new snapshot
+
+        Raises:
+            ValueError: If the list has records without a last name or too few
+                registrants; the saved snapshot is left as it was
+        """
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        if 'json' in response.headers.get('Content-Type', ''):
+            pairs = registrants_from_json(response.json())
+        else:
+            rows = [row for row in csv.DictReader(io.StringIO(response.text)) if any(row.values())]
+            pairs = registrant_pairs(rows)
+        snapshot = cls(pairs, source=url)
+        snapshot.check_size(min_registrants)
+        snapshot.save(path)
+        return snapshot
+
+    def describe(self):
+        built = datetime.fromtimestamp(self.built_at).strftime('%Y-%m-%d %H:%M')
+        return f"{self.registrants} registrants, taken {built} from {self.source or 'unknown source'}"
@@ -0,0 +1,97 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from gui.names import name_key
+from gui.paths import APP_DATA_DIR
+from gui.search_backends import NO_RESULTS, WARNING, DetailedResult, result_matches
+
+DEFAULT_CACHE_PATH = os.path.join(APP_DATA_DIR, "results_cache.sqlite3")
+
+# Only answers that describe the registry itself are worth reusing; timeouts
+# and errors are always searched again.
+CACHEABLE_RESULTS = (NO_RESULTS, WARNING)
+
+
+class ResultCache:
+    """
+    On-disk cache of search results keyed by normalized (first, last, gender).
+
+    Backed by SQLite so it survives between runs. Entries older than the
+    TTL are ignored and overwritten by the next search of the same name.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_days=30):
+        """
+        Open (or create) the cache
+
+        Args:
+            path: SQLite database file
+            ttl_days: Age in days after which a cached result is considered stale
+        """
+        self.path = path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " first_name TEXT NOT NULL,"
+            " last_name TEXT NOT NULL,"
+            " gender TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " checked_at REAL NOT NULL,"
+            " PRIMARY KEY (first_name, last_name, gender))"
+        )
+        try:
+            # Caches written before match details were recorded
+            self._conn.execute("ALTER TABLE results ADD COLUMN matches TEXT")
+        except sqlite3.OperationalError:
+            pass
+        self._conn.commit()
+
+    def get(self, first_name, last_name, gender):
+        """
+        Look up a fresh cached result
+
+        Returns:
+            str or None: The cached result (with its matched registrants), or None
+            if unseen or stale
+        """
+        key = name_key(first_name, last_name, gender)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, checked_at, matches FROM results"
+                " WHERE first_name = ? AND last_name = ? AND gender = ?",
+                key
+            ).fetchone()
+            if row and time.time() - row[1] < self.ttl_seconds:
+                self.hits += 1
+                return DetailedResult(row[0], json.loads(row[2]) if row[2] else ())
+            self.misses += 1
+            return None
+
+    def put(self, first_name, last_name, gender, result):
+        """Store a search result if it is a definitive answer"""
+        if result not in CACHEABLE_RESULTS:
+            return
+        key = name_key(first_name, last_name, gender)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (first_name, last_name, gender, result, checked_at, matches)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                key + (str(result), time.time(), json.dumps(result_matches(result)))
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
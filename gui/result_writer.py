@@ -0,0 +1,162 @@
+import csv
+import os
+
+import openpyxl
+from openpyxl.utils import get_column_letter
+
+RESULT_COLUMNS = [
+    'First Name', 'Last Name', 'Suffix', 'Gender', 'Result', 'Matches', 'Matched Registrants', 'Registrant Links',
+    'Source', 'Processed Date',
+]
+MAX_COLUMN_WIDTH = 50
+
+
+class ResultWriter:
+    """
+    Streams result rows to the output file as they are produced.
+
+    Rows are written one at a time and never held in memory, so output
+    size does not grow the process. Subclasses implement one file format.
+    """
+
+    def __init__(self, output_path, columns=RESULT_COLUMNS, widths=None):
+        """
+        Open the output for writing
+
+        Args:
+            output_path: File to write
+            columns: Column names, in order
+            widths: Optional column name -> longest expected value length, used
+                to size columns in formats that support it
+        """
+        self.output_path = output_path
+        self.columns = list(columns)
+        self.widths = dict(widths or {})
+        self.rows_written = 0
+        self.closed = False
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def column_width(self, column):
+        """Display width for a column: longest value or header plus padding, capped"""
+        longest = max(len(column), self.widths.get(column, 0))
+        return min(longest + 2, MAX_COLUMN_WIDTH)
+
+    def write_row(self, record):
+        """Write one result dict (missing columns are left blank)"""
+        raise NotImplementedError
+
+    def write_summary(self, summary):
+        """Write the run summary (metric name -> value)"""
+        raise NotImplementedError
+
+    def write_metrics(self, rows):
+        """Write the run metrics table (rows of cell values, header first)"""
+        raise NotImplementedError
+
+    def write_rejected(self, rejected):
+        """Write the input rows left out as invalid (a DataFrame with a Reason column)"""
+        raise NotImplementedError
+
+    def close(self):
+        """Finish the file; later calls do nothing"""
+        if not self.closed:
+            self.closed = True
+            self._close()
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class ExcelResultWriter(ResultWriter):
+    """
+    Writes .xlsx output with openpyxl's write-only mode.
+
+    Write-only worksheets must know their column widths before the first
+    row, so widths come from lengths tracked while the input was read.
+    """
+
+    def __init__(self, output_path, columns=RESULT_COLUMNS, widths=None):
+        super().__init__(output_path, columns, widths)
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet('Registry Results')
+        for position, column in enumerate(self.columns, start=1):
+            self.worksheet.column_dimensions[get_column_letter(position)].width = self.column_width(column)
+        self.worksheet.append(self.columns)
+
+    def write_row(self, record):
+        self.worksheet.append([record.get(column) for column in self.columns])
+        self.rows_written += 1
+
+    def write_summary(self, summary):
+        sheet = self.workbook.create_sheet('Summary')
+        sheet.column_dimensions['A'].width = 30
+        sheet.column_dimensions['B'].width = 15
+        sheet.append(['Metric', 'Value'])
+        for metric, value in summary.items():
+            sheet.append([metric, value])
+
+    def write_metrics(self, rows):
+        sheet = self.workbook.create_sheet('Metrics')
+        sheet.column_dimensions['A'].width = 22
+        for row in rows:
+            sheet.append(row)
+
+    def write_rejected(self, rejected):
+        sheet = self.workbook.create_sheet('Rejected Rows')
+        for position, column in enumerate(rejected.columns, start=1):
+            sheet.column_dimensions[get_column_letter(position)].width = 30 if column == 'Reason' else 18
+        sheet.append(list(rejected.columns))
+        for row in rejected.astype(object).where(rejected.notna(), None).itertuples(index=False, name=None):
+            sheet.append(list(row))
+
+    def _close(self):
+        self.workbook.save(self.output_path)
+
+
+class CsvResultWriter(ResultWriter):
+    """Writes .csv output, with the run summary, metrics and rejected rows in sibling files"""
+
+    def __init__(self, output_path, columns=RESULT_COLUMNS, widths=None):
+        super().__init__(output_path, columns, widths)
+        self._file = open(output_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def write_row(self, record):
+        self._writer.writerow(record)
+        self.rows_written += 1
+
+    def write_summary(self, summary):
+        base, ext = os.path.splitext(self.output_path)
+        with open(f"{base}_summary{ext}", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Metric', 'Value'])
+            for metric, value in summary.items():
+                writer.writerow([metric, value])
+
+    def write_metrics(self, rows):
+        base, ext = os.path.splitext(self.output_path)
+        with open(f"{base}_metrics{ext}", 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+
+    def write_rejected(self, rejected):
+        base, ext = os.path.splitext(self.output_path)
+        rejected.to_csv(f"{base}_rejected{ext}", index=False, encoding='utf-8')
+
+    def _close(self):
+        self._file.close()
+
+
+def create_result_writer(output_path, columns=RESULT_COLUMNS, widths=None):
+    """
+    Pick a writer from the output file's extension
+
+    Returns:
+        ResultWriter: CsvResultWriter for .csv, ExcelResultWriter otherwise
+    """
+    if output_path.lower().endswith('.csv'):
+        return CsvResultWriter(output_path, columns, widths)
+    return ExcelResultWriter(output_path, columns, widths)
@@ -0,0 +1,121 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+
+from gui.search_backends import SearchResult
+
+
+class RetryQueue:
+    """
+    Deferred searches for names whose last result was transient.
+
+    A timed-out or failed search is not written as the row's result right
+    away; the task is parked here with a jittered, exponentially growing
+    delay and picked up again once it is due, while other names keep being
+    searched. After ``max_attempts`` tries the last transient result stands.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=5.0, max_delay=60.0, jitter=0.5):
+        """
+        Initialize the retry queue
+
+        Args:
+            max_attempts: Total tries per name, including the first (1 = no retries)
+            base_delay: Seconds before the first retry
+            max_delay: Longest delay before a retry
+            jitter: Fraction by which each delay is randomly stretched or shortened
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retried = 0
+        self.exhausted = 0
+        self._heap = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+    def delay(self, attempt):
+        """Seconds to wait before try number ``attempt + 1``"""
+        delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def should_retry(self, result, attempt):
+        """
+        Decide whether a name gets another try, counting the decision
+
+        Args:
+            result: Result string of the latest try
+            attempt: Number of that try (1 = first)
+
+        Returns:
+            bool: True if the result is transient and tries remain
+        """
+        if not SearchResult(result).is_transient:
+            return False
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self.exhausted += 1
+                return False
+            self.retried += 1
+            return True
+
+    def defer(self, task, attempt, result):
+        """
+        Park a task for another try if its result was transient
+
+        Args:
+            task: (index, first, last, gender) tuple that was searched
+            attempt: Number of the try that produced ``result`` (1 = first)
+            result: Result string of that try
+
+        Returns:
+            bool: True if the task will be retried, False if ``result`` is final
+        """
+        if not self.should_retry(result, attempt):
+            return False
+        ready_at = time.monotonic() + self.delay(attempt)
+        with self._lock:
+            heapq.heappush(self._heap, (ready_at, next(self._order), task, attempt + 1))
+        return True
+
+    def pop_ready(self):
+        """
+        Take the next task whose delay has passed
+
+        Returns:
+            tuple or None: (task, attempt) or None if nothing is due yet
+        """
+        with self._lock:
+            if self._heap and self._heap[0][0] <= time.monotonic():
+                _, _, task, attempt = heapq.heappop(self._heap)
+                return task, attempt
+            return None
+
+    def wait(self, should_stop=None):
+        """
+        Block until the earliest parked task is due
+
+        Args:
+            should_stop: Optional callable; waiting is abandoned once it returns True
+
+        Returns:
+            bool: False if waiting was abandoned, True otherwise
+        """
+        while True:
+            if should_stop and should_stop():
+                return False
+            with self._lock:
+                if not self._heap:
+                    return True
+                remaining = self._heap[0][0] - time.monotonic()
+            if remaining <= 0:
+                return True
+            # Sleep in short slices so a stop request or an earlier retry is noticed
+            time.sleep(min(remaining, 0.25))
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+
+from gui.names import name_key
+from gui.paths import APP_DATA_DIR
+
+DEFAULT_JOURNAL_DIR = os.path.join(APP_DATA_DIR, "journals")
+
+
+def file_hash(file_path):
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RunJournal:
+    """
+    Append-only journal of per-row results for one input file.
+
+    Each completed row is written as one JSON line as soon as it is known,
+    so a crashed or stopped run can be resumed. The journal is named after
+    the input file's hash, so edits to the file start a fresh journal.
+    """
+
+    def __init__(self, input_path, journal_dir=DEFAULT_JOURNAL_DIR):
+        """
+        Locate the journal for an input file
+
+        Args:
+            input_path: Input Excel file the journal belongs to
+            journal_dir: Directory holding journal files
+        """
+        self.input_hash = file_hash(input_path)
+        self.path = os.path.join(journal_dir, f"{self.input_hash}.jsonl")
+        self._file = None
+
+    def exists(self):
+        """Return True if an unfinished journal exists for this input"""
+        return os.path.exists(self.path) and os.path.getsize(self.path) > 0
+
+    def load(self):
+        """
+        Read every completed row from the journal
+
+        Returns:
+            dict: row index -> result record
+        """
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash can leave a partial last line; ignore it
+                    continue
+                records[entry.pop('row')] = entry
+        return records
+
+    def load_matching(self, tasks):
+        """
+        Read completed rows that still match the input rows
+
+        Args:
+            tasks: (index, first, last, gender) rows of the current input
+
+        Returns:
+            dict: row index -> result record
+        """
+        records = self.load()
+        matching = {}
+        for idx, first_name, last_name, gender in tasks:
+            record = records.get(idx)
+            if record and name_key(record['First Name'], record['Last Name'], record['Gender']) == \
+                    name_key(first_name, last_name, gender):
+                matching[idx] = record
+        return matching
+
+    def start(self, resume):
+        """
+        Open the journal for appending
+
+        Args:
+            resume: Keep existing entries; otherwise the journal is emptied
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+
+    def append(self, row, record):
+        """Record one completed row"""
+        entry = dict(record, row=row)
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """Delete the journal once its run has completed"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,377 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+# Result vocabulary shared by every backend and written to the output file
+NO_RESULTS = 'no results found'
+WARNING = 'warning'
+TIMEOUT = 'timeout or no result element found'
+UNKNOWN_ERROR = 'unknown error'
+
+# The only search response the HTTP backends classify: a JSON object with the
+# total match count, the page count and the first page of registrant records,
+#   {"total": 1, "totalPages": 1, "results": [{"firstName": "JOHN", "lastName": "SMITH", ...}]}
+# The endpoint has no confirmed address, so there is no default api_url, and any
+# other body is an 'unknown error' rather than a guess at 'no results found'.
+RESPONSE_TOTAL_KEY = 'total'
+RESPONSE_PAGES_KEY = 'totalPages'
+RESPONSE_RESULTS_KEY = 'results'
+RECORD_LAST_NAME_KEY = 'lastName'
+
+# Keys registrant list files (snapshot imports) have used for the record list
+RESULT_LIST_KEYS = ('results', 'offenders', 'items', 'data', 'content')
+
+# Field names registrant records have used for names and gender
+FIRST_NAME_FIELDS = ('firstName', 'first_name', 'FirstName', 'First Name', 'first')
+LAST_NAME_FIELDS = ('lastName', 'last_name', 'LastName', 'Last Name', 'last')
+GENDER_FIELDS = ('gender', 'sex', 'Gender', 'Sex')
+MIDDLE_NAME_FIELDS = ('middleName', 'middle_name', 'MiddleName')
+FULL_NAME_FIELDS = ('name', 'fullName', 'full_name')
+AGE_FIELDS = ('age', 'Age')
+COUNTY_FIELDS = ('county', 'countyName', 'County')
+LINK_FIELDS = ('url', 'link', 'detailUrl', 'profileUrl', 'href')
+
+# Output columns describing the registrants behind a 'warning'
+MATCH_COLUMNS = ['Matches', 'Matched Registrants', 'Registrant Links']
+
+
+class SearchResult:
+    """
+    A search result string together with the kind of answer it is.
+
+    Definitive results ('no results found', 'warning') describe the registry
+    and are final. Transient results (timeouts, page errors) say nothing
+    about the name and are worth searching again.
+    """
+
+    DEFINITIVE = 'definitive'
+    TRANSIENT = 'transient'
+
+    def __init__(self, text):
+        self.text = text
+        self.kind = self.DEFINITIVE if text in (NO_RESULTS, WARNING) else self.TRANSIENT
+
+    @property
+    def is_transient(self):
+        return self.kind == self.TRANSIENT
+
+    @property
+    def outcome(self):
+        """'ok' for a definitive answer, 'timeout', or 'error'"""
+        if not self.is_transient:
+            return 'ok'
+        return 'timeout' if self.text == TIMEOUT else 'error'
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"SearchResult({self.text!r}, kind={self.kind!r})"
+
+
+class DetailedResult(str):
+    """
+    A result string that also carries the registrants the search matched.
+
+    Compares, hashes and serializes exactly like the plain result string, so
+    it passes through queues, retries and dedup unchanged. Code that wants
+    the details reads ``matches``: dicts with 'name', 'age', 'county' and 'link'.
+    """
+
+    def __new__(cls, text, matches=()):
+        result = super().__new__(cls, text)
+        result.matches = [dict(match) for match in matches or ()]
+        return result
+
+
+def result_matches(result):
+    """The matched registrants carried by a result (empty for plain strings)"""
+    return getattr(result, 'matches', [])
+
+
+def describe_match(match):
+    """One registrant as 'NAME (age 41, Pulaski County)'"""
+    details = []
+    if match.get('age'):
+        details.append(f"age {match['age']}")
+    county = match.get('county')
+    if county:
+        details.append(county if 'county' in county.lower() else f"{county} County")
+    name = match.get('name') or 'unnamed registrant'
+    return f"{name} ({', '.join(details)})" if details else name
+
+
+def match_columns(result):
+    """
+    Output columns describing a result's matches
+
+    Returns:
+        dict: 'Matches', 'Matched Registrants' and 'Registrant Links' values;
+        the count is 0 for 'no results found' and blank when it is not known
+    """
+    matches = result_matches(result)
+    if matches:
+        count = len(matches)
+    else:
+        count = 0 if result == NO_RESULTS else ''
+    return {
+        'Matches': count,
+        'Matched Registrants': '; '.join(describe_match(match) for match in matches),
+        'Registrant Links': '; '.join(match['link'] for match in matches if match.get('link')),
+    }
+
+
+def search_outcome(result):
+    """
+    Classify a result string for pacing decisions
+
+    Returns:
+        str: 'ok' for a definitive answer, 'timeout', or 'error'
+    """
+    return SearchResult(result).outcome
+
+
+def record_field(record, fields):
+    """Return the first non-empty value among the given fields of a record, or None"""
+    for field in fields:
+        if record.get(field):
+            return record[field]
+    return None
+
+
+def registrant_records(data):
+    """
+    The registrant records in a decoded registrant list file
+
+    Args:
+        data: Decoded JSON (a list of registrants or an object holding one)
+
+    Returns:
+        list: Registrant dicts (empty if the data holds none)
+    """
+    if isinstance(data, dict):
+        data = next((data[key] for key in RESULT_LIST_KEYS if isinstance(data.get(key), list)), [])
+    if not isinstance(data, list):
+        return []
+    return [record for record in data if isinstance(record, dict)]
+
+
+def _is_count(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def parse_search_response(data):
+    """
+    Read a decoded search response in the accepted schema
+
+    Args:
+        data: Decoded JSON body
+
+    Returns:
+        tuple or None: (registrant records, total match count, page count), or
+        None if the body does not follow the schema or contradicts itself
+    """
+    if not isinstance(data, dict):
+        return None
+    total = data.get(RESPONSE_TOTAL_KEY)
+    pages = data.get(RESPONSE_PAGES_KEY)
+    records = data.get(RESPONSE_RESULTS_KEY)
+    if not _is_count(total) or not _is_count(pages) or not isinstance(records, list):
+        return None
+    if not all(isinstance(record, dict) and record.get(RECORD_LAST_NAME_KEY) for record in records):
+        return None
+    if len(records) > total or (total and not records):
+        return None
+    return records, total, pages
+
+
+def response_is_complete(total, pages, records):
+    """Return True if a parsed search response holds every matching registrant"""
+    return total <= len(records) and pages <= 1
+
+
+def registrant_match(record):
+    """
+    Name, age, county and link of a registrant record from the search API
+
+    Returns:
+        dict: 'name', 'age', 'county' and 'link' strings (empty when absent)
+    """
+    parts = [record_field(record, fields) for fields in (FIRST_NAME_FIELDS, MIDDLE_NAME_FIELDS, LAST_NAME_FIELDS)]
+    name = ' '.join(str(part).strip() for part in parts if part) or record_field(record, FULL_NAME_FIELDS)
+    return {
+        'name': str(name or ''),
+        'age': str(record_field(record, AGE_FIELDS) or ''),
+        'county': str(record_field(record, COUNTY_FIELDS) or ''),
+        'link': str(record_field(record, LINK_FIELDS) or ''),
+    }
+
+
+class SearchBackend:
+    """
+    Interface for one registry search session.
+
+    A backend is created per worker, started with setup(), used for any
+    number of search() calls and released with cleanup().
+    """
+
+    name = 'base'
+
+    def setup(self):
+        """
+        Prepare the backend for searching
+
+        Returns:
+            bool: True if the backend is ready, False if it failed to start
+        """
+        return True
+
+    def search(self, first_name, last_name, gender):
+        """
+        Search a single name in the registry
+
+        Returns:
+            str: 'no results found', 'warning', or error message
+        """
+        raise NotImplementedError
+
+    def search_last_name(self, last_name):
+        """
+        Search a last name on its own and return every registrant found
+
+        Returns:
+            tuple or None: (registrant records, True if the response held every
+            match), or None if the search failed or the backend cannot run one
+        """
+        return None
+
+    def cleanup(self):
+        """Release any resources held by the backend"""
+        pass
+
+
+class SeleniumSearchBackend(SearchBackend):
+    """Searches through the public SPA with a RegistryProcessor's Chrome session"""
+
+    name = 'selenium'
+
+    def __init__(self, processor):
+        self.processor = processor
+
+    def setup(self):
+        return self.processor.setup_driver()
+
+    def search(self, first_name, last_name, gender):
+        return self.processor.search_single_name(first_name, last_name, gender)
+
+    def cleanup(self):
+        self.processor.cleanup()
+
+
+class HttpSearchBackend(SearchBackend):
+    """
+    Calls the JSON endpoint behind the Name Search form directly.
+
+    Uses one keep-alive requests.Session per backend, so consecutive
+    searches reuse the same TLS connection instead of loading the SPA.
+    """
+
+    name = 'http'
+
+    def __init__(self, api_url, timeout=15, status_callback=None, pool_size=4):
+        """
+        Initialize the HTTP backend
+
+        Args:
+            api_url: URL of the name search endpoint (required; there is no default)
+            timeout: Seconds to wait for a response before reporting a timeout
+            status_callback: Function to call with status messages
+            pool_size: Connections kept open, for sharing the backend between threads
+        """
+        if not api_url:
+            raise ValueError("The http backend needs the registry's search API URL (api_url)")
+        self.api_url = api_url
+        self.timeout = timeout
+        self.status_callback = status_callback
+        self.pool_size = pool_size
+        self.session = None
+
+    def setup(self):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+        })
+        return True
+
+    def search(self, first_name, last_name, gender):
+        if self.session is None:
+            self.setup()
+
+        payload = {'firstName': first_name, 'lastName': last_name, 'gender': gender}
+        try:
+            response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
+        except requests.Timeout:
+            return TIMEOUT
+        except Exception as e:
+            return f'Error: {str(e)}'
+
+        if response.status_code != 200:
+            return f'Error: HTTP {response.status_code}'
+
+        try:
+            data = response.json()
+        except ValueError:
+            return UNKNOWN_ERROR
+
+        return self.classify_response(data)
+
+    def search_last_name(self, last_name):
+        if self.session is None:
+            self.setup()
+
+        payload = {'firstName': '', 'lastName': last_name, 'gender': ''}
+        try:
+            response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
+            if response.status_code != 200:
+                return None
+            data = response.json()
+        except Exception:
+            return None
+
+        parsed = parse_search_response(data)
+        if parsed is None:
+            return None
+        records, total, pages = parsed
+        return records, response_is_complete(total, pages, records)
+
+    @staticmethod
+    def classify_response(data):
+        """
+        Map a decoded search response onto the result vocabulary
+
+        Only a body in the accepted schema (see RESPONSE_TOTAL_KEY) is
+        classified; an empty page in any other shape is not taken to mean
+        that nobody matched.
+
+        Args:
+            data: Decoded JSON body
+
+        Returns:
+            str: 'no results found', 'warning' (a DetailedResult listing the
+            registrants in the body), or 'unknown error'
+        """
+        parsed = parse_search_response(data)
+        if parsed is None:
+            return UNKNOWN_ERROR
+        records, total, _ = parsed
+        if total == 0:
+            return NO_RESULTS
+        return DetailedResult(WARNING, [registrant_match(record) for record in records])
+
+    def cleanup(self):
+        if self.session:
+            self.session.close()
+            self.session = None
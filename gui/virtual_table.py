@@ -0,0 +1,170 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTable:
+    """
+    Scrollable table that only renders the rows on screen.
+
+    The rows live in a plain list; the Treeview holds one item per visible
+    line, and scrolling refills those items from the list. Changing a cell
+    or a row's tags touches at most one item, so updating a row costs the
+    same on a 20-row sheet as on a 20,000-row one.
+    """
+
+    def __init__(self, parent, columns, widths=None, height=10):
+        """
+        Build the table
+
+        Args:
+            parent: Widget to place the table in
+            columns: Column headings
+            widths: Optional pixel width of each column
+            height: Lines shown before the table is first laid out
+        """
+        self.columns = tuple(columns)
+        self.frame = ttk.Frame(parent)
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.tree = ttk.Treeview(self.frame, columns=self.columns, show='headings', height=height, selectmode='none')
+        for column, width in zip(self.columns, widths or [None] * len(self.columns)):
+            self.tree.heading(column, text=column)
+            if width:
+                self.tree.column(column, width=width)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.rows = []
+        self.row_tags = {}
+        self.current = None
+        self.offset = 0
+        self._items = [self.tree.insert('', 'end') for _ in range(height)]
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self._scroll_by(-3))
+        self.tree.bind('<Button-5>', lambda event: self._scroll_by(3))
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def tag_configure(self, tag, **options):
+        self.tree.tag_configure(tag, **options)
+
+    @property
+    def visible_rows(self):
+        return len(self._items)
+
+    def set_rows(self, rows):
+        """Replace every row and scroll back to the top"""
+        self.rows = [list(row) for row in rows]
+        self.row_tags = {}
+        self.current = None
+        self.offset = 0
+        self._render()
+
+    def clear_column(self, column):
+        """Blank one column and drop every row's tags, e.g. before a new run"""
+        position = self.columns.index(column)
+        for row in self.rows:
+            row[position] = ''
+        self.row_tags = {}
+        self.current = None
+        self._render()
+
+    def set_value(self, index, column, value):
+        self.rows[index][self.columns.index(column)] = value
+        self._render_row(index)
+
+    def set_tags(self, index, tags):
+        if tags:
+            self.row_tags[index] = tuple(tags)
+        else:
+            self.row_tags.pop(index, None)
+        self._render_row(index)
+
+    def set_current(self, index):
+        """
+        Highlight the row being worked on (None for no row)
+
+        The view follows the current row while it is on screen, a page at a
+        time; once the user scrolls elsewhere it is left alone.
+        """
+        previous, self.current = self.current, index
+        if previous is not None:
+            self._render_row(previous)
+        if index is None:
+            return
+        if previous is not None and self._is_visible(previous) and not self._is_visible(index):
+            self._scroll_to(index if index > previous else index - self.visible_rows + 1)
+        else:
+            self._render_row(index)
+
+    def _is_visible(self, index):
+        return self.offset <= index < self.offset + self.visible_rows
+
+    def _tags(self, index):
+        if index == self.current:
+            return ('current',)
+        return self.row_tags.get(index, ())
+
+    def _render_row(self, index):
+        if self._is_visible(index):
+            self.tree.item(self._items[index - self.offset], values=self.rows[index], tags=self._tags(index))
+
+    def _render(self):
+        blank = [''] * len(self.columns)
+        for slot, item in enumerate(self._items):
+            index = self.offset + slot
+            if index < len(self.rows):
+                self.tree.item(item, values=self.rows[index], tags=self._tags(index))
+            else:
+                self.tree.item(item, values=blank, tags=())
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        if not self.rows:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        total = len(self.rows)
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_rows) / total))
+
+    def _scroll_to(self, offset):
+        offset = max(0, min(int(offset), len(self.rows) - self.visible_rows))
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def _scroll_by(self, lines):
+        self._scroll_to(self.offset + lines)
+        return 'break'
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self._scroll_to(round(float(amount) * len(self.rows)))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small steps
+        notches = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-3 * notches)
+
+    def _on_resize(self, event, retry=True):
+        """Keep one item per line that fits in the widget's new height"""
+        bbox = self.tree.bbox(self._items[0]) if self._items else None
+        if not bbox:
+            # The first resize can arrive before any line is drawn; measure again shortly
+            if retry:
+                self.tree.after(50, self._on_resize, event, False)
+            return
+        _, top, _, line_height = bbox
+        wanted = max(1, (event.height - top) // max(1, line_height))
+        while len(self._items) < wanted:
+            self._items.append(self.tree.insert('', 'end'))
+        while len(self._items) > wanted:
+            self.tree.delete(self._items.pop())
+        self.offset = max(0, min(self.offset, len(self.rows) - wanted))
+        self._render()
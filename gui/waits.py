@@ -0,0 +1,231 @@
+import threading
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+# Installed once per page: counts in-flight and completed XHR/fetch calls
+# and bumps a sequence number whenever a result element is added to the DOM.
+# Every call also marks the result elements already showing as stale, so the
+# previous search's panel or cards are never taken for the next one's result.
+TRACKER_SCRIPT = """
+var selector = arguments[0];
+var stale = document.querySelectorAll(selector);
+for (var k = 0; k < stale.length; k++) {
+    stale[k].setAttribute('data-ar-stale', '');
+}
+if (!window.__arTracker) {
+    window.__arTracker = {pending: 0, completed: 0, lastActivity: Date.now(), resultSeq: 0};
+    var tracker = window.__arTracker;
+    var touch = function (delta) {
+        tracker.pending = Math.max(0, tracker.pending + delta);
+        if (delta < 0) {
+            tracker.completed += 1;
+        }
+        tracker.lastActivity = Date.now();
+    };
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        touch(1);
+        this.addEventListener('loadend', function () { touch(-1); });
+        return originalSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            touch(1);
+            return originalFetch.apply(this, arguments).finally(function () { touch(-1); });
+        };
+    }
+    new MutationObserver(function (mutations) {
+        for (var i = 0; i < mutations.length; i++) {
+            var added = mutations[i].addedNodes;
+            for (var j = 0; j < added.length; j++) {
+                var node = added[j];
+                if (node.nodeType === 1 && (node.matches(selector) || node.querySelector(selector))) {
+                    tracker.resultSeq += 1;
+                    return;
+                }
+            }
+        }
+    }).observe(document.body, {childList: true, subtree: true});
+}
+return {resultSeq: window.__arTracker.resultSeq, completed: window.__arTracker.completed};
+"""
+
+ANGULAR_STABLE_SCRIPT = """
+if (window.getAllAngularTestabilities) {
+    return window.getAllAngularTestabilities().every(function (t) { return t.isStable(); });
+}
+if (window.angular) {
+    try {
+        var injector = window.angular.element(document.body).injector();
+        return !injector || injector.get('$http').pendingRequests.length === 0;
+    } catch (e) {
+        return true;
+    }
+}
+return true;
+"""
+
+
+class WaitTimings:
+    """Thread-safe record of how long each kind of wait actually took"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations = {}
+
+    def record(self, name, seconds):
+        with self._lock:
+            self._durations.setdefault(name, []).append(seconds)
+
+    def summary(self):
+        """
+        Summarize recorded waits
+
+        Returns:
+            dict: wait name -> {'count', 'total', 'average', 'max'} in seconds
+        """
+        with self._lock:
+            return {
+                name: {
+                    'count': len(values),
+                    'total': sum(values),
+                    'average': sum(values) / len(values),
+                    'max': max(values),
+                }
+                for name, values in self._durations.items()
+            }
+
+    def format_summary(self):
+        """Return a one-line human readable summary for the status log"""
+        parts = [
+            f"{name} avg {stats['average']:.2f}s (max {stats['max']:.2f}s)"
+            for name, stats in sorted(self.summary().items())
+        ]
+        return ", ".join(parts)
+
+
+class WaitStrategy:
+    """
+    Condition-based waits for the registry SPA.
+
+    Each wait returns as soon as its condition holds instead of sleeping a
+    fixed interval, and its duration is recorded in ``timings``.
+    """
+
+    def __init__(self, driver, timings=None, timeout=10, poll_frequency=0.05, ready_states=('complete',)):
+        """
+        Initialize the wait strategy
+
+        Args:
+            driver: Selenium WebDriver to wait on
+            timings: WaitTimings to record into (a new one is created if omitted)
+            timeout: Default seconds before a wait raises TimeoutException
+            poll_frequency: Seconds between condition checks
+            ready_states: document.readyState values that count as loaded; include
+                'interactive' when the driver uses the eager page load strategy
+        """
+        self.driver = driver
+        self.timings = timings if timings is not None else WaitTimings()
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.ready_states = tuple(ready_states)
+        self._result_selector = None
+
+    def until(self, name, condition, timeout=None):
+        """
+        Wait for a condition and record the time it took
+
+        Args:
+            name: Label the duration is recorded under
+            condition: Callable taking the driver, or a Selenium expected condition
+            timeout: Seconds to wait (defaults to the strategy's timeout)
+
+        Returns:
+            The condition's truthy return value
+        """
+        started = time.perf_counter()
+        try:
+            wait = WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=self.poll_frequency)
+            return wait.until(condition)
+        finally:
+            self.timings.record(name, time.perf_counter() - started)
+
+    def document_ready(self, timeout=None):
+        """Wait for the document to finish loading"""
+        return self.until(
+            'document_ready',
+            lambda d: d.execute_script("return document.readyState") in self.ready_states,
+            timeout
+        )
+
+    def angular_stable(self, timeout=None):
+        """Wait until Angular reports no pending work (no-op on non-Angular pages)"""
+        return self.until('angular_stable', lambda d: d.execute_script(ANGULAR_STABLE_SCRIPT), timeout)
+
+    def install_tracker(self, result_selector):
+        """
+        Install the network/result tracker on the current page
+
+        Call it right before submitting a search: result elements already in
+        the DOM are marked stale and no longer count as a result.
+
+        Args:
+            result_selector: CSS selector matching any result element
+
+        Returns:
+            dict: Current tracker counters, to pass to result_changed()
+        """
+        self._result_selector = result_selector
+        return self.driver.execute_script(TRACKER_SCRIPT, result_selector)
+
+    def network_idle(self, quiet_period=0.1, timeout=None):
+        """Wait until no XHR/fetch has been in flight for ``quiet_period`` seconds"""
+        quiet_ms = int(quiet_period * 1000)
+        script = (
+            "var t = window.__arTracker;"
+            f"return !t || (t.pending === 0 && Date.now() - t.lastActivity >= {quiet_ms});"
+        )
+        return self.until('network_idle', lambda d: d.execute_script(script), timeout)
+
+    def result_changed(self, marker, timeout=None):
+        """
+        Wait until the result region reflects a search submitted after ``marker``
+
+        A new result element was added to the DOM, or a result element not
+        marked stale by install_tracker() is showing. The previous search's
+        panel or cards never count, even once the new request has completed.
+        """
+        script = (
+            "var t = window.__arTracker, m = arguments[0];"
+            "if (!t) { return false; }"
+            "if (t.resultSeq > m.resultSeq) { return true; }"
+            "var found = document.querySelectorAll(arguments[1]);"
+            "for (var i = 0; i < found.length; i++) {"
+            "    if (!found[i].hasAttribute('data-ar-stale')) { return true; }"
+            "}"
+            "return false;"
+        )
+        return self.until(
+            'result_render',
+            lambda d: d.execute_script(script, marker, self._result_selector),
+            timeout
+        )
+
+    def clickable(self, locator, name='clickable', timeout=None):
+        """Wait for an element to be clickable and return it"""
+        return self.until(name, EC.element_to_be_clickable(locator), timeout)
+
+    def present(self, locator, name='present', timeout=None):
+        """Wait for an element to be present in the DOM and return it"""
+        return self.until(name, EC.presence_of_element_located(locator), timeout)
+
+    def gone(self, locator, name='gone', timeout=None):
+        """Wait for an element to be removed or hidden"""
+        return self.until(name, EC.invisibility_of_element_located(locator), timeout)
+
+    def value_settled(self, element, value, name='field_value', timeout=None):
+        """Wait for an input element to hold ``value``"""
+        return self.until(name, lambda d: element.get_attribute('value') == value, timeout)
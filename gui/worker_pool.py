@@ -0,0 +1,150 @@
+import queue
+import threading
+import time
+
+from gui.search_backends import search_outcome
+
+
+class SearchWorkerPool:
+    """
+    Runs registry searches across several search backends.
+
+    Each worker thread owns one search backend (built by ``backend_factory``)
+    and pulls tasks from a shared queue. Results are handed back to the caller
+    strictly in task order, whatever order the workers finish in.
+    """
+
+    def __init__(self, backend_factory, workers, rate_limiter=None, should_stop=None, status_callback=None,
+                 retry_queue=None, metrics=None):
+        """
+        Initialize the worker pool
+
+        Args:
+            backend_factory: Callable returning a new, not yet started SearchBackend
+            workers: Number of concurrent backends
+            rate_limiter: Optional RateLimiter shared by all workers
+            should_stop: Optional callable returning True once processing should stop
+            status_callback: Optional function to call with status messages
+            retry_queue: Optional RetryQueue; transient results are parked there and
+                searched again by whichever worker is free once they are due
+            metrics: Optional RunMetrics that every search is recorded in
+        """
+        self.backend_factory = backend_factory
+        self.workers = max(1, int(workers))
+        self.rate_limiter = rate_limiter
+        self.should_stop = should_stop or (lambda: False)
+        self.status_callback = status_callback
+        self.retry_queue = retry_queue
+        self.metrics = metrics
+
+        self._tasks = queue.Queue()
+        self._results = {}
+        self._condition = threading.Condition()
+        self._alive = 0
+
+    def _log_status(self, message):
+        if self.status_callback:
+            self.status_callback(message)
+        print(message)
+
+    def _worker(self, worker_id):
+        backend = self.backend_factory()
+        try:
+            if not backend.setup():
+                self._log_status(f"Worker {worker_id}: {backend.name} backend failed to start, leaving its share to the other workers")
+                return
+
+            while not self.should_stop():
+                task, attempt = self._next_task()
+                if task is None:
+                    break
+                index, first_name, last_name, gender = task
+
+                if self.rate_limiter and not self.rate_limiter.acquire(self.should_stop):
+                    # Stop requested while waiting; leave the task unprocessed
+                    break
+
+                started = time.perf_counter()
+                result = backend.search(first_name, last_name, gender)
+                elapsed, outcome = time.perf_counter() - started, search_outcome(result)
+                if self.rate_limiter:
+                    self.rate_limiter.record(elapsed, outcome)
+                if self.metrics:
+                    self.metrics.record_search(elapsed, outcome)
+
+                if self.retry_queue is not None and self.retry_queue.defer(task, attempt, result):
+                    continue
+
+                with self._condition:
+                    self._results[index] = result
+                    self._condition.notify_all()
+        except Exception as e:
+            self._log_status(f"Worker {worker_id} stopped unexpectedly: {str(e)}")
+        finally:
+            backend.cleanup()
+            with self._condition:
+                self._alive -= 1
+                self._condition.notify_all()
+
+    def _next_task(self):
+        """
+        Pick the next search for a worker: a due retry first, then a new name
+
+        Returns:
+            (task, attempt) or (None, None) once there is nothing left to search
+        """
+        while True:
+            if self.retry_queue is not None:
+                due = self.retry_queue.pop_ready()
+                if due:
+                    return due
+            try:
+                return self._tasks.get_nowait(), 1
+            except queue.Empty:
+                pass
+            if self.retry_queue is None or not len(self.retry_queue):
+                return None, None
+            if not self.retry_queue.wait(self.should_stop):
+                return None, None
+
+    def run(self, tasks):
+        """
+        Search every task and yield results in task order
+
+        Args:
+            tasks: List of (index, first_name, last_name, gender) tuples
+
+        Yields:
+            (index, result) tuples in the same order as ``tasks``. Iteration ends
+            early if processing is stopped or every worker has exited.
+        """
+        tasks = list(tasks)
+        for task in tasks:
+            self._tasks.put(task)
+
+        worker_count = min(self.workers, len(tasks))
+        self._alive = worker_count
+        threads = []
+        for worker_id in range(1, worker_count + 1):
+            thread = threading.Thread(target=self._worker, args=(worker_id,), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        try:
+            for index, _, _, _ in tasks:
+                with self._condition:
+                    while index not in self._results and self._alive > 0:
+                        self._condition.wait()
+                    if index not in self._results:
+                        break
+                    result = self._results.pop(index)
+                yield index, result
+        finally:
+            # Drain anything still queued so idle workers exit promptly
+            while True:
+                try:
+                    self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+            for thread in threads:
+                thread.join()
@@ -1,20 +1,15 @@
-import pandas as pd
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gui.input_reader import read_names
 
 # Input and output paths
 input_path = os.path.join('docs', 'NEWAdultstotheDatabaseinlastMonth.xlsx')
 output_path = os.path.join('data', 'extracted_names_v1.csv')
 
-# Read the Excel file
-# Assume first row is header, columns B and D are index 1 and 3 (0-based)
-df = pd.read_excel(input_path, engine='openpyxl')
-
-# Extract columns B and D (first and last names)
-first_names = df.iloc[:, 1]
-last_names = df.iloc[:, 3]
-
-# Combine into a new DataFrame
-names_df = pd.DataFrame({'First Name': first_names, 'Last Name': last_names})
+# Read names through the shared input layer (header row and columns auto-detected)
+names_df = read_names(input_path)[['First Name', 'Last Name']]
 
 # Ensure output directory exists
 os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -9,24 +9,21 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import Select
-import openpyxl
 from selenium.common.exceptions import TimeoutException
+import sys
+from itertools import islice
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gui.input_reader import NAME_COLUMNS, iter_names
+from gui.rate_limiter import AdaptiveRateLimiter
+from gui.search_backends import search_outcome
 
 # Input and output paths
 input_path = os.path.join('data', 'extracted_names_v1.csv')
 output_path = os.path.join('data', 'registry_results_headless_v1.csv')
 
-# Read the first two valid rows from the new Excel file
-wb = openpyxl.load_workbook('data/NEWAdultstotheDatabaseinlastMonth.xlsx')
-ws = wb.active
-# Assume headers are in row 3, data starts at row 4
-rows = []
-for i in range(4, 6):  # Rows 4 and 5 (1-indexed)
-    first_name = ws[f'B{i}'].value
-    last_name = ws[f'D{i}'].value
-    gender = ws[f'G{i}'].value.lower() if ws[f'G{i}'].value else 'unknown'
-    if first_name and last_name and gender:
-        rows.append({'First Name': first_name, 'Last Name': last_name, 'Gender': gender})
+# Read the first two valid rows from the new Excel file through the shared input layer
+rows = [dict(zip(NAME_COLUMNS, names)) for names in islice(iter_names('data/NEWAdultstotheDatabaseinlastMonth.xlsx'), 2)]
 names_df = pd.DataFrame(rows)
 
 # Selenium setup with headless configuration
@@ -49,6 +46,8 @@ driver = webdriver.Chrome(service=service, options=chrome_options)
 
 url = 'https://sexoffenderregistry.ar.gov/public/#/'
 results = []
+# Starts at one search every 2 seconds and adapts to how the site responds
+rate_limiter = AdaptiveRateLimiter(rate=0.5)
 
 print("Starting headless registry search...")
 
@@ -58,6 +57,8 @@ for idx, row in names_df.iterrows():
     
     print(f"Processing {idx + 1}: {first} {last}")
     
+    rate_limiter.acquire()
+    started = time.perf_counter()
     driver.get(url)
     try:
         # Wait for page to load
@@ -158,7 +159,7 @@ for idx, row in names_df.iterrows():
         results.append({'First Name': first, 'Last Name': last, 'Gender': gender_value, 'Result': error_msg})
         print(f"  - Error: {str(e)}")
         
-    time.sleep(2)  # Delay between searches
+    rate_limiter.record(time.perf_counter() - started, search_outcome(results[-1]['Result']))
 
 driver.quit()
 
@@ -9,24 +9,21 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import Select
-import openpyxl
 from selenium.common.exceptions import TimeoutException
+import sys
+from itertools import islice
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gui.input_reader import NAME_COLUMNS, iter_names
+from gui.rate_limiter import AdaptiveRateLimiter
+from gui.search_backends import search_outcome
 
 # Input and output paths
 input_path = os.path.join('data', 'extracted_names_v1.csv')
 output_path = os.path.join('data', 'registry_results_v1.csv')
 
-# Read the first two valid rows from the new Excel file
-wb = openpyxl.load_workbook('data/NEWAdultstotheDatabaseinlastMonth.xlsx')
-ws = wb.active
-# Assume headers are in row 3, data starts at row 4
-rows = []
-for i in range(4, 6):  # Rows 4 and 5 (1-indexed)
-    first_name = ws[f'B{i}'].value
-    last_name = ws[f'D{i}'].value
-    gender = ws[f'G{i}'].value.lower() if ws[f'G{i}'].value else 'unknown'
-    if first_name and last_name and gender:
-        rows.append({'First Name': first_name, 'Last Name': last_name, 'Gender': gender})
+# Read the first two valid rows from the new Excel file through the shared input layer
+rows = [dict(zip(NAME_COLUMNS, names)) for names in islice(iter_names('data/NEWAdultstotheDatabaseinlastMonth.xlsx'), 2)]
 names_df = pd.DataFrame(rows)
 
 # Selenium setup
@@ -42,10 +39,14 @@ driver = webdriver.Chrome(service=service, options=chrome_options)
 
 url = 'https://sexoffenderregistry.ar.gov/public/#/'
 results = []
+# Starts at one search every 2 seconds and adapts to how the site responds
+rate_limiter = AdaptiveRateLimiter(rate=0.5)
 
 for idx, row in names_df.iterrows():
     first = str(row['First Name']) if not pd.isna(row['First Name']) else ''
     last = str(row['Last Name']) if not pd.isna(row['Last Name']) else ''
+    rate_limiter.acquire()
+    started = time.perf_counter()
     driver.get(url)
     try:
         # Wait for page to load
@@ -133,7 +134,7 @@ for idx, row in names_df.iterrows():
         results.append({'First Name': first, 'Last Name': last, 'Gender': gender_value, 'Result': result_text})
     except Exception as e:
         results.append({'First Name': first, 'Last Name': last, 'Gender': gender_value, 'Result': f'Error: {str(e)}'})
-    time.sleep(2)  # Delay between searches
+    rate_limiter.record(time.perf_counter() - started, search_outcome(results[-1]['Result']))
 
 driver.quit()
 
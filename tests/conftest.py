@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Run from the repository root without installing the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
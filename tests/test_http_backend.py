@@ -0,0 +1,139 @@
+"""HTTP backend against a local server replaying recorded search responses"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from gui import cli
+from gui.registry_processor import RegistryProcessor
+from gui.result_cache import ResultCache
+from gui.search_backends import NO_RESULTS, UNKNOWN_ERROR, WARNING, HttpSearchBackend, result_matches
+
+RECORDINGS_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_responses.json')
+
+
+class RecordedRegistry:
+    """Serves the recorded response for each searched (first, last) name; 404 for any other"""
+
+    def __init__(self, path=RECORDINGS_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            self.recordings = {(entry['firstName'].lower(), entry['lastName'].lower()): entry
+                               for entry in json.load(f)}
+        self._server = None
+
+    @property
+    def api_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/search"
+
+    def _handler(self):
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+                entry = registry.recordings.get((payload.get('firstName', '').lower(),
+                                                 payload.get('lastName', '').lower()))
+                status, body = (entry['status'], entry['body'].encode('utf-8')) if entry else (404, b'')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def registry():
+    with RecordedRegistry() as registry:
+        yield registry
+
+
+@pytest.fixture
+def backend(registry):
+    backend = HttpSearchBackend(registry.api_url)
+    backend.setup()
+    yield backend
+    backend.cleanup()
+
+
+def test_no_match_is_no_results(backend):
+    assert backend.search('Zed', 'Unlisted', 'male') == NO_RESULTS
+
+
+def test_match_is_a_warning_with_the_registrant(backend):
+    result = backend.search('John', 'Smith', 'male')
+    assert result == WARNING
+    [match] = result_matches(result)
+    assert match['name'] == 'JOHN SMITH'
+    assert (match['age'], match['county']) == ('71', 'Saline')
+    assert match['link'].endswith('/offender/1289800133')
+
+
+@pytest.mark.parametrize('first_name, last_name', [
+    ('Amy', 'Otherschema'),
+    ('Bo', 'Nopage'),
+    ('Cy', 'Norecords'),
+    ('Di', 'Barelist'),
+    ('Ed', 'Htmlpage'),
+])
+def test_bodies_outside_the_schema_are_unknown_errors(backend, first_name, last_name):
+    assert backend.search(first_name, last_name, 'female') == UNKNOWN_ERROR
+
+
+def test_server_error_is_reported(backend):
+    assert backend.search('Flo', 'Servererror', 'female') == 'Error: HTTP 500'
+
+
+def test_last_name_search_reports_a_partial_page(backend):
+    records, complete = backend.search_last_name('Smith')
+    assert [record['lastName'] for record in records] == ['SMITHERS', 'SMITH']
+    assert not complete
+    assert backend.search_last_name('Otherschema') is None
+
+
+def test_unreadable_response_is_never_cached(registry, tmp_path):
+    input_path = tmp_path / 'names.csv'
+    output_path = tmp_path / 'results.csv'
+    cache_path = str(tmp_path / 'cache.sqlite3')
+    pd.DataFrame([('Zed', 'Unlisted', 'male'), ('Amy', 'Otherschema', 'female')],
+                 columns=['First Name', 'Last Name', 'Gender']).to_csv(input_path, index=False)
+    processor = RegistryProcessor(backend='http', api_url=registry.api_url, cache_path=cache_path,
+                                  journal_dir=str(tmp_path / 'journals'), adaptive_rate=False,
+                                  max_attempts=2, retry_delay=0.01)
+    assert processor.process_file(str(input_path), str(output_path))
+
+    output = pd.read_csv(output_path, keep_default_na=False)
+    assert list(output['Result']) == [NO_RESULTS, UNKNOWN_ERROR]
+    cache = ResultCache(cache_path)
+    try:
+        assert cache.get('Zed', 'Unlisted', 'male') == NO_RESULTS
+        assert cache.get('Amy', 'Otherschema', 'female') is None
+    finally:
+        cache.close()
+
+
+def test_api_url_is_required():
+    with pytest.raises(ValueError):
+        HttpSearchBackend('')
+    with pytest.raises(ValueError):
+        RegistryProcessor(backend='http')
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(['names.xlsx', 'results.xlsx', '--backend', 'http'])
+    assert exit_info.value.code == 2
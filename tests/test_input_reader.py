@@ -0,0 +1,48 @@
+"""Header detection and column mapping in the shared input layer"""
+
+import pandas as pd
+
+from gui.input_reader import read_csv_table, read_names, resolve_mapping
+
+
+def write_lines(path, lines):
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def test_csv_with_a_title_line_above_the_header(tmp_path):
+    path = write_lines(tmp_path / 'intake.csv', [
+        'Intake export',
+        '',
+        'Id,First Name,Middle,Last Name,DOB,County,Gender',
+        '1,John,,Smith,,,M',
+        '2,NA,,None,,,F',
+    ])
+    names = read_names(path)
+    assert names[['First Name', 'Last Name', 'Gender']].values.tolist() == [
+        ['John', 'Smith', 'male'],
+        ['NA', 'None', 'female'],
+    ]
+
+
+def test_ragged_csv_is_padded_to_the_widest_line(tmp_path):
+    path = write_lines(tmp_path / 'ragged.csv', ['Title', 'a,b,c', 'd'])
+    table = read_csv_table(path)
+    assert table.shape == (3, 3)
+    assert table.iloc[2].tolist() == ['d', None, None]
+
+
+def test_gender_falls_back_to_the_legacy_column():
+    table = pd.DataFrame([
+        ['First', 'Surname', 'Notes', None, None, None, 'Sex Code'],
+        ['Jane', 'Doe', None, None, None, None, 'F'],
+    ], dtype=object)
+    positions, start_row = resolve_mapping(table)
+    assert positions == {'first_name': 0, 'last_name': 1, 'gender': 6}
+    assert start_row == 1
+
+
+def test_no_gender_column_when_the_legacy_column_is_missing():
+    table = pd.DataFrame([['First Name', 'Last Name'], ['Jane', 'Doe']], dtype=object)
+    positions, _ = resolve_mapping(table)
+    assert positions['gender'] is None
@@ -0,0 +1,125 @@
+"""Resume, dedup and result cache runs of RegistryProcessor against the local registry stand-in"""
+
+import os
+import sqlite3
+import time
+
+import pandas as pd
+import pytest
+
+from benchmarks.mock_registry import MockRegistry
+from gui.registry_processor import RegistryProcessor
+from gui.run_journal import RunJournal
+from gui.search_backends import NO_RESULTS, WARNING
+
+NAMES = [
+    ('Ann', 'Abbott', 'female'),
+    ('John', 'Smith', 'male'),
+    ('Bea', 'Brown', 'female'),
+    ('john', 'SMITH', 'male'),       # same search as row 1
+    ('Cal', 'Carter', 'male'),
+    ('Dee', 'Dixon', 'female'),
+    ('Ann', 'Abbott', 'female'),     # same search as row 0
+    ('Eve', 'Evans', 'female'),
+]
+
+
+@pytest.fixture
+def registry():
+    with MockRegistry(latency=0, jitter=0, hit_rate=0, registrants=[('John', 'Smith')]) as registry:
+        yield registry
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / 'names.csv'
+    pd.DataFrame(NAMES, columns=['First Name', 'Last Name', 'Gender']).to_csv(path, index=False)
+    return str(path)
+
+
+def make_processor(registry, tmp_path, **options):
+    options.setdefault('use_cache', False)
+    return RegistryProcessor(backend='http', api_url=registry.api_url, adaptive_rate=False, retry_delay=0.01,
+                             cache_path=str(tmp_path / 'cache.sqlite3'),
+                             journal_dir=str(tmp_path / 'journals'), **options)
+
+
+def run(processor, input_path, output_path):
+    assert processor.process_file(input_path, str(output_path))
+    return pd.read_csv(output_path, keep_default_na=False)
+
+
+def test_stop_then_resume_writes_every_row_once_in_order(registry, tmp_path, input_path):
+    stopped = make_processor(registry, tmp_path)
+
+    def stop_after_brown(idx, result, source):
+        if idx == 2:
+            stopped.stop_processing()
+
+    stopped.result_callback = stop_after_brown
+    first_output = run(stopped, input_path, tmp_path / 'first.csv')
+    # The repeat of Smith needs no search, so it is still written after the stop
+    assert list(first_output['Last Name']) == ['Abbott', 'Smith', 'Brown', 'SMITH']
+    assert RunJournal(input_path, journal_dir=str(tmp_path / 'journals')).exists()
+
+    searches_before = registry.searches
+    written = []
+    resumed = make_processor(registry, tmp_path, resume=True,
+                             result_callback=lambda idx, result, source: written.append(idx))
+    output = run(resumed, input_path, tmp_path / 'resumed.csv')
+
+    assert written == list(range(len(NAMES)))
+    assert list(zip(output['First Name'], output['Last Name'])) == [(first, last) for first, last, _ in NAMES]
+    assert list(output['Result'][:4]) == list(first_output['Result'])
+    # Only Carter, Dixon and Evans are searched; the repeat of Abbott reuses its journaled result
+    assert registry.searches - searches_before == 3
+    assert list(output['Source']) == ['search', 'search', 'search', 'duplicate',
+                                      'search', 'search', 'duplicate', 'search']
+    assert resumed.run_summary['Rows resumed from journal'] == 4
+    assert not RunJournal(input_path, journal_dir=str(tmp_path / 'journals')).exists()
+
+
+def test_duplicates_share_the_first_rows_result(registry, tmp_path, input_path):
+    processor = make_processor(registry, tmp_path)
+    output = run(processor, input_path, tmp_path / 'results.csv')
+
+    assert registry.searches == 6
+    assert processor.run_summary['Searches saved by dedup'] == 2
+    assert list(output['Source']) == ['search'] * 3 + ['duplicate'] + ['search'] * 2 + ['duplicate', 'search']
+    assert output.loc[3, 'Result'] == output.loc[1, 'Result'] == WARNING
+    assert output.loc[3, 'Matched Registrants'] == output.loc[1, 'Matched Registrants'] != ''
+    assert output.loc[6, 'Result'] == output.loc[0, 'Result'] == NO_RESULTS
+
+
+def test_cached_results_are_reused_until_they_expire(registry, tmp_path, input_path):
+    cache_path = tmp_path / 'cache.sqlite3'
+    run(make_processor(registry, tmp_path, use_cache=True), input_path, tmp_path / 'first.csv')
+    assert registry.searches == 6
+
+    output = run(make_processor(registry, tmp_path, use_cache=True), input_path, tmp_path / 'cached.csv')
+    assert registry.searches == 6
+    assert set(output['Source']) == {'cache'}
+    assert output.loc[1, 'Result'] == WARNING
+    assert output.loc[1, 'Matched Registrants'] != ''
+
+    # Age the Smith entry past the 30-day TTL
+    with sqlite3.connect(cache_path) as conn:
+        conn.execute("UPDATE results SET checked_at = ? WHERE last_name = 'smith'",
+                     (time.time() - 31 * 24 * 60 * 60,))
+    output = run(make_processor(registry, tmp_path, use_cache=True), input_path, tmp_path / 'stale.csv')
+    assert registry.searches == 7
+    assert list(output['Source'][:2]) == ['cache', 'search']
+
+    # A shorter TTL treats every entry as stale
+    run(make_processor(registry, tmp_path, use_cache=True, cache_ttl_days=0), input_path, tmp_path / 'ttl0.csv')
+    assert registry.searches == 13
+
+
+def test_transient_results_are_not_cached(tmp_path, input_path):
+    with MockRegistry(latency=0, jitter=0, failure_rate=1.0) as registry:
+        processor = make_processor(registry, tmp_path, use_cache=True, max_attempts=1)
+        output = run(processor, input_path, tmp_path / 'failed.csv')
+        assert set(output['Result']) == {'Error: HTTP 500'}
+        run(make_processor(registry, tmp_path, use_cache=True, max_attempts=1), input_path, tmp_path / 'again.csv')
+        assert registry.searches == 12
+    assert os.path.exists(tmp_path / 'cache.sqlite3')
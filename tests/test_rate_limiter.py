@@ -0,0 +1,65 @@
+"""AIMD rate changes and timeout backoff of the adaptive rate limiter"""
+
+import time
+
+import pytest
+
+from gui.rate_limiter import AdaptiveRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A monotonic clock that only moves when the test advances it"""
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_fast_ok_raises_the_rate_by_increase(clock):
+    limiter = AdaptiveRateLimiter(rate=1.0, increase=0.25)
+    limiter.record(0.1, 'ok')
+    limiter.record(0.1, 'ok')
+    assert limiter.current_rate == pytest.approx(1.5)
+
+
+def test_error_multiplies_the_rate_by_decrease(clock):
+    limiter = AdaptiveRateLimiter(rate=2.0, decrease=0.5)
+    limiter.record(0.1, 'error')
+    assert limiter.current_rate == pytest.approx(1.0)
+    limiter.record(0.1, 'error')
+    assert limiter.current_rate == pytest.approx(0.5)
+
+
+def test_slow_ok_counts_as_a_slowdown(clock):
+    limiter = AdaptiveRateLimiter(rate=1.0, increase=0.1, decrease=0.5, slow_factor=2.0)
+    limiter.record(0.1, 'ok')
+    limiter.record(0.5, 'ok')
+    assert limiter.current_rate == pytest.approx(0.55)
+
+
+def test_rate_stays_between_min_and_max(clock):
+    limiter = AdaptiveRateLimiter(rate=1.0, max_rate=1.2, min_rate=0.4, increase=0.5, decrease=0.1)
+    limiter.record(0.1, 'ok')
+    assert limiter.current_rate == pytest.approx(1.2)
+    limiter.record(0.1, 'error')
+    assert limiter.current_rate == pytest.approx(0.4)
+
+
+def test_timeout_backoff_doubles_up_to_backoff_max(clock):
+    limiter = AdaptiveRateLimiter(rate=100.0, min_rate=100.0, backoff_base=2.0, backoff_max=10.0)
+    pauses = []
+    for _ in range(5):
+        limiter.record(15.0, 'timeout')
+        pauses.append(limiter.try_acquire())
+        clock[0] += pauses[-1]
+    assert pauses == [2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+def test_success_resets_the_backoff(clock):
+    limiter = AdaptiveRateLimiter(rate=100.0, min_rate=100.0, backoff_base=2.0)
+    limiter.record(15.0, 'timeout')
+    limiter.record(15.0, 'timeout')
+    clock[0] += limiter.try_acquire()
+    limiter.record(0.1, 'ok')
+    limiter.record(15.0, 'timeout')
+    assert limiter.try_acquire() == 2.0
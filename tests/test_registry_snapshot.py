@@ -0,0 +1,52 @@
+"""Pre-screening lookups against a registrant snapshot"""
+
+import random
+import string
+import time
+
+from gui.registry_snapshot import RegistrySnapshot
+
+
+def random_names(count, seed=0):
+    rng = random.Random(seed)
+
+    def word():
+        return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+    return [(word(), word()) for _ in range(count)]
+
+
+def test_prefix_matches_agree_with_a_full_scan():
+    pairs = random_names(2000) + [('', 'Li'), ('Ng', 'Ng'), ("O'Neil", 'O')]
+    snapshot = RegistrySnapshot(pairs)
+    registrants = [(first.lower().replace("'", ''), last.lower()) for first, last in pairs]
+    rng = random.Random(1)
+    for _ in range(2000):
+        first, last = rng.choice(pairs)
+        if rng.random() < 0.5:
+            first, last = first[:rng.randint(0, len(first))], last[:rng.randint(1, len(last))]
+        else:
+            first, last = rng.choice(string.ascii_lowercase) * 2, rng.choice(string.ascii_lowercase)
+        expected = any(known_last.startswith(last.lower())
+                       and (not known_first or known_first.startswith(first.lower().replace("'", '')))
+                       for known_first, known_last in registrants)
+        assert snapshot.is_candidate(first, last) == expected, (first, last)
+
+
+def test_short_surnames():
+    snapshot = RegistrySnapshot([('Wei', 'Li'), ('', 'Ng'), ('Mary', 'Oliver')])
+    assert snapshot.is_candidate('Wei', 'Li')
+    assert snapshot.is_candidate('W', 'L')
+    assert not snapshot.is_candidate('Ann', 'Li')
+    assert snapshot.is_candidate('Anyone', 'Ng')     # listed without a first name
+    assert snapshot.is_candidate('Mary', 'O')
+    assert not snapshot.is_candidate('Sean', 'O')
+
+
+def test_lookups_do_not_scan_every_matching_last_name():
+    snapshot = RegistrySnapshot(random_names(20000))
+    started = time.perf_counter()
+    for _ in range(10000):
+        snapshot.is_candidate('Zzzzzz', 'A')
+    # One bisect each; scanning the ~800 last names starting with 'a' took seconds
+    assert time.perf_counter() - started < 0.5
@@ -0,0 +1,58 @@
+"""Retry decisions and scheduling of the retry queue"""
+
+import time
+
+import pytest
+
+from gui.retry_queue import RetryQueue
+from gui.search_backends import NO_RESULTS, TIMEOUT, WARNING
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A monotonic clock that only moves when the test advances it"""
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_should_retry_stops_at_max_attempts():
+    retries = RetryQueue(max_attempts=3)
+    assert retries.should_retry(TIMEOUT, 1)
+    assert retries.should_retry('Error: HTTP 500', 2)
+    assert not retries.should_retry(TIMEOUT, 3)
+    assert (retries.retried, retries.exhausted) == (2, 1)
+
+
+def test_definitive_results_are_never_retried():
+    retries = RetryQueue(max_attempts=3)
+    assert not retries.should_retry(NO_RESULTS, 1)
+    assert not retries.should_retry(WARNING, 1)
+    assert (retries.retried, retries.exhausted) == (0, 0)
+
+
+def test_pop_ready_waits_for_the_delay(clock):
+    retries = RetryQueue(base_delay=5.0, jitter=0)
+    task = (0, 'Ann', 'Abbott', 'female')
+    assert retries.defer(task, 1, TIMEOUT)
+    assert retries.pop_ready() is None
+    clock[0] += 4.99
+    assert retries.pop_ready() is None
+    clock[0] += 0.01
+    assert retries.pop_ready() == (task, 2)
+    assert len(retries) == 0
+
+
+def test_delay_doubles_up_to_max_delay():
+    retries = RetryQueue(base_delay=5.0, max_delay=12.0, jitter=0)
+    assert [retries.delay(attempt) for attempt in (1, 2, 3)] == [5.0, 10.0, 12.0]
+
+
+def test_due_tasks_come_out_earliest_first(clock):
+    retries = RetryQueue(base_delay=5.0, jitter=0)
+    later, sooner = (0, 'Ann', 'Abbott', 'female'), (1, 'Bea', 'Brown', 'female')
+    retries.defer(later, 2, TIMEOUT)
+    retries.defer(sooner, 1, TIMEOUT)
+    clock[0] += 10.0
+    assert retries.pop_ready() == (sooner, 2)
+    assert retries.pop_ready() == (later, 3)
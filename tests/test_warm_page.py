@@ -0,0 +1,37 @@
+"""Warm page searches in Chrome against the local registry stand-in"""
+
+import shutil
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from benchmarks.mock_registry import MockRegistry
+from gui.registry_processor import RegistryProcessor
+from gui.search_backends import NO_RESULTS, WARNING
+
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+
+@pytest.fixture
+def processor():
+    if not any(shutil.which(name) for name in CHROME_BINARIES):
+        pytest.skip("Chrome is not installed")
+    # The old panel stays on the page until the next response is rendered,
+    # well after the search request itself has completed
+    with MockRegistry(latency=0.05, jitter=0.0, hit_rate=0.0, registrants=[('John', 'Smith')],
+                      keep_results=True, render_delay=0.3, seed=0) as registry:
+        processor = RegistryProcessor(registry_url=registry.registry_url, use_cache=False)
+        if not processor.setup_driver():
+            pytest.skip("Chrome could not be started")
+        try:
+            yield processor
+        finally:
+            processor.cleanup()
+
+
+def test_previous_result_is_not_read_for_the_next_name(processor):
+    names = [('John', 'Smith', 'male'), ('Zed', 'Unlisted', 'male'),
+             ('John', 'Smith', 'male'), ('Amy', 'Nobody', 'female'), ('Bo', 'Nobody', 'male')]
+    results = [processor.search_single_name(*name) for name in names]
+    assert results == [WARNING, NO_RESULTS, WARNING, NO_RESULTS, NO_RESULTS]